@@ -0,0 +1,72 @@
+"""Benchmark: operations and reductions, interpreted or on whole arrays."""
+
+import timeit
+
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica.sementic import SymbolTableBuilder
+from gibica.interpreter import Interpreter
+
+SETUP = """
+    let a = [1.5; {size}];
+    let b = [2.0; {size}];
+"""
+
+# Elements computed one by one, in an interpreted loop
+LOOP = """
+    let mut x = 0.0;
+    let mut i = 0;
+    while i < {size} {
+        x = a[i] * b[i] + 1.0;
+        i = i + 1;
+    }
+"""
+
+# Elements computed by native loops on the storage of the arrays
+VECTOR = """
+    let x = a * b + 1.0;
+"""
+
+# Dot product reduced in an interpreted loop
+LOOP_DOT = """
+    let mut x = 0.0;
+    let mut i = 0;
+    while i < {size} {
+        x = x + a[i] * b[i];
+        i = i + 1;
+    }
+"""
+
+# Dot product reduced by a built-in function, given the whole arrays
+BUILTIN_DOT = """
+    let x = dot(a, b);
+"""
+
+PROGRAMS = (
+    ('loop', LOOP),
+    ('vector', VECTOR),
+    ('loop dot', LOOP_DOT),
+    ('dot', BUILTIN_DOT),
+)
+
+SIZES = (1000, 100000)
+
+
+def main(repeat=5):
+    """Run the benchmark."""
+    for size in SIZES:
+        for name, program in PROGRAMS:
+            raw = (SETUP + program).replace('{size}', str(size))
+            tree = Parser(Lexer(raw)).parse()
+            SymbolTableBuilder(tree).build()
+
+            best = min(
+                timeit.repeat(
+                    lambda: Interpreter(tree).interpret(), number=1, repeat=repeat
+                )
+            )
+            print(f"{size:>7} elements, {name:>8}: {best * 1e3:.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
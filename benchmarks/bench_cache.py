@@ -0,0 +1,38 @@
+"""Benchmark: cold against warm startup of the CLI with the AST cache."""
+
+import os
+import sys
+import subprocess
+import tempfile
+import time
+
+from sources import blocks
+
+
+def run(filepath, options):
+    """Run the script with the CLI in a subprocess, return its wall time."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, '-m', 'gibica.entrypoint', filepath] + options, check=True
+    )
+    return time.perf_counter() - start
+
+
+def main(size=1_000_000, repeat=3):
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, 'script.gbc')
+        with open(filepath, 'w') as file:
+            file.writelines(blocks(size))
+
+        for name, options in (
+            ('no cache', ['--no-cache']),
+            ('cold', ['--refresh-cache']),
+            ('warm', []),
+        ):
+            best = min(run(filepath, options) for _ in range(repeat))
+            print(f"{name:>16}: {best:.3f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark: calls of functions in a wide global namespace."""
+
+import timeit
+
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica.sementic import SymbolTableBuilder
+from gibica.interpreter import Interpreter
+
+PROGRAM = """
+    def add(a, b) {
+        return a + b;
+    }
+    let mut i = 0;
+    let mut total = 0;
+    while i < 2000 {
+        total = add(total, i);
+        i = i + 1;
+    }
+"""
+
+# Numbers of functions declared besides the one which is called
+WIDTHS = (0, 100, 1000)
+
+
+def program(width):
+    """Return the program with `width` more functions declared."""
+    functions = ''.join(f'def unused{n}() {{ return {n}; }}\n' for n in range(width))
+    return functions + PROGRAM
+
+
+def main(repeat=5):
+    """Run the benchmark."""
+    for width in WIDTHS:
+        tree = Parser(Lexer(program(width))).parse()
+        SymbolTableBuilder(tree).build()
+
+        best = min(
+            timeit.repeat(
+                lambda: Interpreter(tree).interpret(), number=1, repeat=repeat
+            )
+        )
+        print(f"{width:>5} functions: {best * 1e3:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
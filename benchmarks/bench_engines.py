@@ -0,0 +1,59 @@
+"""Benchmark: engines evaluating the examples."""
+
+import io
+import os
+import timeit
+import contextlib
+
+from functools import partial
+
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica.sementic import SymbolTableBuilder
+from gibica.interpreter import Interpreter
+from gibica.closure import ClosureInterpreter
+from gibica.vm import VirtualMachine
+from gibica.transpiler import PythonInterpreter
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), os.pardir, 'examples')
+
+ENGINES = (
+    ('interpreter', Interpreter),
+    ('memoized', partial(Interpreter, memo_size=128)),
+    ('closure', ClosureInterpreter),
+    ('vm', VirtualMachine),
+    ('python', PythonInterpreter),
+)
+
+
+def analyse(filepath):
+    """Return the analysed AST of a script."""
+    with open(filepath) as file:
+        tree = Parser(Lexer(file.read())).parse()
+    SymbolTableBuilder(tree).build()
+    return tree
+
+
+def evaluate(engine, tree):
+    """Evaluate an AST with an engine, discarding its output."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine(tree).interpret()
+
+
+def main(repeat=3):
+    """Run the benchmark."""
+    for example in sorted(os.listdir(EXAMPLES)):
+        tree = analyse(os.path.join(EXAMPLES, example))
+        print(example)
+
+        reference = None
+        for name, engine in ENGINES:
+            best = min(
+                timeit.repeat(lambda: evaluate(engine, tree), number=1, repeat=repeat)
+            )
+            reference = reference or best
+            print(f"{name:>16}: {best:.3f}s (x{reference / best:.1f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Benchmark: one-line edits re-parsed incrementally against full parses."""
+
+import timeit
+
+from sources import generate
+
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica.incremental import IncrementalParser
+
+
+def main(size=1_000_000, repeat=3, edits=20):
+    """Run the benchmark."""
+    raw = generate(size)
+    offsets = [
+        raw.index('b = -b;', index * len(raw) // edits) for index in range(edits)
+    ]
+
+    def full():
+        for offset in offsets:
+            Parser(Lexer(raw[:offset] + 'b = b;' + raw[offset + 7 :])).parse()
+
+    parser = IncrementalParser(raw)
+
+    def incremental():
+        # Each edit is undone by the next one, the raw input stays the same size
+        for offset in offsets:
+            parser.edit(offset, 7, 'b = b;')
+            parser.edit(offset, 6, 'b = -b;')
+
+    for name, function, count in (
+        ('full', full, edits),
+        ('incremental', incremental, 2 * edits),
+    ):
+        best = min(timeit.repeat(function, number=1, repeat=repeat))
+        print(f"{name:>16}: {best / count * 1e3:.3f}ms per edit")
+
+
+if __name__ == '__main__':
+    main()
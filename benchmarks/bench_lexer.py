@@ -0,0 +1,37 @@
+"""Benchmark: lexing throughput of `Lexer` against the character-at-a-time lexer."""
+
+import os
+import sys
+import timeit
+
+from sources import generate
+
+from gibica.lexer import Lexer
+from gibica.tokens import Nature
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, 'tests'))
+from test_lexer import CharacterLexer  # noqa: E402
+
+
+def lex(lexer_class, raw):
+    """Consume all the tokens of the raw input."""
+    lexer = lexer_class(raw)
+    while lexer.next_token().nature != Nature.EOF:
+        pass
+
+
+def main(size=1_000_000, repeat=3):
+    """Run the benchmark."""
+    raw = generate(size)
+    for lexer_class in (CharacterLexer, Lexer):
+        best = min(
+            timeit.repeat(lambda: lex(lexer_class, raw), number=1, repeat=repeat)
+        )
+        print(
+            f"{lexer_class.__name__:>16}: {best:.3f}s "
+            f"({len(raw) / best / 1e6:.2f} MB/s)"
+        )
+
+
+if __name__ == '__main__':
+    main()
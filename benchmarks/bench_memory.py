@@ -0,0 +1,73 @@
+"""Benchmark: memory and allocation of the values."""
+
+import timeit
+import tracemalloc
+
+from gibica.types import Int, Float, Bool
+from gibica.exceptions import ObjectError
+
+# Number of values kept alive to measure their size
+COUNT = 100000
+
+
+class DictValue(object):
+    """Value with an instance dictionary, fetching its attributes in `__getattr__`."""
+
+    def __init__(self, value):
+        """Initialization of `DictValue` class."""
+        self.value = value
+
+    def __getattr__(self, name):
+        """Handle methods and attributes fetching."""
+        try:
+            return self.__getattribute__(name)
+        except AttributeError:
+            raise ObjectError("Unsupported method.")
+
+
+def size(cls, value):
+    """Return the number of bytes allocated by a live value of a class."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        values = [cls(value) for _ in range(COUNT)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    # The list holds a pointer per value
+    del values
+    return (after - before) / COUNT - 8
+
+
+def missing(obj):
+    """Fetch a missing attribute of an object."""
+    try:
+        obj.missing
+    except ObjectError:
+        pass
+
+
+def main(repeat=5):
+    """Run the benchmark."""
+    for name, cls, value in (
+        ('instance dict', DictValue, 1),
+        ('Int', Int, 1),
+        ('Float', Float, 1.5),
+        ('Bool', Bool, True),
+    ):
+        allocation = min(
+            timeit.repeat(lambda: cls(value), number=COUNT, repeat=repeat)
+        )
+        fetching = min(
+            timeit.repeat(lambda: missing(cls(value)), number=COUNT, repeat=repeat)
+        )
+        print(
+            f"{name:>14}: {size(cls, value):.0f} bytes, "
+            f"{COUNT / allocation / 1e6:.2f}M allocations/s, "
+            f"{(fetching - allocation) / COUNT * 1e9:.0f}ns per missing attribute"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark: time and peak RSS of lexing a script read, streamed or memory-mapped."""
+
+import os
+import sys
+import subprocess
+import tempfile
+import time
+
+from sources import blocks
+
+LEX = """
+import sys
+from mmap import mmap, ACCESS_READ
+from gibica.lexer import Lexer
+from gibica.tokens import Nature
+
+with open(sys.argv[2], 'rb' if sys.argv[1] == 'mmap' else 'r') as file:
+    if sys.argv[1] == 'read':
+        raw = file.read()
+    elif sys.argv[1] == 'mmap':
+        raw = mmap(file.fileno(), 0, access=ACCESS_READ)
+    else:
+        raw = file
+    lexer = Lexer(raw)
+    while lexer.next_token().nature != Nature.EOF:
+        pass
+"""
+
+
+def run(mode, filepath):
+    """Lex the script in a subprocess, return its wall time and peak RSS (in MB)."""
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-c', LEX, mode, filepath])
+    _, _, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - start
+
+    # `ru_maxrss` is in kilobytes on Linux
+    return elapsed, usage.ru_maxrss / 1024
+
+
+def main(size=10_000_000, repeat=3):
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, 'script.gbc')
+        # Written block by block to keep the RSS inherited by the subprocesses low
+        with open(filepath, 'w') as file:
+            file.writelines(blocks(size))
+
+        for mode in ('read', 'stream', 'mmap'):
+            results = [run(mode, filepath) for _ in range(repeat)]
+            elapsed = min(result[0] for result in results)
+            rss = min(result[1] for result in results)
+            print(f"{mode:>6}: {elapsed:.3f}s, {rss:.1f} MB peak RSS")
+
+
+if __name__ == '__main__':
+    main()
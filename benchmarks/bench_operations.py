@@ -0,0 +1,129 @@
+"""Benchmark: evaluation of arithmetic and comparison heavy programs."""
+
+import timeit
+
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica.sementic import SymbolTableBuilder
+from gibica.optimizer import Optimizer
+from gibica.interpreter import Interpreter, BINARY_OPERATORS, truth
+from gibica.tokens import Nature
+
+PROGRAMS = {
+    'arithmetic': """
+        let mut i = 0;
+        let mut total = 0.0;
+        while i < 5000 {
+            total = total + i * 2 - i // 3 + (i + 1) / 4 * -1;
+            i = i + 1;
+        }
+    """,
+    'comparison': """
+        let mut i = 0;
+        let mut count = 0;
+        while i < 5000 {
+            if i > 10 and i != 20 or i == 3 and not (i >= 4) {
+                count = count + 1;
+            }
+            if i <= 100 or i < 200 {
+                count = count + 2;
+            }
+            i = i + 1;
+        }
+    """,
+    'constants': """
+        let mut i = 0;
+        let mut total = 0.0;
+        while i < 5000 {
+            total = total * 1 + 2 * 3 + 1 - 60 / 4 * 1.5 + -(2 // 3);
+            i = i + (4 - 3);
+        }
+    """,
+}
+
+
+# Operators of the ladder, bound to names instead of looked up in a table
+ADD, SUB, MUL, DIV, INT_DIV, EQ, NE, LE, GE, LT, GT = (
+    BINARY_OPERATORS[nature]
+    for nature in (
+        Nature.PLUS,
+        Nature.MINUS,
+        Nature.MUL,
+        Nature.DIV,
+        Nature.INT_DIV,
+        Nature.EQ,
+        Nature.NE,
+        Nature.LE,
+        Nature.GE,
+        Nature.LT,
+        Nature.GT,
+    )
+)
+
+
+class LadderInterpreter(Interpreter):
+    """Interpreter comparing the nature of the operators on each evaluation."""
+
+    def visit_BinaryOperation(self, node):
+        """Visitor for `BinaryOperation` AST node."""
+        if node.op.nature == Nature.PLUS:
+            return ADD(self.visit(node.left), self.visit(node.right))
+        elif node.op.nature == Nature.MINUS:
+            return SUB(self.visit(node.left), self.visit(node.right))
+        elif node.op.nature == Nature.MUL:
+            return MUL(self.visit(node.left), self.visit(node.right))
+        elif node.op.nature == Nature.DIV:
+            return DIV(self.visit(node.left), self.visit(node.right))
+        elif node.op.nature == Nature.INT_DIV:
+            return INT_DIV(self.visit(node.left), self.visit(node.right))
+        elif node.op.nature == Nature.EQ:
+            return EQ(self.visit(node.left), self.visit(node.right))
+        elif node.op.nature == Nature.NE:
+            return NE(self.visit(node.left), self.visit(node.right))
+        elif node.op.nature == Nature.LE:
+            return LE(self.visit(node.left), self.visit(node.right))
+        elif node.op.nature == Nature.GE:
+            return GE(self.visit(node.left), self.visit(node.right))
+        elif node.op.nature == Nature.LT:
+            return LT(self.visit(node.left), self.visit(node.right))
+        elif node.op.nature == Nature.GT:
+            return GT(self.visit(node.left), self.visit(node.right))
+        elif node.op.nature == Nature.OR:
+            left = self.visit(node.left)
+            return left if truth(left) else self.visit(node.right)
+        elif node.op.nature == Nature.AND:
+            left = self.visit(node.left)
+            return self.visit(node.right) if truth(left) else left
+
+    def visit_UnaryOperation(self, node):
+        """Visitor for `UnaryOperation` AST node."""
+        if node.op.nature == Nature.PLUS:
+            return +self.visit(node.right)
+        elif node.op.nature == Nature.MINUS:
+            return -self.visit(node.right)
+        elif node.op.nature == Nature.NOT:
+            return not truth(self.visit(node.right))
+
+
+def main(repeat=5):
+    """Run the benchmark."""
+    for name, program in PROGRAMS.items():
+        tree = Parser(Lexer(program)).parse()
+        SymbolTableBuilder(tree).build()
+        print(name)
+
+        optimized = Optimizer(Parser(Lexer(program)).parse()).optimize()
+
+        for engine_name, engine, ast in (
+            ('if/elif ladder', LadderInterpreter, tree),
+            ('dispatch table', Interpreter, tree),
+            ('optimized AST', Interpreter, optimized),
+        ):
+            best = min(
+                timeit.repeat(lambda: engine(ast).interpret(), number=1, repeat=repeat)
+            )
+            print(f"{engine_name:>16}: {best * 1e3:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
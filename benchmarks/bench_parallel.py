@@ -0,0 +1,30 @@
+"""Benchmark: parse time of a sequential parse against parallel parses."""
+
+import os
+import timeit
+
+from sources import generate
+
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica.parallel import parse
+
+
+def main(size=4_000_000, repeat=3):
+    """Run the benchmark."""
+    raw = generate(size)
+
+    best = min(
+        timeit.repeat(lambda: Parser(Lexer(raw)).parse(), number=1, repeat=repeat)
+    )
+    print(f"{'sequential':>16}: {best:.3f}s")
+
+    jobs = 2
+    while jobs <= max(os.cpu_count() or 1, 2):
+        best = min(timeit.repeat(lambda: parse(raw, jobs), number=1, repeat=repeat))
+        print(f"{f'{jobs} processes':>16}: {best:.3f}s")
+        jobs *= 2
+
+
+if __name__ == '__main__':
+    main()
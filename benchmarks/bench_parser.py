@@ -0,0 +1,43 @@
+"""Benchmark: precedence climbing parser against the recursive-descent chain."""
+
+import os
+import sys
+import timeit
+
+from gibica.parser import Parser
+from gibica.incremental import IncrementalParser, TokenStream
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, 'tests'))
+from test_parser import RecursiveDescentParser  # noqa: E402
+
+EXPRESSIONS = {
+    'operators': (
+        'let x_{index} = (a + {index}) * 2 - b // 3 <= c / 1.5 and not d '
+        'or -e == f(g, h * i + j) != k < l - m;\n'
+    ),
+    'literals': 'f({index}, 1, 2.5, true, a, b, c, -1, 2, 3, 4, 5, 6, 7, 8, 9);\n',
+}
+
+
+def main(statements=10_000, repeat=5):
+    """Run the benchmark."""
+    for name, expression in EXPRESSIONS.items():
+        raw = ''.join(expression.format(index=index) for index in range(statements))
+
+        # The tokens are lexed beforehand, only the parsers are timed
+        lexed = IncrementalParser(raw)
+        for parser_class in (RecursiveDescentParser, Parser):
+            best = min(
+                timeit.repeat(
+                    lambda: parser_class(
+                        TokenStream(lexed.tokens, lexed.starts, lexed.tree.lines)
+                    ).parse(),
+                    number=1,
+                    repeat=repeat,
+                )
+            )
+            print(f"{name:>10} {parser_class.__name__:>22}: {best:.3f}s")
+
+
+if __name__ == '__main__':
+    main()
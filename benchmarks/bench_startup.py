@@ -0,0 +1,64 @@
+"""Benchmark: startup time and import time of the `gibica` command."""
+
+import os
+import re
+import sys
+import shutil
+import subprocess
+import tempfile
+import time
+
+CLICK = 'from gibica.entrypoint import main; main()'
+LAUNCHER = 'from gibica.launcher import launch; launch()'
+
+# Line of the `-X importtime` report: self and cumulative times in microseconds
+IMPORT_TIME_PATTERN = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)')
+
+
+def run(command, arguments):
+    """Run the command in a subprocess, return its wall time and import time."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', command] + arguments,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    # Cumulative times of the top-level imports, in seconds
+    imported = sum(
+        int(match.group(2))
+        for match in IMPORT_TIME_PATTERN.finditer(result.stderr)
+        if not match.group(3)
+    )
+    return elapsed, imported / 1e6
+
+
+def main(repeat=10):
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, 'script.gbc')
+        with open(filepath, 'w') as file:
+            file.write('let a = 1; print(a);')
+
+        for name, command, arguments, is_cold in (
+            ('click, cold', CLICK, ['--refresh-cache'], True),
+            ('click, warm', CLICK, [], False),
+            ('launcher, cold', LAUNCHER, [], True),
+            ('launcher, warm', LAUNCHER, [], False),
+        ):
+            results = []
+            for _ in range(repeat):
+                if is_cold:
+                    shutil.rmtree(os.path.join(directory, '__gbccache__'), True)
+                results.append(run(command, [filepath] + arguments))
+
+            elapsed = min(result[0] for result in results)
+            imported = min(result[1] for result in results)
+            print(f"{name:>16}: {elapsed * 1e3:.1f}ms (imports {imported * 1e3:.1f}ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark: evaluation of variable heavy loops."""
+
+import timeit
+
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica.sementic import SymbolTableBuilder
+from gibica.interpreter import Interpreter
+
+PROGRAMS = {
+    'counters': """
+        let mut i = 0;
+        let mut a = 0;
+        let mut b = 1;
+        let mut c = 2;
+        while i < 5000 {
+            a = b;
+            b = c;
+            c = a + b - c + i;
+            i = i + 1;
+        }
+    """,
+    'blocks': """
+        let mut i = 0;
+        let mut total = 0;
+        while i < 5000 {
+            let x = i;
+            let y = x + 1;
+            if y > x {
+                let z = y - x;
+                total = total + z;
+            }
+            i = i + 1;
+        }
+    """,
+}
+
+
+class NamedInterpreter(Interpreter):
+    """Interpreter looking the variables up by name in the scopes of the memory."""
+
+    def visit_Assignment(self, node):
+        """Visitor for `Assignment` AST node."""
+        self.memory[node.left.identifier.name] = self.visit(node.right)
+
+    def visit_Compound(self, node):
+        """Visitor for `Compound` AST node."""
+        self.memory.append_scope()
+        for child in node.children:
+            self.visit(child)
+        self.memory.pop_scope()
+
+    def visit_Identifier(self, node):
+        """Visitor for `Identifier` AST node."""
+        return self.memory[node.name]
+
+
+def main(repeat=5):
+    """Run the benchmark."""
+    for name, program in PROGRAMS.items():
+        tree = Parser(Lexer(program)).parse()
+        SymbolTableBuilder(tree).build()
+        print(name)
+
+        for engine_name, engine in (
+            ('named lookups', NamedInterpreter),
+            ('resolved slots', Interpreter),
+        ):
+            best = min(
+                timeit.repeat(lambda: engine(tree).interpret(), number=1, repeat=repeat)
+            )
+            print(f"{engine_name:>16}: {best * 1e3:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
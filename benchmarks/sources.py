@@ -0,0 +1,37 @@
+"""Generated Gibica programs used by the benchmarks."""
+
+STATEMENTS = """\
+# Block {index}
+def function_{index}(a, mut b) {{
+    let mut i = 0;
+    while i < {index} {{
+        if a == b and not (i >= 10) {{
+            b = b + a * 2 - i // 3;
+        }} else if b != 0 {{
+            b = b / 1.5;
+        }} else {{
+            b = -b;
+        }}
+        i = i + 1;
+    }}
+    return b;
+}}
+
+let mut value_{index} = {index};
+value_{index} = value_{index} + 3.25 * (value_{index} - 1) <= 42;
+"""
+
+
+def blocks(size):
+    """Yield the blocks of a syntactically valid program of about `size` characters."""
+    length = index = 0
+    while length < size:
+        block = STATEMENTS.format(index=index)
+        yield block
+        length += len(block)
+        index += 1
+
+
+def generate(size):
+    """Return a syntactically valid program of about `size` characters."""
+    return ''.join(blocks(size))
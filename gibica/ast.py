@@ -1,5 +1,11 @@
 """AST module."""
 
+import gc
+
+from contextlib import contextmanager
+
+from gibica.tokens import Token
+
 
 class NodeVisitor(object):
     """AST post-order traversal strategy."""
@@ -17,20 +23,28 @@ class NodeVisitor(object):
 class AST(object):
     """Parent class of all AST classes."""
 
-    pass
+    # Offset of the node in the raw input, set by the parser
+    offset = None
 
 
 class Program(AST):
     """Program AST representation."""
 
+    # Names of the variables of the frame, by slot, set by the resolver (None before)
+    names = None
+
     def __init__(self):
         """Initialization of `Program` class."""
         self.children = []
+        self.lines = None
 
 
 class FunctionDeclaration(AST):
     """Function declaration AST representation."""
 
+    # Names of the variables of the frame, by slot, set by the resolver
+    names = ()
+
     def __init__(self, identifier, parameters, body):
         """Initialization of `FunctionDeclaration` class."""
         self.identifier = identifier
@@ -142,6 +156,9 @@ class WhileStatement(AST):
 class Compound(AST):
     """Compound AST representation."""
 
+    # Slots of the variables declared in the block, set by the resolver
+    declared = ()
+
     def __init__(self):
         """Initialization of `Compound` class."""
         self.children = []
@@ -177,6 +194,9 @@ class ReturnStatement(AST):
 class Identifier(AST):
     """Identifier AST representation."""
 
+    # Slot of the variable in the frame, or None for a function, set by the resolver
+    slot = None
+
     def __init__(self, name):
         """Initialization of `Identifier` class."""
         self.name = name
@@ -215,3 +235,68 @@ class Boolean(AST):
         """Initialization of `Boolean` class."""
         self.token = token
         self.value = token.value
+
+
+class ArrayLiteral(AST):
+    """Array literal AST representation, of its elements or of `size` copies."""
+
+    def __init__(self, elements, size=None):
+        """Initialization of `ArrayLiteral` class."""
+        self.elements = elements
+        self.size = size
+
+
+class Subscript(AST):
+    """Subscript AST representation, the indexing of an element of an array."""
+
+    def __init__(self, value, index):
+        """Initialization of `Subscript` class."""
+        self.value = value
+        self.index = index
+
+
+class Constant(AST):
+    """Constant AST representation, a literal or an expression folded beforehand."""
+
+    def __init__(self, cls, value):
+        """Initialization of `Constant` class."""
+        self.cls = cls
+        self.value = value
+
+
+def walk(node):
+    """Yield a node and all its descendant nodes, in no particular order."""
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, AST):
+            yield value
+            stack.extend(vars(value).values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+
+
+def dump(node):
+    """Return a comparable representation of a node and its descendants."""
+    if isinstance(node, AST):
+        fields = sorted(vars(node).items())
+        return (type(node).__name__, node.offset) + tuple(
+            (key, dump(value)) for key, value in fields if key != 'lines'
+        )
+    elif isinstance(node, (list, tuple)):
+        return tuple(dump(value) for value in node)
+    elif isinstance(node, Token):
+        return (node.nature, node.value)
+    return node
+
+
+@contextmanager
+def collection_paused():
+    """Pause the cyclic garbage collector while building large acyclic trees."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
@@ -1,6 +1,97 @@
 """Built-in functions module."""
 
+import operator
+
+from functools import wraps
+
+from gibica.types import Array
+from gibica.exceptions import TypeError
+
+
+#
+# Calling Conventions
+#
+
+
+def storage(obj):
+    """Return the storage of the numbers of an array."""
+    if not isinstance(obj, Array):
+        raise TypeError('Unsupported operation.')
+    return obj.value
+
+
+def batched(function):
+    """Return a built-in function taking the storage of its array arguments.
+
+    The whole storage is given at once, so `function` runs native loops over the
+    numbers, and its result is only converted into a Gibica object once.
+    """
+
+    @wraps(function)
+    def wrapper(*args):
+        return function(*[storage(arg) for arg in args])
+
+    return wrapper
+
+
+def nonempty(values):
+    """Return the numbers of an array, raising a `TypeError` if there is none."""
+    if not values:
+        raise TypeError('Empty array.')
+    return values
+
+
+#
+# Functions
+#
+
 
 def _print(*args):
     """Print an object in the stdout."""
     return print(*args)
+
+
+@batched
+def _len(values):
+    """Return the number of elements of an array."""
+    return len(values)
+
+
+@batched
+def _sum(values):
+    """Return the sum of the elements of an array."""
+    return sum(values)
+
+
+@batched
+def _min(values):
+    """Return the smallest element of an array."""
+    return min(nonempty(values))
+
+
+@batched
+def _max(values):
+    """Return the largest element of an array."""
+    return max(nonempty(values))
+
+
+@batched
+def _mean(values):
+    """Return the arithmetic mean of the elements of an array."""
+    return sum(nonempty(values)) / len(values)
+
+
+@batched
+def _dot(left, right):
+    """Return the dot product of two arrays."""
+    if len(left) != len(right):
+        raise TypeError('Mismatch between array lengths.')
+    return sum(map(operator.mul, left, right))
+
+
+# Built-in functions, by the name of their Python function without its underscore
+FUNCTIONS: dict = {
+    name[1:]: function
+    for name, function in sorted(globals().items())
+    if name.startswith('_') and not name.startswith('__')
+}
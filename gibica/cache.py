@@ -0,0 +1,118 @@
+"""Cache module."""
+
+import io
+import os
+import pickle
+import hashlib
+
+from gibica import __version__
+from gibica.ast import Program, collection_paused
+
+
+#
+# AST Cache
+#
+
+# Header of the cache files, followed by their key
+MAGIC = b'GBCC'
+
+# Version of the cache files, to bump on any incompatible change of the AST classes
+FORMAT = 2
+
+CACHE_DIRECTORY = '__gbccache__'
+CACHE_EXTENSION = '.gbcc'
+
+# Modules of the only classes an AST is made of
+MODULES = ('gibica.ast', 'gibica.tokens', 'gibica.types')
+
+
+def dumps(tree):
+    """Serialize an analysed AST, without the line index of its raw input."""
+    lines, tree.lines = tree.lines, None
+    try:
+        with collection_paused():
+            return pickle.dumps(tree, pickle.HIGHEST_PROTOCOL)
+    finally:
+        tree.lines = lines
+
+
+class Unpickler(pickle.Unpickler):
+    """Unpickler only creating the classes of an AST.
+
+    A cache file can be written by anyone, so no other object, like a function, is
+    allowed to be called by its data.
+    """
+
+    def find_class(self, module, name):
+        """Return a class of the AST modules, refusing any other object."""
+        if module in MODULES and '.' not in name:
+            cls = super().find_class(module, name)
+            if isinstance(cls, type) and cls.__module__ == module:
+                return cls
+        raise pickle.UnpicklingError(f"Forbidden object `{module}.{name}`.")
+
+
+def loads(data):
+    """Deserialize an analysed AST, raising a `pickle.UnpicklingError` if it isn't."""
+    with collection_paused():
+        tree = Unpickler(io.BytesIO(data)).load()
+    if not isinstance(tree, Program):
+        raise pickle.UnpicklingError('Not an AST.')
+    return tree
+
+
+def digest(filepath):
+    """Return the hash of the interpreter version and of the content of a file."""
+    sha = hashlib.sha256(f"{__version__}:{FORMAT}:".encode())
+    with open(filepath, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 16), b''):
+            sha.update(chunk)
+    return sha.digest()
+
+
+class Cache(object):
+    """Cache of the analysed AST of a script, keyed by its content.
+
+    The cache file is stored in a `__gbccache__` directory next to the script, or in
+    `directory`. It is only valid for the same content and interpreter version.
+    """
+
+    def __init__(self, filepath, directory=None):
+        """Initialization of `Cache` class."""
+        if directory is None:
+            directory = os.path.join(os.path.dirname(filepath), CACHE_DIRECTORY)
+
+        name, _ = os.path.splitext(os.path.basename(filepath))
+        self.path = os.path.join(directory, name + CACHE_EXTENSION)
+        self.header = MAGIC + digest(filepath)
+
+    def load(self):
+        """Return the cached AST, or None if there is no valid one."""
+        try:
+            with open(self.path, 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        if not data.startswith(self.header):
+            return None
+
+        try:
+            return loads(data[len(self.header) :])
+        except Exception:
+            # Truncated, forged, or written by an incompatible version of the AST
+            return None
+
+    def store(self, tree):
+        """Cache an AST, unless the cache directory isn't writable."""
+        data = self.header + dumps(tree)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+            # Written aside then renamed, so a concurrent run never reads half a file
+            temporary = f"{self.path}.{os.getpid()}"
+            with open(temporary, 'wb') as file:
+                file.write(data)
+            os.replace(temporary, self.path)
+        except OSError:
+            pass
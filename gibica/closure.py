@@ -0,0 +1,378 @@
+"""Closure module."""
+
+from gibica import builtins
+from gibica.tokens import Nature
+from gibica.ast import (
+    NodeVisitor,
+    AST,
+    FunctionDeclaration,
+    IfStatement,
+    WhileStatement,
+    Compound,
+    ReturnStatement,
+)
+from gibica.types import bind_type, NoneType, Int, Float, Bool, Array, Function
+from gibica.memory import Memory
+from gibica.resolver import Layout
+from gibica.exceptions import InterpreterError
+
+
+#
+# Closure Compilation
+#
+
+# Factories of the closures evaluating the binary operations
+BINARY_OPERATIONS: dict = {
+    Nature.PLUS: lambda left, right: lambda frame: left(frame) + right(frame),
+    Nature.MINUS: lambda left, right: lambda frame: left(frame) - right(frame),
+    Nature.MUL: lambda left, right: lambda frame: left(frame) * right(frame),
+    Nature.DIV: lambda left, right: lambda frame: left(frame) / right(frame),
+    Nature.INT_DIV: lambda left, right: lambda frame: left(frame) // right(frame),
+    Nature.EQ: lambda left, right: lambda frame: left(frame) == right(frame),
+    Nature.NE: lambda left, right: lambda frame: left(frame) != right(frame),
+    Nature.LE: lambda left, right: lambda frame: left(frame) <= right(frame),
+    Nature.GE: lambda left, right: lambda frame: left(frame) >= right(frame),
+    Nature.LT: lambda left, right: lambda frame: left(frame) < right(frame),
+    Nature.GT: lambda left, right: lambda frame: left(frame) > right(frame),
+    Nature.OR: lambda left, right: lambda frame: left(frame) or right(frame),
+    Nature.AND: lambda left, right: lambda frame: left(frame) and right(frame),
+}
+
+# Factories of the closures evaluating the unary operations
+UNARY_OPERATIONS: dict = {
+    Nature.PLUS: lambda right: lambda frame: +right(frame),
+    Nature.MINUS: lambda right: lambda frame: -right(frame),
+    Nature.NOT: lambda right: lambda frame: Bool(not right(frame)),
+}
+
+# Result of a return statement whose value is an unset variable, which the function
+# returns as `None`, whereas statements without return give `None` to their block
+UNSET = object()
+
+
+class CompiledFunction(object):
+    """Function declared by the program, compiled on its first call."""
+
+    def __init__(self, compiler, node):
+        """Initialization of `CompiledFunction` class."""
+        self.compiler = compiler
+        self.node = node
+        self.padding = []
+        self.body = self.compile
+
+    def compile(self, frame):
+        """Compile the function, then run the call which needed it."""
+        parameters = self.node.parameters
+        names = [parameter.variable.identifier.name for parameter in parameters]
+        layout = Layout(names)
+        self.body = self.compiler.compile(self.node.body, layout)
+        self.padding = [None] * (len(layout) - len(names))
+
+        frame.extend(self.padding)
+        return self.body(frame)
+
+
+class ClosureCompiler(NodeVisitor):
+    """Compilation of an AST into a tree of closures.
+
+    The AST is visited once: each node gives a closure with its operator and its
+    children closures already bound. The closures take the frame of the function
+    being run, a list of the values of its variables. Variables are resolved to the
+    slots of this list, and functions to the objects of the function table.
+    """
+
+    def __init__(self, functions):
+        """Initialization of `ClosureCompiler` class."""
+        self.functions = functions
+        self.compiled = {
+            name: CompiledFunction(self, function._node)
+            for name, function in functions.items()
+            if isinstance(function._node, AST)
+        }
+        self.layout = None
+        self.declared = None
+
+    def compile(self, node, layout):
+        """Compile a node whose variables are in the frame described by `layout`."""
+        self.layout, layout = layout, self.layout
+        try:
+            return self.visit(node)
+        finally:
+            self.layout = layout
+
+    def statements(self, children):
+        """Compile the statements of a block, ignoring the value of expressions."""
+        closures = []
+        for child in children:
+            closure = self.visit(child)
+            if not isinstance(child, STATEMENT_NODES):
+                closure = self.expression_statement(closure)
+            closures.append(closure)
+        return closures
+
+    def expression_statement(self, expression):
+        """Return the closure of a statement evaluating an expression."""
+
+        def statement(frame):
+            expression(frame)
+
+        return statement
+
+    def visit_Program(self, node):
+        """Visitor for `Program` AST node."""
+        statements = self.statements(
+            child
+            for child in node.children
+            if not isinstance(child, FunctionDeclaration)
+        )
+
+        def program(frame):
+            for statement in statements:
+                statement(frame)
+
+        return program
+
+    def visit_FunctionDeclaration(self, node):
+        """Visitor for `FunctionDeclaration` AST node."""
+
+        def declaration(frame):
+            raise InterpreterError('Nested function declarations are not supported.')
+
+        return declaration
+
+    def visit_FunctionBody(self, node):
+        """Visitor for `FunctionBody` AST node."""
+        statements = self.statements(node.children)
+
+        def body(frame):
+            for statement in statements:
+                result = statement(frame)
+                if result is not None:
+                    return None if result is UNSET else result
+            return NoneType()
+
+        return body
+
+    def visit_FunctionCall(self, node):
+        """Visitor for `FunctionCall` AST node."""
+        name = node.identifier.name
+        arguments = [self.visit(parameter.variable) for parameter in node.parameters]
+
+        if name in self.layout.slots or name not in self.functions:
+            # Function passed in a variable, resolved at each call
+            index = self.layout[name]
+            compiled = self.compiled
+
+            def call(frame):
+                function = frame[index]
+                if function is None:
+                    raise InterpreterError(f"Function `{name}` not declared.")
+
+                args = [argument(frame) for argument in arguments]
+                if not isinstance(function._node, AST):
+                    return bind_type(function._node(*args))
+
+                callee = compiled[function.name]
+                args.extend(callee.padding)
+                return callee.body(args)
+
+        elif name in self.compiled:
+            function = self.compiled[name]
+
+            def call(frame):
+                callee = [argument(frame) for argument in arguments]
+                callee.extend(function.padding)
+                return function.body(callee)
+
+        else:
+            builtin = self.functions[name]._node
+
+            def call(frame):
+                return bind_type(builtin(*[argument(frame) for argument in arguments]))
+
+        return call
+
+    def visit_VariableDeclaration(self, node):
+        """Visitor for `VariableDeclaration` AST node."""
+        if self.declared is not None:
+            self.declared.append(self.layout[node.assignment.left.identifier.name])
+        return self.visit(node.assignment)
+
+    def visit_Assignment(self, node):
+        """Visitor for `Assignment` AST node."""
+        index = self.layout[node.left.identifier.name]
+        right = self.visit(node.right)
+
+        def assignment(frame):
+            frame[index] = right(frame)
+
+        return assignment
+
+    def visit_Variable(self, node):
+        """Visitor for `Variable` AST node."""
+        return self.visit(node.identifier)
+
+    def visit_IfStatement(self, node):
+        """Visitor for `IfStatement` AST node."""
+        compounds = [node.if_compound] + list(node.else_if_compounds)
+        branches = [
+            (self.visit(condition), self.visit(body)) for condition, body in compounds
+        ]
+        otherwise = None
+        if node.else_compound is not None:
+            otherwise = self.visit(node.else_compound[1])
+
+        def if_statement(frame):
+            for condition, body in branches:
+                if condition(frame):
+                    return body(frame)
+            if otherwise is not None:
+                return otherwise(frame)
+
+        return if_statement
+
+    def visit_WhileStatement(self, node):
+        """Visitor for `WhileStatement` AST node."""
+        condition = self.visit(node.condition)
+        compound = self.visit(node.compound)
+
+        def while_statement(frame):
+            while condition(frame):
+                result = compound(frame)
+                if result is not None:
+                    return result
+
+        return while_statement
+
+    def visit_Compound(self, node):
+        """Visitor for `Compound` AST node."""
+        self.declared, declared = [], self.declared
+        try:
+            statements = self.statements(node.children)
+            local_slots = self.declared
+        finally:
+            self.declared = declared
+
+        def compound(frame):
+            for statement in statements:
+                result = statement(frame)
+                if result is not None:
+                    return result
+
+            # The variables declared in the block are released at its end
+            for index in local_slots:
+                frame[index] = None
+
+        return compound
+
+    def visit_ReturnStatement(self, node):
+        """Visitor for `ReturnStatement` AST node."""
+        expression = self.visit(node.expression)
+
+        def return_statement(frame):
+            result = expression(frame)
+            return UNSET if result is None else result
+
+        return return_statement
+
+    def visit_BinaryOperation(self, node):
+        """Visitor for `BinaryOperation` AST node."""
+        return BINARY_OPERATIONS[node.op.nature](
+            self.visit(node.left), self.visit(node.right)
+        )
+
+    def visit_UnaryOperation(self, node):
+        """Visitor for `UnaryOperation` AST node."""
+        return UNARY_OPERATIONS[node.op.nature](self.visit(node.right))
+
+    def visit_Identifier(self, node):
+        """Visitor for `Identifier` AST node."""
+        function = self.functions.get(node.name)
+        if function is not None and node.name not in self.layout.slots:
+            return lambda frame: function
+
+        index = self.layout[node.name]
+        return lambda frame: frame[index]
+
+    def visit_Integer(self, node):
+        """Visitor for `Integer` AST node."""
+        obj = Int(node.value)
+        return lambda frame: obj
+
+    def visit_FloatingPoint(self, node):
+        """Visitor for `FloatingPoint` AST node."""
+        obj = Float(node.value)
+        return lambda frame: obj
+
+    def visit_Boolean(self, node):
+        """Visitor for `Boolean` AST node."""
+        obj = Bool(node.value == 'true')
+        return lambda frame: obj
+
+    def visit_Constant(self, node):
+        """Visitor for `Constant` AST node."""
+        obj = node.cls(node.value)
+        return lambda frame: obj
+
+    def visit_ArrayLiteral(self, node):
+        """Visitor for `ArrayLiteral` AST node."""
+        elements = [self.visit(element) for element in node.elements]
+        if node.size is not None:
+            element, size = elements[0], self.visit(node.size)
+            return lambda frame: Array.filled(element(frame), size(frame))
+        return lambda frame: Array([element(frame) for element in elements])
+
+    def visit_Subscript(self, node):
+        """Visitor for `Subscript` AST node."""
+        value, index = self.visit(node.value), self.visit(node.index)
+        return lambda frame: value(frame)[index(frame)]
+
+
+# Nodes whose closures return the value of a `return` statement, or None
+STATEMENT_NODES = (
+    FunctionDeclaration,
+    IfStatement,
+    WhileStatement,
+    Compound,
+    ReturnStatement,
+)
+
+
+class ClosureInterpreter(object):
+    """Evaluation of the parsed input, compiled into closures beforehand.
+
+    A drop-in replacement of `Interpreter`: the global memory is rebuilt from the
+    global frame once the program has run.
+    """
+
+    def __init__(self, tree):
+        """Initialization of `ClosureInterpreter` class."""
+        self.tree = tree
+        self.memory = Memory()
+
+    def load_functions(self):
+        """Return the built-in and declared functions, by name."""
+        functions = {}
+        for function_name, function in builtins.FUNCTIONS.items():
+            functions[function_name] = Function(function_name, function)
+
+        for child in self.tree.children:
+            if isinstance(child, FunctionDeclaration):
+                function_name = child.identifier.name
+                functions[function_name] = Function(function_name, child)
+        return functions
+
+    def interpret(self):
+        """Generic entrypoint of `ClosureInterpreter` class."""
+        functions = self.load_functions()
+        layout = Layout()
+        program = ClosureCompiler(functions).compile(self.tree, layout)
+
+        frame = [None] * len(layout)
+        program(frame)
+
+        for name, function in functions.items():
+            self.memory[name] = function
+        for name, index in layout.slots.items():
+            if frame[index] is not None:
+                self.memory[name] = frame[index]
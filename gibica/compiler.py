@@ -0,0 +1,440 @@
+"""Compiler module."""
+
+from gibica import builtins
+from gibica.tokens import Nature
+from gibica.ast import (
+    NodeVisitor,
+    FunctionDeclaration,
+    FunctionCall,
+    VariableDeclaration,
+    Assignment,
+    IfStatement,
+    WhileStatement,
+    Compound,
+    ReturnStatement,
+)
+from gibica.types import value_key, Int, Float, Bool, Function
+from gibica.exceptions import InterpreterError
+
+
+#
+# Instructions
+#
+
+# Opcodes of the instructions, each one is followed by its argument in the bytecode
+OPCODES = (
+    'POP_TOP',
+    'LOAD_CONST',
+    'LOAD_FUNCTION',
+    'LOAD_NONE',
+    'LOAD_FAST',
+    'STORE_FAST',
+    'CLEAR_FAST',
+    'BINARY_ADD',
+    'BINARY_SUBTRACT',
+    'BINARY_MULTIPLY',
+    'BINARY_TRUE_DIVIDE',
+    'BINARY_FLOOR_DIVIDE',
+    'COMPARE_EQ',
+    'COMPARE_NE',
+    'COMPARE_LE',
+    'COMPARE_GE',
+    'COMPARE_LT',
+    'COMPARE_GT',
+    'UNARY_POSITIVE',
+    'UNARY_NEGATIVE',
+    'UNARY_NOT',
+    'BUILD_ARRAY',
+    'FILL_ARRAY',
+    'BINARY_SUBSCRIPT',
+    'JUMP',
+    'POP_JUMP_IF_FALSE',
+    'JUMP_IF_TRUE_OR_POP',
+    'JUMP_IF_FALSE_OR_POP',
+    'CALL_FUNCTION',
+    'TAIL_CALL',
+    'RETURN_VALUE',
+)
+
+(
+    POP_TOP,
+    LOAD_CONST,
+    LOAD_FUNCTION,
+    LOAD_NONE,
+    LOAD_FAST,
+    STORE_FAST,
+    CLEAR_FAST,
+    BINARY_ADD,
+    BINARY_SUBTRACT,
+    BINARY_MULTIPLY,
+    BINARY_TRUE_DIVIDE,
+    BINARY_FLOOR_DIVIDE,
+    COMPARE_EQ,
+    COMPARE_NE,
+    COMPARE_LE,
+    COMPARE_GE,
+    COMPARE_LT,
+    COMPARE_GT,
+    UNARY_POSITIVE,
+    UNARY_NEGATIVE,
+    UNARY_NOT,
+    BUILD_ARRAY,
+    FILL_ARRAY,
+    BINARY_SUBSCRIPT,
+    JUMP,
+    POP_JUMP_IF_FALSE,
+    JUMP_IF_TRUE_OR_POP,
+    JUMP_IF_FALSE_OR_POP,
+    CALL_FUNCTION,
+    TAIL_CALL,
+    RETURN_VALUE,
+) = range(len(OPCODES))
+
+# Instructions of the binary and unary operators
+BINARY_INSTRUCTIONS: dict = {
+    Nature.PLUS: BINARY_ADD,
+    Nature.MINUS: BINARY_SUBTRACT,
+    Nature.MUL: BINARY_MULTIPLY,
+    Nature.DIV: BINARY_TRUE_DIVIDE,
+    Nature.INT_DIV: BINARY_FLOOR_DIVIDE,
+    Nature.EQ: COMPARE_EQ,
+    Nature.NE: COMPARE_NE,
+    Nature.LE: COMPARE_LE,
+    Nature.GE: COMPARE_GE,
+    Nature.LT: COMPARE_LT,
+    Nature.GT: COMPARE_GT,
+}
+
+UNARY_INSTRUCTIONS: dict = {
+    Nature.PLUS: UNARY_POSITIVE,
+    Nature.MINUS: UNARY_NEGATIVE,
+    Nature.NOT: UNARY_NOT,
+}
+
+# Instructions whose argument is an offset in the bytecode
+JUMP_INSTRUCTIONS = (JUMP, POP_JUMP_IF_FALSE, JUMP_IF_TRUE_OR_POP, JUMP_IF_FALSE_OR_POP)
+
+# Instructions whose argument is an index in the constants pool or in the slots
+CONSTANT_INSTRUCTIONS = (LOAD_CONST, LOAD_FUNCTION)
+SLOT_INSTRUCTIONS = (LOAD_FAST, STORE_FAST, CLEAR_FAST)
+
+
+class Code(object):
+    """Bytecode of a function, or of the program.
+
+    The bytecode is a flat list of opcodes, each one followed by its argument. The
+    constants pool holds the literals and the functions, and the variables are
+    stored in `names` slots, the parameters first.
+    """
+
+    def __init__(self, name, arity=0):
+        """Initialization of `Code` class."""
+        self.name = name
+        self.arity = arity
+        self.bytecode = []
+        self.constants = []
+        self.names = []
+
+    def __str__(self):
+        """String representation of a code."""
+        return f'<code {self.name}>'
+
+    def __repr__(self):
+        """String representation of the class."""
+        return self.__str__()  # pragma: no cover
+
+
+#
+# Bytecode Compilation
+#
+
+
+class Compiler(NodeVisitor):
+    """Compilation of an AST into the bytecode of the program and of its functions.
+
+    Each function is compiled into its own `Code`, by name in `codes`. Variables are
+    resolved to slots of their function, and the names of the declared and built-in
+    functions, unless shadowed by a variable, to functions of the constants pool.
+    """
+
+    def __init__(self, tree):
+        """Initialization of `Compiler` class."""
+        self.tree = tree
+        self.functions = {}
+        self.codes = {}
+        self.code = None
+        self.slots = None
+        self.indices = None
+        self.declared = None
+        self.exits = None
+
+    def load_functions(self):
+        """Load the built-in and declared functions."""
+        for function_name, function in builtins.FUNCTIONS.items():
+            self.functions[function_name] = Function(function_name, function)
+
+        for child in self.tree.children:
+            if isinstance(child, FunctionDeclaration):
+                function_name = child.identifier.name
+                self.functions[function_name] = Function(function_name, child)
+
+    def emit(self, opcode, argument=0):
+        """Append an instruction to the bytecode, return its offset."""
+        self.code.bytecode.extend((opcode, argument))
+        return len(self.code.bytecode) - 2
+
+    def patch(self, offset, target=None):
+        """Set the target of a jump to `target`, or to the end of the bytecode."""
+        if target is None:
+            target = len(self.code.bytecode)
+        self.code.bytecode[offset + 1] = target
+
+    def constant(self, value):
+        """Return the index of a value in the constants pool, adding it if needed."""
+        # Functions are the same constant by identity, the other values by value
+        if isinstance(value, Function):
+            key = id(value)
+        else:
+            key = value_key(value)
+
+        index = self.indices.get(key)
+        if index is None:
+            index = self.indices[key] = len(self.code.constants)
+            self.code.constants.append(value)
+        return index
+
+    def slot(self, name):
+        """Return the slot of a variable, allocated on its first appearance."""
+        index = self.slots.get(name)
+        if index is None:
+            index = self.slots[name] = len(self.code.names)
+            self.code.names.append(name)
+        return index
+
+    def block(self, children):
+        """Compile the statements of a block, dropping the value of expressions."""
+        for child in children:
+            self.visit(child)
+            if not isinstance(child, STATEMENT_NODES):
+                self.emit(POP_TOP)
+
+    def compile(self):
+        """Generic entrypoint of `Compiler` class, return the code of the program."""
+        self.load_functions()
+        for name, function in self.functions.items():
+            if isinstance(function._node, FunctionDeclaration):
+                self.visit(function._node)
+        return self.visit(self.tree)
+
+    def visit_Program(self, node):
+        """Visitor for `Program` AST node."""
+        self.code, self.slots, self.indices = Code('<program>'), {}, {}
+        for child in node.children:
+            if isinstance(child, FunctionDeclaration):
+                continue
+
+            # A `return` out of a function only leaves its top-level statement
+            self.exits = []
+            self.block([child])
+            for offset in self.exits:
+                self.patch(offset)
+        self.exits = None
+
+        self.emit(LOAD_NONE)
+        self.emit(RETURN_VALUE)
+        return self.code
+
+    def visit_FunctionDeclaration(self, node):
+        """Visitor for `FunctionDeclaration` AST node."""
+        if self.code is not None:
+            raise InterpreterError('Nested function declarations are not supported.')
+
+        name = node.identifier.name
+        self.code = self.codes[name] = Code(name, len(node.parameters))
+        self.slots, self.indices = {}, {}
+        for parameter in node.parameters:
+            self.slot(parameter.variable.identifier.name)
+
+        self.visit(node.body)
+        self.code = self.slots = self.indices = None
+
+    def visit_FunctionBody(self, node):
+        """Visitor for `FunctionBody` AST node."""
+        self.block(node.children)
+        self.emit(LOAD_NONE)
+        self.emit(RETURN_VALUE)
+
+    def visit_FunctionCall(self, node, opcode=CALL_FUNCTION):
+        """Visitor for `FunctionCall` AST node."""
+        self.visit(node.identifier)
+        for parameter in node.parameters:
+            self.visit(parameter.variable)
+        self.emit(opcode, len(node.parameters))
+
+    def visit_VariableDeclaration(self, node):
+        """Visitor for `VariableDeclaration` AST node."""
+        if self.declared is not None:
+            self.declared.append(self.slot(node.assignment.left.identifier.name))
+        self.visit(node.assignment)
+
+    def visit_Assignment(self, node):
+        """Visitor for `Assignment` AST node."""
+        index = self.slot(node.left.identifier.name)
+        self.visit(node.right)
+        self.emit(STORE_FAST, index)
+
+    def visit_Variable(self, node):
+        """Visitor for `Variable` AST node."""
+        self.visit(node.identifier)
+
+    def visit_IfStatement(self, node):
+        """Visitor for `IfStatement` AST node."""
+        ends = []
+        for condition, body in [node.if_compound] + list(node.else_if_compounds):
+            self.visit(condition)
+            branch = self.emit(POP_JUMP_IF_FALSE)
+            self.visit(body)
+            ends.append(self.emit(JUMP))
+            self.patch(branch)
+
+        if node.else_compound is not None:
+            self.visit(node.else_compound[1])
+        for offset in ends:
+            self.patch(offset)
+
+    def visit_WhileStatement(self, node):
+        """Visitor for `WhileStatement` AST node."""
+        start = len(self.code.bytecode)
+        self.visit(node.condition)
+        end = self.emit(POP_JUMP_IF_FALSE)
+        self.visit(node.compound)
+        self.emit(JUMP, start)
+        self.patch(end)
+
+    def visit_Compound(self, node):
+        """Visitor for `Compound` AST node."""
+        self.declared, declared = [], self.declared
+        try:
+            self.block(node.children)
+            local_slots = self.declared
+        finally:
+            self.declared = declared
+
+        # The variables declared in the block are released at its end
+        for index in local_slots:
+            self.emit(CLEAR_FAST, index)
+
+    def visit_ReturnStatement(self, node):
+        """Visitor for `ReturnStatement` AST node."""
+        if self.exits is None and isinstance(node.expression, FunctionCall):
+            # The frame of a call in tail position is reused by the callee
+            self.visit_FunctionCall(node.expression, TAIL_CALL)
+            self.emit(RETURN_VALUE)
+            return
+
+        self.visit(node.expression)
+        if self.exits is None:
+            self.emit(RETURN_VALUE)
+        else:
+            self.emit(POP_TOP)
+            self.exits.append(self.emit(JUMP))
+
+    def visit_BinaryOperation(self, node):
+        """Visitor for `BinaryOperation` AST node."""
+        self.visit(node.left)
+        if node.op.nature in (Nature.OR, Nature.AND):
+            opcode = JUMP_IF_TRUE_OR_POP
+            if node.op.nature == Nature.AND:
+                opcode = JUMP_IF_FALSE_OR_POP
+
+            end = self.emit(opcode)
+            self.visit(node.right)
+            self.patch(end)
+            return
+
+        self.visit(node.right)
+        self.emit(BINARY_INSTRUCTIONS[node.op.nature])
+
+    def visit_UnaryOperation(self, node):
+        """Visitor for `UnaryOperation` AST node."""
+        self.visit(node.right)
+        self.emit(UNARY_INSTRUCTIONS[node.op.nature])
+
+    def visit_Identifier(self, node):
+        """Visitor for `Identifier` AST node."""
+        function = self.functions.get(node.name)
+        if function is not None and node.name not in self.slots:
+            self.emit(LOAD_FUNCTION, self.constant(function))
+        else:
+            self.emit(LOAD_FAST, self.slot(node.name))
+
+    def visit_Integer(self, node):
+        """Visitor for `Integer` AST node."""
+        self.emit(LOAD_CONST, self.constant(Int(node.value)))
+
+    def visit_FloatingPoint(self, node):
+        """Visitor for `FloatingPoint` AST node."""
+        self.emit(LOAD_CONST, self.constant(Float(node.value)))
+
+    def visit_Boolean(self, node):
+        """Visitor for `Boolean` AST node."""
+        self.emit(LOAD_CONST, self.constant(Bool(node.value == 'true')))
+
+    def visit_Constant(self, node):
+        """Visitor for `Constant` AST node."""
+        self.emit(LOAD_CONST, self.constant(node.cls(node.value)))
+
+    def visit_ArrayLiteral(self, node):
+        """Visitor for `ArrayLiteral` AST node."""
+        for element in node.elements:
+            self.visit(element)
+        if node.size is not None:
+            self.visit(node.size)
+            self.emit(FILL_ARRAY)
+        else:
+            self.emit(BUILD_ARRAY, len(node.elements))
+
+    def visit_Subscript(self, node):
+        """Visitor for `Subscript` AST node."""
+        self.visit(node.value)
+        self.visit(node.index)
+        self.emit(BINARY_SUBSCRIPT)
+
+
+# Nodes compiled into statements, which leave nothing on the stack
+STATEMENT_NODES = (
+    FunctionDeclaration,
+    VariableDeclaration,
+    Assignment,
+    IfStatement,
+    WhileStatement,
+    Compound,
+    ReturnStatement,
+)
+
+
+#
+# Disassembly
+#
+
+
+def disassemble(code):
+    """Return a human readable listing of the bytecode of a code."""
+    lines = [f'{code}:']
+    bytecode = code.bytecode
+    for offset in range(0, len(bytecode), 2):
+        opcode, argument = bytecode[offset], bytecode[offset + 1]
+
+        if opcode in CONSTANT_INSTRUCTIONS:
+            description = f'{argument} ({code.constants[argument]})'
+        elif opcode in SLOT_INSTRUCTIONS:
+            description = f'{argument} ({code.names[argument]})'
+        elif opcode in JUMP_INSTRUCTIONS:
+            description = f'{argument}'
+        elif opcode in (CALL_FUNCTION, TAIL_CALL, BUILD_ARRAY):
+            description = f'{argument}'
+        else:
+            description = ''
+
+        lines.append(f'{offset:>6} {OPCODES[opcode]:<20} {description}'.rstrip())
+    return '\n'.join(lines)
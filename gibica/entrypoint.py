@@ -2,10 +2,7 @@
 
 import click
 
-from gibica.lexer import Lexer
-from gibica.parser import Parser
-from gibica.sementic import SymbolTableBuilder
-from gibica.interpreter import Interpreter
+from gibica.runner import run, ENGINES
 
 
 #
@@ -16,42 +13,78 @@ from gibica.interpreter import Interpreter
 @click.command()
 @click.argument('filepath')
 @click.option('--debug', 'in_debug_mode', is_flag=True, help='Run in debug mode.')
-def main(filepath, in_debug_mode):
+@click.option(
+    '--mmap', 'in_mmap_mode', is_flag=True, help='Map the script file in memory.'
+)
+@click.option(
+    '--jobs',
+    type=click.IntRange(min=0),
+    default=1,
+    help='Number of processes parsing the script, 0 for one per CPU.',
+)
+@click.option(
+    '--cache/--no-cache',
+    'in_cache_mode',
+    default=True,
+    help='Reuse the analysed script of a previous run (enabled by default).',
+)
+@click.option(
+    '--cache-dir',
+    type=click.Path(file_okay=False),
+    help='Directory of the cache files, `__gbccache__` next to the script by default.',
+)
+@click.option(
+    '--refresh-cache',
+    'in_refresh_mode',
+    is_flag=True,
+    help='Analyse the script again and replace its cache file.',
+)
+@click.option(
+    '--engine',
+    'engine_name',
+    type=click.Choice(list(ENGINES)),
+    default='interpreter',
+    help='Engine evaluating the program, the tree-walking interpreter by default.',
+)
+@click.option(
+    '--memoize',
+    'in_memo_mode',
+    is_flag=True,
+    help='Cache the results of the pure functions (interpreter engine only).',
+)
+@click.option(
+    '--memo-size',
+    type=click.IntRange(min=1),
+    default=128,
+    help='Number of results cached per function with `--memoize`.',
+)
+def main(
+    filepath,
+    in_debug_mode,
+    in_mmap_mode,
+    jobs,
+    in_cache_mode,
+    cache_dir,
+    in_refresh_mode,
+    engine_name,
+    in_memo_mode,
+    memo_size,
+):
     """Gibica Interpreter."""
-
-    with open(filepath) as file:
-
-        try:
-
-            # Lexical analysis
-            lexer = Lexer(file.read())
-
-            # Syntax analysis
-            parser = Parser(lexer)
-            tree = parser.parse()
-
-            # Sementic analysis
-            symtab_builder = SymbolTableBuilder(tree)
-            symtab_builder.build()
-
-            # Program evaluation
-            interpreter = Interpreter(tree)
-            interpreter.interpret()
-
-            # Display internal variables if debug option is enabled
-            if in_debug_mode:
-                print(f"SYMBOL TABLE: {symtab_builder.table}")
-                print(f"GLOBAL MEMORY: {interpreter.memory}")
-
-        except Exception as gibica_exception:
-
-            # Display the full trace if debug option is enabled
-            if in_debug_mode:
-                raise
-
-            # In classic mode, just display the interpreter trace
-            else:
-                print(f"{gibica_exception.__class__.__name__}: {gibica_exception}")
+    if in_memo_mode and engine_name != 'interpreter':
+        raise click.UsageError('--memoize is only supported by the interpreter engine.')
+
+    run(
+        filepath,
+        in_debug_mode,
+        in_mmap_mode,
+        jobs,
+        in_cache_mode,
+        cache_dir,
+        in_refresh_mode,
+        engine_name,
+        memo_size if in_memo_mode else None,
+    )
 
 
 if __name__ == '__main__':
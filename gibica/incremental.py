@@ -0,0 +1,186 @@
+"""Incremental module."""
+
+from bisect import bisect_left, bisect_right
+
+from gibica.tokens import Nature
+from gibica.lexer import Lexer, LineIndex
+from gibica.parser import Parser
+from gibica.exceptions import LexicalError, SyntaxError
+from gibica.ast import Program, walk
+
+
+#
+# Incremental Analysis
+#
+
+
+class TokenStream(object):
+    """Replay of already lexed tokens, with the interface of a `Lexer`."""
+
+    def __init__(self, tokens, starts, lines, position=-1):
+        """Initialization of `TokenStream` class."""
+        self.tokens = tokens
+        self.starts = starts
+        self.lines = lines
+        self.position = position
+        self.offset = 0
+
+    def next_token(self):
+        """Return the next token of the stream."""
+        self.position = min(self.position + 1, len(self.tokens) - 1)
+        self.offset = self.starts[self.position]
+        return self.tokens[self.position]
+
+
+class IncrementalParser(object):
+    """Parser updating the AST of a raw input after each edit.
+
+    The tokens of the raw input, their start and end offsets, and the index of the
+    first token of every top-level statement are kept between edits. An edit only
+    re-lexes the damaged tokens and only re-parses the top-level statements they
+    belong to, the other statements are reused (and shifted) as they are.
+    Reused statements are shared with the previous AST, which is then outdated.
+    """
+
+    def __init__(self, raw):
+        """Initialization of `IncrementalParser` class."""
+        self.raw = raw
+        self.tree = None
+        self.rebuild(raw)
+
+    def lex(self, raw, cursor, edit_end=None, delta=0):
+        """Lex `raw` from `cursor`, until the tokens match the previous ones again.
+
+        Return the new tokens, their start and end offsets, and the index of the
+        first previous token which follows them unchanged.
+        """
+        lexer = Lexer(raw)
+        lexer.cursor = cursor
+        tokens, starts, ends = [], [], []
+
+        while True:
+            token = lexer.next_token()
+
+            # A token starting after the edit resynchronizes with the previous ones
+            if edit_end is not None and lexer.offset >= edit_end:
+                index = bisect_left(self.starts, lexer.offset - delta)
+                if index < len(self.starts) and self.starts[index] == (
+                    lexer.offset - delta
+                ):
+                    return tokens, starts, ends, index
+
+            tokens.append(token)
+            starts.append(lexer.offset)
+            ends.append(lexer.base + lexer.cursor)
+            if token.nature == Nature.EOF:
+                return tokens, starts, ends, len(self.tokens or ())
+
+    def statements(self, parser, stream, boundaries):
+        """Parse top-level statements until reaching one of the boundaries.
+
+        Return the statements, the index of their first tokens, their located nodes
+        and the index of the boundary on which the parsing stopped.
+        """
+        children, firsts, nodes = [], [], []
+        boundary = 0
+        while True:
+            position = stream.position
+            while boundary < len(boundaries) and boundaries[boundary] < position:
+                boundary += 1
+            if boundary < len(boundaries) and boundaries[boundary] == position:
+                break
+            if parser.token.nature == Nature.EOF:
+                break
+
+            firsts.append(position)
+            children.append(parser.statement())
+            located = walk(children[-1])
+            nodes.append([node for node in located if node.offset is not None])
+
+        return children, firsts, nodes, boundary
+
+    def commit(self, raw, tokens, starts, ends, children, firsts, nodes):
+        """Replace the tokens and the AST by the updated ones."""
+        self.raw = raw
+        self.tokens, self.starts, self.ends = tokens, starts, ends
+        self.firsts, self.nodes = firsts, nodes
+
+        self.tree = Program()
+        self.tree.offset = starts[0]
+        self.tree.lines = LineIndex(raw)
+        self.tree.children = children
+        return self.tree
+
+    def rebuild(self, raw):
+        """Lex and parse the whole raw input."""
+        self.tokens = None
+        try:
+            tokens, starts, ends, _ = self.lex(raw, 0)
+            stream = TokenStream(tokens, starts, LineIndex(raw))
+            children, firsts, nodes, _ = self.statements(Parser(stream), stream, [])
+        except (LexicalError, SyntaxError):
+            self.fail(raw)
+        return self.commit(raw, tokens, starts, ends, children, firsts, nodes)
+
+    def fail(self, raw):
+        """Raise the error that a full parse of the raw input raises."""
+        self.raw, self.tokens = raw, None
+        Parser(Lexer(raw)).parse()
+        raise
+
+    def edit(self, offset, removed, inserted):
+        """Replace `removed` characters at `offset` by `inserted`, return the AST."""
+        raw = self.raw[:offset] + inserted + self.raw[offset + removed :]
+        if self.tokens is None:
+            # The previous raw input was erroneous
+            return self.rebuild(raw)
+
+        delta = len(inserted) - removed
+        try:
+            # Re-lex from the end of the last token which ends before the edit
+            first = bisect_left(self.ends, offset)
+            cursor = self.ends[first - 1] if first else 0
+            tokens, starts, ends, resync = self.lex(
+                raw, cursor, offset + len(inserted), delta
+            )
+            shift = len(tokens) - (resync - first)
+
+            tokens = self.tokens[:first] + tokens + self.tokens[resync:]
+            starts = (
+                self.starts[:first]
+                + starts
+                + [start + delta for start in self.starts[resync:]]
+            )
+            ends = (
+                self.ends[:first] + ends + [end + delta for end in self.ends[resync:]]
+            )
+
+            # Re-parse from the statement looking ahead at the first damaged token
+            index = max(bisect_right(self.firsts, first - 1) - 1, 0)
+            begin = self.firsts[index] if self.firsts else 0
+            stream = TokenStream(tokens, starts, LineIndex(raw), begin - 1)
+            boundaries = [
+                position + shift
+                for position in self.firsts[bisect_left(self.firsts, resync) :]
+            ]
+            children, firsts, nodes, boundary = self.statements(
+                Parser(stream), stream, boundaries
+            )
+        except (LexicalError, SyntaxError):
+            self.fail(raw)
+
+        # Reuse the statements following the damaged ones
+        reused = len(self.firsts) - len(boundaries) + boundary
+        if delta:
+            for located in self.nodes[reused:]:
+                for node in located:
+                    node.offset += delta
+
+        children = self.tree.children[:index] + children + self.tree.children[reused:]
+        firsts = (
+            self.firsts[:index]
+            + firsts
+            + [position + shift for position in self.firsts[reused:]]
+        )
+        nodes = self.nodes[:index] + nodes + self.nodes[reused:]
+        return self.commit(raw, tokens, starts, ends, children, firsts, nodes)
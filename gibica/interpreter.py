@@ -1,53 +1,204 @@
 """Interpreter module."""
 
+import operator
+
 from gibica import builtins
 from gibica.tokens import Nature
 from gibica.ast import (
     NodeVisitor,
     AST,
     FunctionDeclaration,
+    FunctionCall,
     IfStatement,
     WhileStatement,
     ReturnStatement,
 )
-from gibica.types import bind_type, NoneType, Int, Float, Bool, Function
+from gibica.types import bind_type, NoneType, Int, Float, Bool, Array, Function
 from gibica.memory import Memory
+from gibica.exceptions import TypeError
+
+
+#
+# Unboxed Values
+#
+
+# Gibica numbers and booleans are evaluated as Python ones, boxed in their objects
+# only when they are stored in a variable or given to a function
+BOXES: dict = {int: Int, float: Float, bool: Bool}
+
+# Types of the objects boxing a Python value
+OBJECTS = frozenset((Int, Float, Bool))
+
+# Types of the values whose operations are computed in Python
+NUMBERS = frozenset((int, float))
+
+
+def box(value):
+    """Return the Gibica object of a value."""
+    cls = BOXES.get(type(value))
+    return value if cls is None else cls(value)
+
+
+def unbox(value):
+    """Return the Python value of a Gibica object, if it boxes one."""
+    return value.value if type(value) in OBJECTS else value
+
+
+def truth(value):
+    """Return the truth of a boolean, raise a `TypeError` for the other values."""
+    if type(value) is bool:
+        return value
+    return bool(box(value))
+
+
+def arithmetic(operator):
+    """Return the function applying a binary operator to values or objects.
+
+    The operations between numbers are computed in Python, the other ones by the
+    Gibica types, which raise their errors.
+    """
+
+    def apply(left, right):
+        left_type, right_type = type(left), type(right)
+        if left_type in OBJECTS:
+            left = left.value
+            left_type = type(left)
+        if right_type in OBJECTS:
+            right = right.value
+            right_type = type(right)
+        if left_type in NUMBERS and right_type in NUMBERS:
+            return operator(left, right)
+        return unbox(operator(box(left), box(right)))
+
+    return apply
+
+
+def division(operator):
+    """Return the function applying a division operator to values or objects."""
+    apply = arithmetic(operator)
+
+    def divide(left, right):
+        try:
+            return apply(left, right)
+        except ZeroDivisionError:
+            raise TypeError('Zero division error.')
+
+    return divide
+
+
+def equality(operator):
+    """Return the function applying an equality operator to values or objects.
+
+    Values of the same type are compared in Python as well, since `Bool` is only
+    comparable to booleans.
+    """
+
+    def apply(left, right):
+        left_type, right_type = type(left), type(right)
+        if left_type in OBJECTS:
+            left = left.value
+            left_type = type(left)
+        if right_type in OBJECTS:
+            right = right.value
+            right_type = type(right)
+        if left_type is right_type and left_type in BOXES:
+            return operator(left, right)
+        if left_type in NUMBERS and right_type in NUMBERS:
+            return operator(left, right)
+        return unbox(operator(box(left), box(right)))
+
+    return apply
+
+
+def unary(operator):
+    """Return the function applying a unary operator to a value or an object."""
+
+    def apply(value):
+        if type(value) in OBJECTS:
+            value = value.value
+        if type(value) in NUMBERS:
+            return operator(value)
+        return unbox(operator(box(value)))
 
-from itertools import islice
+    return apply
 
 
 #
 # Program Evaluation
 #
 
+# Operators of the binary operations, except the short-circuiting `or` and `and`
+BINARY_OPERATORS: dict = {
+    Nature.PLUS: arithmetic(operator.add),
+    Nature.MINUS: arithmetic(operator.sub),
+    Nature.MUL: arithmetic(operator.mul),
+    Nature.DIV: division(operator.truediv),
+    Nature.INT_DIV: division(operator.floordiv),
+    Nature.EQ: equality(operator.eq),
+    Nature.NE: equality(operator.ne),
+    Nature.LE: arithmetic(operator.le),
+    Nature.GE: arithmetic(operator.ge),
+    Nature.LT: arithmetic(operator.lt),
+    Nature.GT: arithmetic(operator.gt),
+}
+
+# Operators of the unary operations
+UNARY_OPERATORS: dict = {
+    Nature.PLUS: unary(operator.pos),
+    Nature.MINUS: unary(operator.neg),
+    Nature.NOT: lambda value: not truth(value),
+}
+
+
+class TailCall(object):
+    """Call in tail position of a function, made by the caller of the function."""
+
+    def __init__(self, function, args):
+        """Initialization of `TailCall` class."""
+        self.function = function
+        self.args = args
+
 
 class Interpreter(NodeVisitor):
-    """Evaluation of the parsed input."""
+    """Evaluation of the parsed input.
+
+    Expressions evaluate to Python numbers and booleans, or to Gibica objects. Values
+    are immutable: an assignment binds the variable to a new value. They are boxed
+    into Gibica objects for the built-in functions and the memory.
+
+    Variables are read from the frame being run, a flat list of their values, at
+    the slots given by the resolver. Functions are looked up by name in the table of
+    the global functions, shared by all the frames.
+
+    A call in tail position of a function is made by the loop of the call of the
+    function instead of recursing, so tail recursion isn't limited by the depth of
+    the recursion of Python.
 
-    def __init__(self, tree):
+    With a `memo_size`, the results of the pure functions are cached by arguments,
+    up to `memo_size` results per function.
+    """
+
+    def __init__(self, tree, memo_size=None):
         """Initialization of `Interpreter` class."""
         self.tree = tree
         self.memory = Memory()
+        self.functions = {}
+        self.frame = None
+        self.depth = 0
+        self.memo_size = memo_size
+        self.memos = {}
 
     def load_builtins(self):
-        """Load the built-in functions into the scope."""
-        for raw_name in dir(builtins):
-            if not raw_name.startswith('__'):
-
-                if raw_name.startswith('_'):
-                    function_name = raw_name[1:]
-                else:
-                    function_name = raw_name
-
-                builtin_function = Function(function_name, getattr(builtins, raw_name))
-                self.memory[function_name] = builtin_function
+        """Load the built-in functions into the function table."""
+        for function_name, function in builtins.FUNCTIONS.items():
+            self.functions[function_name] = Function(function_name, function)
 
     def load_functions(self, tree):
-        """Load the functions into the scope."""
+        """Load the functions into the function table."""
         for child in tree.children:
             if isinstance(child, FunctionDeclaration):
                 function_name = child.identifier.name
-                self.memory[function_name] = Function(function_name, child)
+                self.functions[function_name] = Function(function_name, child)
 
     def visit_Program(self, node):
         """Vsitor for `Program` AST node."""
@@ -57,13 +208,6 @@ class Interpreter(NodeVisitor):
 
     def visit_FunctionDeclaration(self, node):
         """Visitor for `FunctionDeclaration` AST node."""
-        scope = self.memory.stack.current.current.copy()
-        args = [parameter.variable.identifier.name for parameter in node.parameters]
-
-        for i in islice(scope, len(args)):
-            self.memory.stack.current.current.pop(i)
-            self.memory[args[i]] = scope[i]
-
         return self.visit(node.body)
 
     def visit_Parameters(self, node):
@@ -86,30 +230,45 @@ class Interpreter(NodeVisitor):
 
     def visit_FunctionCall(self, node):
         """Visitor for `FunctionCall` AST node."""
-        call = self.memory[node.identifier.name]._node
+        call = self.visit(node.identifier)._node
         args = [self.visit(parameter) for parameter in node.parameters]
 
         if isinstance(call, AST):
-            current_scope = self.memory.stack.current.current
-            memory_functions = {
-                key: current_scope[key]
-                for key in current_scope
-                if isinstance(current_scope[key], Function)
-            }
-
-            self.memory.append_frame()
-            for i, arg in enumerate(args):
-                self.memory[i] = arg
-
-            for function in memory_functions:
-                self.memory[function] = memory_functions[function]
+            return self.call(call, args)
+        else:
+            return bind_type(call(*[box(arg) for arg in args]))
+
+    def call(self, call, args):
+        """Call a function, then the functions it calls in tail position."""
+        # Every function of the chain of tail calls returns the same result
+        memo_keys = []
+        self.depth += 1
+        while True:
+            # Result of a previous call of a pure function with the same arguments
+            memo = self.memos.get(call)
+            if memo is not None:
+                memo_key = memo.key([box(arg) for arg in args])
+                function_result = memo.get(memo_key) if memo_key is not None else None
+                if function_result is not None:
+                    break
+                if memo_key is not None:
+                    memo_keys.append((memo, memo_key))
 
+            # The arguments are the first slots of the frame of the function
+            frame, self.frame = self.frame, args
+            args.extend([None] * (len(call.names) - len(args)))
             function_result = self.visit(call)
+            self.frame = frame
 
-            self.memory.pop_frame()
-            return function_result
-        else:
-            return bind_type(call(*args))
+            if not isinstance(function_result, TailCall):
+                break
+            call = function_result.function
+            args = function_result.args
+
+        self.depth -= 1
+        for memo, memo_key in memo_keys:
+            memo.put(memo_key, box(function_result))
+        return function_result
 
     def visit_VariableDeclaration(self, node):
         """Visitor for `VariableDeclaration` AST node."""
@@ -117,14 +276,7 @@ class Interpreter(NodeVisitor):
 
     def visit_Assignment(self, node):
         """Visitor for `Assignment` AST node."""
-        obj_memory = self.memory[node.left.identifier.name]
-        obj_program = self.visit(node.right)
-        if obj_memory is not None:
-            obj_program_value = obj_program.value
-            obj_program = obj_memory
-            obj_program.value = obj_program_value
-
-        self.memory[node.left.identifier.name] = obj_program
+        self.frame[node.left.identifier.slot] = self.visit(node.right)
 
     def visit_Variable(self, node):
         """Visitor for `Variable` AST node."""
@@ -133,12 +285,12 @@ class Interpreter(NodeVisitor):
     def visit_IfStatement(self, node):
         """Visitor for `IfStatement` AST node."""
         if_conditon, if_body = node.if_compound
-        if self.visit(if_conditon):
+        if truth(self.visit(if_conditon)):
             return self.visit(if_body)
         else:
             for else_if_compound in node.else_if_compounds:
                 else_if_condition, else_if_body = else_if_compound
-                if self.visit(else_if_condition):
+                if truth(self.visit(else_if_condition)):
                     result = self.visit(else_if_body)
                     if result is not None:
                         return result
@@ -150,14 +302,13 @@ class Interpreter(NodeVisitor):
 
     def visit_WhileStatement(self, node):
         """Visitor for `WhileStatement` AST node."""
-        while self.visit(node.condition):
+        while truth(self.visit(node.condition)):
             result = self.visit(node.compound)
             if result is not None:
                 return result
 
     def visit_Compound(self, node):
         """Visitor for `Compound` AST node."""
-        self.memory.append_scope()
         for child in node.children:
             return_value = self.visit(child)
 
@@ -167,71 +318,99 @@ class Interpreter(NodeVisitor):
             if isinstance(child, (IfStatement, WhileStatement)):
                 if return_value is not None:
                     return return_value
-        self.memory.pop_scope()
+
+        # The variables declared in the block are released at its end
+        for slot in node.declared:
+            self.frame[slot] = None
 
     def visit_ReturnStatement(self, node):
         """Visitor for `WhileStatement` AST node."""
-        return self.visit(node.expression)
+        expression = node.expression
+        if isinstance(expression, FunctionCall) and self.depth:
+            call = self.visit(expression.identifier)._node
+            if isinstance(call, AST):
+                args = [self.visit(parameter) for parameter in expression.parameters]
+                return TailCall(call, args)
+
+        return self.visit(expression)
 
     def visit_BinaryOperation(self, node):
         """Visitor for `BinaryOperation` AST node."""
-        if node.op.nature == Nature.PLUS:
-            return self.visit(node.left) + self.visit(node.right)
-        elif node.op.nature == Nature.MINUS:
-            return self.visit(node.left) - self.visit(node.right)
-        elif node.op.nature == Nature.MUL:
-            return self.visit(node.left) * self.visit(node.right)
-        elif node.op.nature == Nature.DIV:
-            return self.visit(node.left) / self.visit(node.right)
-        elif node.op.nature == Nature.INT_DIV:
-            return self.visit(node.left) // self.visit(node.right)
-        elif node.op.nature == Nature.EQ:
-            return self.visit(node.left) == self.visit(node.right)
-        elif node.op.nature == Nature.NE:
-            return self.visit(node.left) != self.visit(node.right)
-        elif node.op.nature == Nature.LE:
-            return self.visit(node.left) <= self.visit(node.right)
-        elif node.op.nature == Nature.GE:
-            return self.visit(node.left) >= self.visit(node.right)
-        elif node.op.nature == Nature.LT:
-            return self.visit(node.left) < self.visit(node.right)
-        elif node.op.nature == Nature.GT:
-            return self.visit(node.left) > self.visit(node.right)
-        elif node.op.nature == Nature.OR:
-            return self.visit(node.left) or self.visit(node.right)
-        elif node.op.nature == Nature.AND:
-            return self.visit(node.left) and self.visit(node.right)
+        left = self.visit(node.left)
+        apply = BINARY_OPERATORS.get(node.op.nature)
+        if apply is not None:
+            return apply(left, self.visit(node.right))
+
+        # `or` and `and` only evaluate their right operand if needed
+        if truth(left) is (node.op.nature is Nature.OR):
+            return left
+        return self.visit(node.right)
 
     def visit_UnaryOperation(self, node):
         """Visitor for `UnaryOperation` AST node."""
-        if node.op.nature == Nature.PLUS:
-            return +self.visit(node.right)
-        elif node.op.nature == Nature.MINUS:
-            return -self.visit(node.right)
-        elif node.op.nature == Nature.NOT:
-            return Bool(not self.visit(node.right))
+        return UNARY_OPERATORS[node.op.nature](self.visit(node.right))
 
     def visit_Identifier(self, node):
         """Visitor for `Identifier` AST node."""
-        return self.memory[node.name]
+        if node.slot is None:
+            return self.functions[node.name]
+        return self.frame[node.slot]
 
     def visit_Integer(self, node):
         """Visitor for `Integer` AST node."""
-        return Int(node.value)
+        return int(node.value)
 
     def visit_FloatingPoint(self, node):
         """Visitor for `FloatingPoint` AST node."""
-        return Float(node.value)
+        return float(node.value)
 
     def visit_Boolean(self, node):
         """Visitor for `Boolean` AST node."""
         if node.value == 'true':
-            return Bool(True)
+            return True
         elif node.value == 'false':
-            return Bool(False)
+            return False
+
+    def visit_ArrayLiteral(self, node):
+        """Visitor for `ArrayLiteral` AST node."""
+        elements = [self.visit(element) for element in node.elements]
+        if node.size is not None:
+            return Array.filled(elements[0], self.visit(node.size))
+        return Array(elements)
+
+    def visit_Subscript(self, node):
+        """Visitor for `Subscript` AST node."""
+        value = box(self.visit(node.value))
+        return unbox(value[box(self.visit(node.index))])
+
+    def visit_Constant(self, node):
+        """Visitor for `Constant` AST node."""
+        return node.value
 
     def interpret(self):
         """Generic entrypoint of `Interpreter` class."""
         self.load_builtins()
         self.load_functions(self.tree)
+
+        if self.memo_size:
+            from gibica.memoization import Memo, pure_functions
+
+            self.memos = {
+                function: Memo(self.memo_size)
+                for function in pure_functions(self.tree)
+            }
+
+        # An AST loaded from the cache is already resolved
+        if self.tree.names is None:
+            from gibica.resolver import Resolver
+
+            Resolver(self.tree).resolve()
+
+        self.frame = [None] * len(self.tree.names)
         self.visit(self.tree)
+
+        for name, function in self.functions.items():
+            self.memory[name] = function
+        for name, value in zip(self.tree.names, self.frame):
+            if value is not None:
+                self.memory[name] = box(value)
@@ -0,0 +1,24 @@
+"""Launcher of the interpreter.
+
+Entry point of the `gibica` command: a script run without options skips the import
+of the command line interface, which takes longer than running most scripts.
+"""
+
+import sys
+
+
+def launch():
+    """Run the script given on the command line."""
+    arguments = sys.argv[1:]
+    if len(arguments) == 1 and not arguments[0].startswith('-'):
+        from gibica.runner import run
+
+        return run(arguments[0])
+
+    from gibica.entrypoint import main
+
+    return main()
+
+
+if __name__ == '__main__':
+    launch()
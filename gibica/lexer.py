@@ -1,6 +1,12 @@
 """Lexer module."""
 
-from gibica.tokens import Token, Nature, RESERVED_KEYWORDS
+import re
+import sys
+from array import array
+from bisect import bisect_right
+from mmap import mmap
+
+from gibica.tokens import Token, Nature, EOF, OPERATORS, RESERVED_KEYWORDS
 from gibica.exceptions import LexicalError
 
 
@@ -8,195 +14,235 @@ from gibica.exceptions import LexicalError
 # Lexical Analysis
 #
 
+# Master pattern matching the whitespaces and comments followed by the next token.
+# Only ASCII tokens are handled here, the others are delegated to `Lexer.unicode`.
+# A byte-oriented version of the pattern is used to scan binary inputs in place.
+TOKEN_PATTERN = re.compile(
+    r'\s*(?:#[^\n]*\s*)*'
+    r'(?:(?P<TOKEN>'
+    r'==|!=|<=|>=|//|[;,<>=+\-*/(){}[\]]'
+    r'|[A-Za-z_]\w*(?!\w|[^\x00-\x7f])'
+    r'|[0-9]+\.[0-9]*(?![0-9]|[^\x00-\x7f])'
+    r'|[0-9]+(?![0-9.]|[^\x00-\x7f])'
+    r')|(?P<OTHER>\S))?'
+)
+
+BINARY_TOKEN_PATTERN = re.compile(TOKEN_PATTERN.pattern.encode())
+
+# Types of the inputs scanned as UTF-8 encoded bytes
+BINARY_TYPES = (bytes, bytearray, mmap)
+
+# Default number of characters read at once from a stream
+CHUNK_SIZE = 1 << 16
+
+# Shared tokens of the fixed-value lexemes
+SYMBOLS: dict = {**OPERATORS, **RESERVED_KEYWORDS}
+BINARY_SYMBOLS: dict = {lexeme.encode(): token for lexeme, token in SYMBOLS.items()}
+
+# Continuation bytes of the UTF-8 sequences, which don't start a character
+CONTINUATION_BYTES = bytes(range(0x80, 0xC0))
+
+
+class LineIndex(object):
+    """Lazy index of the line starts of the raw input.
+
+    Only a window of the raw input is referenced, its line starts are indexed up to
+    the requested offsets or before the window moves onto the next chunk of a stream.
+    """
+
+    def __init__(self, raw, base=0):
+        """Initialization of `LineIndex` class."""
+        self.raw = raw
+        self.base = base
+        self.starts = array('q', [0])
+        self.end = 0
+
+    def index(self, offset):
+        """Index the line starts of the window up to `offset`."""
+        end = min(offset, self.base + len(self.raw)) - self.base
+        if end <= self.end - self.base:
+            return
+
+        newline = b'\n' if isinstance(self.raw, BINARY_TYPES) else '\n'
+        position = self.raw.find(newline, self.end - self.base, end)
+        while position >= 0:
+            self.starts.append(self.base + position + 1)
+            position = self.raw.find(newline, position + 1, end)
+        self.end = self.base + end
+
+    def move(self, raw, base):
+        """Move the window onto the part of the raw input starting at `base`."""
+        self.index(base)
+        self.raw, self.base = raw, base
+
+    def position(self, offset):
+        """Return the line and column numbers of an offset.
+
+        The column is counted in characters, also in binary inputs, whose characters
+        before the offset are counted in the window.
+        """
+        self.index(offset)
+        line = bisect_right(self.starts, offset)
+        start = self.starts[line - 1]
+        if isinstance(self.raw, BINARY_TYPES):
+            start = max(start, self.base)
+            prefix = bytes(self.raw[start - self.base : offset - self.base])
+            return line, len(prefix.translate(None, CONTINUATION_BYTES)) + 1
+        return line, offset - start + 1
+
+    def describe(self, offset):
+        """Return a human readable position of an offset."""
+        return 'line {}, column {}'.format(*self.position(offset))
 
-class Lexer(object):
-    """Lexical analyser."""
 
-    def __init__(self, raw):
+class Lexer(object):
+    """Lexical analyser.
+
+    The raw input is either a string, a text stream (e.g. an open file or a pipe)
+    or UTF-8 encoded bytes (e.g. a memory-mapped file).
+    A stream is consumed by chunks of `chunk_size` characters, only the part of the
+    input which has not been tokenized yet is kept in memory.
+    Bytes are scanned in place, only the lexemes of the tokens are decoded.
+    Tokens are shared by all the occurrences of a lexeme, so the position of the last
+    token is given by `offset` (in characters, or in bytes for binary inputs).
+    The raw input may be a slice of a larger input starting at offset `base`, the
+    offsets are then given in the larger input.
+    """
+
+    def __init__(self, raw, chunk_size=CHUNK_SIZE, base=0):
         """Initialization of `Lexer` class."""
-        self.raw = raw if raw != '' else '\n'
-        self.cursor = 0
-        self.char = self.raw[self.cursor]
-
-    def advance(self):
-        """Increment the cursor position."""
-        self.cursor += 1
-        if self.cursor >= len(self.raw):
-            self.char = None
+        if isinstance(raw, (str,) + BINARY_TYPES):
+            self.raw, self.stream = raw, None
         else:
-            self.char = self.raw[self.cursor]
-
-    def peek(self):
-        """Get the next character without moving the cursor."""
-        peek_cursor = self.cursor + 1
-        if peek_cursor >= len(self.raw):
-            return None
-        else:
-            return self.raw[peek_cursor]
-
-    def whitespace(self):
-        """Handle whitespaces."""
-        while self.char is not None and self.char.isspace():
-            self.advance()
-
-    def comment(self):
-        """Handle comments."""
-        while self.char is not None and self.char != '\n':
-            self.advance()
-
-    def number(self):
-        """Return a multidigit int or float number."""
-        number = ''
-        while self.char is not None and self.char.isdigit():
-            number += self.char
-            self.advance()
-
-        if self.char == '.':
-            number += self.char
-            self.advance()
-
-            while self.char is not None and self.char.isdigit():
-                number += self.char
-                self.advance()
-
-            token = Token(Nature.FLOAT_NUMBER, number)
-
+            self.raw, self.stream = '', raw
+        self.binary = isinstance(raw, BINARY_TYPES)
+        self.pattern = BINARY_TOKEN_PATTERN if self.binary else TOKEN_PATTERN
+        self.symbols = dict(BINARY_SYMBOLS if self.binary else SYMBOLS)
+        self.chunk_size = chunk_size
+        self.cursor = 0
+        self.base = base
+        self.offset = base
+        self.lines = LineIndex(self.raw, base)
+
+    def fill(self):
+        """Append the next chunk of the stream to the raw input, if any."""
+        if self.stream is None:
+            return False
+
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.stream = None
+            return False
+
+        self.base += self.cursor
+        self.raw = self.raw[self.cursor :] + chunk
+        self.cursor = 0
+        self.lines.move(self.raw, self.base)
+        return True
+
+    def character(self, position):
+        """Return the character at `position` and the position of the next one."""
+        if position >= len(self.raw):
+            return '', position
+
+        if not self.binary:
+            return self.raw[position], position + 1
+
+        # Length of the UTF-8 sequence according to its leading byte
+        lead = self.raw[position]
+        size = 1 if lead < 0x80 else 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+        try:
+            return self.raw[position : position + size].decode(), position + size
+        except UnicodeDecodeError:
+            location = self.lines.describe(self.base + position)
+            raise LexicalError(f"Invalid UTF-8 sequence at {location}.")
+
+    def word(self, position):
+        """Return the end of the identifier continuing at `position`."""
+        char, end = self.character(position)
+        while char.isalnum() or char == '_':
+            position = end
+            char, end = self.character(position)
+        return position
+
+    def number(self, position):
+        """Return the end of a number made of any unicode digits."""
+        char, end = self.character(position)
+        while char.isdigit():
+            position = end
+            char, end = self.character(position)
+
+        if char != '.':
+            return position
+
+        position = end
+        char, end = self.character(position)
+        while char.isdigit():
+            position = end
+            char, end = self.character(position)
+        return position
+
+    def unicode(self):
+        """Handle a non-ASCII token or an invalid character."""
+        while True:
+            raw, start = self.raw, self.cursor
+            char, end = self.character(start)
+
+            if char.isalpha() or char == '_':
+                end = self.word(end)
+            elif char.isdigit():
+                end = self.number(start)
+            elif not char.isspace():
+                raise LexicalError(
+                    f"Invalid character `{char}` "
+                    f"at {self.lines.describe(self.base + start)}."
+                )
+
+            # The token may continue in the next chunk
+            if end < len(raw) or not self.fill():
+                break
+
+        self.cursor = end
+        self.offset = self.base + start
+        if char.isspace():
+            # Non-ASCII whitespaces are only left by the pattern in binary inputs
+            return self.next_token()
+        return self.symbols.get(raw[start:end]) or self.symbol(raw[start:end])
+
+    def symbol(self, lexeme):
+        """Create the shared token of a new identifier or number lexeme."""
+        value = sys.intern(lexeme.decode() if self.binary else lexeme)
+
+        if not value[0].isdigit():
+            nature = Nature.ID
+        elif '.' in value:
+            nature = Nature.FLOAT_NUMBER
         else:
-            token = Token(Nature.INT_NUMBER, number)
+            nature = Nature.INT_NUMBER
 
-        return token
-
-    def _id(self):
-        """Handle identifiers and reserverd keywords."""
-        result = ''
-        while self.char is not None and (self.char.isalnum() or self.char == '_'):
-            result += self.char
-            self.advance()
-
-        token = RESERVED_KEYWORDS.get(result, Token(Nature.ID, result))
+        token = self.symbols[lexeme] = Token(nature, value)
         return token
 
     def next_token(self):
         """Lexical analyser of the raw input."""
-        while self.char is not None:
-
-            if self.char.isspace():
-                # The current character is a whitespace
-                self.whitespace()
-                continue
-
-            elif self.char == '#':
-                # The current character is `#`
-                self.advance()
-                self.comment()
-                continue
-
-            elif self.char.isalpha() or self.char == '_':
-                # The current character is a letter or `_`
-                return self._id()
-
-            elif self.char == ';':
-                # The current character is `;`
-                self.advance()
-                return Token(Nature.SEMI, ';')
-
-            elif self.char == ',':
-                # The current character is `,`
-                self.advance()
-                return Token(Nature.COMMA, ';')
-
-            elif self.char.isdigit():
-                # The current character is a number
-                return self.number()
-
-            elif self.char == '=' and self.peek() == '=':
-                # The current character is `==`
-                self.advance()
-                self.advance()
-                return Token(Nature.EQ, '==')
-
-            elif self.char == '!' and self.peek() == '=':
-                # The current character is `!=`
-                self.advance()
-                self.advance()
-                return Token(Nature.NE, '!=')
-
-            elif self.char == '<' and self.peek() == '=':
-                # The current character is `<=`
-                self.advance()
-                self.advance()
-                return Token(Nature.LE, '<=')
-
-            elif self.char == '>' and self.peek() == '=':
-                # The current character is `>=`
-                self.advance()
-                self.advance()
-                return Token(Nature.GE, '>=')
-
-            elif self.char == '<':
-                # The current character is `<`
-                self.advance()
-                return Token(Nature.LT, '<')
-
-            elif self.char == '>':
-                # The current character is `>`
-                self.advance()
-                return Token(Nature.GT, '>')
-
-            elif self.char == '=':
-                # The current character is `=`
-                self.advance()
-                return Token(Nature.ASSIGN, '=')
-
-            elif self.char == '+':
-                # The current character is `+`
-                self.advance()
-                return Token(Nature.PLUS, '+')
-
-            elif self.char == '-':
-                # The current character is `-`
-                self.advance()
-                return Token(Nature.MINUS, '-')
-
-            elif self.char == '*':
-                # The current character is `*`
-                self.advance()
-                return Token(Nature.MUL, '*')
-
-            elif self.char == '/' and self.peek() == '/':
-                # The current character is `//`
-                self.advance()
-                self.advance()
-                return Token(Nature.INT_DIV, '//')
-
-            elif self.char == '/':
-                # The current character is `/`
-                self.advance()
-                return Token(Nature.DIV, '/')
-
-            elif self.char == '(':
-                # The current character is `(`
-                self.advance()
-                return Token(Nature.LPAREN, '(')
-
-            elif self.char == ')':
-                # The current character is `)`
-                self.advance()
-                return Token(Nature.RPAREN, ')')
-
-            elif self.char == '{':
-                # The current character is `{`
-                self.advance()
-                return Token(Nature.LBRACKET, '{')
-
-            elif self.char == '}':
-                # The current character is `}`
-                self.advance()
-                return Token(Nature.RBRACKET, '}')
-
-            else:
-                # The current character is unknown
-                raise LexicalError(f"Invalid character `{self.char}`.")
+        while True:
+            match = self.pattern.match(self.raw, self.cursor)
+
+            # The token may continue in the next chunk
+            if match.end() < len(self.raw) or not self.fill():
+                break
+
+        self.cursor = match.end()
+        lexeme = match.group('TOKEN')
+        if lexeme is not None:
+            self.offset = self.base + match.start('TOKEN')
+            return self.symbols.get(lexeme) or self.symbol(lexeme)
+
+        elif match.lastgroup == 'OTHER':
+            # Non-ASCII, invalid character or token followed by non-ASCII characters
+            self.cursor = match.start('OTHER')
+            return self.unicode()
 
         # End of raw input
-        return Token(Nature.EOF, None)
+        self.offset = self.base + self.cursor
+        return EOF
@@ -0,0 +1,114 @@
+"""Memoization module."""
+
+from collections import OrderedDict
+
+from gibica.ast import walk, FunctionDeclaration, FunctionCall, VariableDeclaration
+from gibica.types import value_key, NoneType, Int, Float, Bool
+
+
+#
+# Purity Analysis
+#
+
+# Types of the arguments and results which can be memoized, compared by value
+VALUE_TYPES = (Int, Float, Bool)
+
+
+def is_locally_pure(node, functions):
+    """Return whether a function is pure, given the purity of the functions it calls.
+
+    A function is pure if it calls no built-in function, nor a function passed in a
+    variable. Values are immutable, so the assignments can't be seen by the caller.
+    """
+    parameters = {parameter.variable.identifier.name for parameter in node.parameters}
+    nodes = list(walk(node.body))
+    variables = {
+        child.assignment.left.identifier.name
+        for child in nodes
+        if isinstance(child, VariableDeclaration)
+    }
+
+    for child in nodes:
+        if isinstance(child, FunctionCall):
+            name = child.identifier.name
+            if name in parameters or name in variables or name not in functions:
+                return False
+
+    return True
+
+
+def pure_functions(tree):
+    """Return the declarations of the pure functions of a program."""
+    declarations = {
+        child.identifier.name: child
+        for child in tree.children
+        if isinstance(child, FunctionDeclaration)
+    }
+    candidates = {
+        name
+        for name, declaration in declarations.items()
+        if is_locally_pure(declaration, declarations)
+    }
+
+    # A function calling an impure function is impure, until nothing changes
+    changed = True
+    while changed:
+        changed = False
+        for name in list(candidates):
+            calls = {
+                child.identifier.name
+                for child in walk(declarations[name].body)
+                if isinstance(child, FunctionCall)
+            }
+            if not calls <= candidates:
+                candidates.remove(name)
+                changed = True
+
+    return {declarations[name] for name in candidates}
+
+
+#
+# Memoization
+#
+
+
+class Memo(object):
+    """Cache of the results of a function, evicting the least recently used ones."""
+
+    def __init__(self, size):
+        """Initialization of `Memo` class."""
+        self.size = size
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, args):
+        """Return the key of the arguments of a call, or None if it can't be cached."""
+        if all(type(arg) in VALUE_TYPES for arg in args):
+            return tuple(value_key(arg) for arg in args)
+
+    def get(self, key):
+        """Return the result of a call, or None if it isn't cached."""
+        result = self.results.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.results.move_to_end(key)
+        return result
+
+    def put(self, key, result):
+        """Cache the result of a call."""
+        if type(result) in VALUE_TYPES or isinstance(result, NoneType):
+            self.results[key] = result
+            if len(self.results) > self.size:
+                self.results.popitem(last=False)
+
+    def __str__(self):
+        """String representation of a memo."""
+        return f'<hits={self.hits} misses={self.misses} size={len(self.results)}>'
+
+    def __repr__(self):
+        """String representation of the class."""
+        return self.__str__()  # pragma: no cover
@@ -8,22 +8,22 @@ class Scope(dict):
 
 
 class Frame(list):
-    """Frame of `Scope` objects."""
+    """Frame of `Scope` objects.
+
+    The scope of a block isn't copied from the one enclosing it: the names it
+    declares are recorded in `blocks`, then deleted at its end.
+    """
 
     def __init__(self, *args, **kwargs):
         """Initialization of `Frame` class."""
         super().__init__(*args, **kwargs)
+        self.blocks = []
 
     @property
     def current(self):
         """Get the current scope of the frame."""
         return self[-1]
 
-    @current.setter
-    def current(self, value):
-        """Set the current scope of the frame."""
-        self[-1] = value
-
 
 class Stack(list):
     """Stack of `Frame` objects."""
@@ -39,7 +39,12 @@ class Stack(list):
 
 
 class Memory(object):
-    """Memory object representation."""
+    """Memory object representation.
+
+    The engines only use it for the global memory given by `interpret`: the frames
+    and the blocks of a running program are slots of lists, so the scopes of its
+    frames are only an API for the code managing a `Memory` by itself.
+    """
 
     def __init__(self, **kwags):
         """Initialization of `Memory` class."""
@@ -51,7 +56,11 @@ class Memory(object):
 
     def __setitem__(self, key, value):
         """Set a value from the current scope in the current frame."""
-        self.stack.current.current[key] = value
+        frame = self.stack.current
+        scope = frame.current
+        if frame.blocks and key not in scope:
+            frame.blocks[-1].append(key)
+        scope[key] = value
 
     def __eq__(self, other):
         """Handle the `==` operator."""
@@ -76,16 +85,14 @@ class Memory(object):
 
     def append_scope(self):
         """Create a new scope in the current frame."""
-        self.stack.current.append(Scope(self.stack.current.current))
+        self.stack.current.blocks.append([])
 
     def pop_scope(self):
         """Delete the current scope in the current frame."""
-        child_scope = self.stack.current.current.copy()
-        self.stack.current.pop()
-        parent_scope = self.stack.current.current.copy()
-        self.stack.current.current = {
-            key: child_scope[key] for key in child_scope if key in parent_scope
-        }
+        frame = self.stack.current
+        scope = frame.current
+        for key in frame.blocks.pop():
+            del scope[key]
 
     def __str__(self):
         """String representation of a token."""
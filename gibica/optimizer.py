@@ -0,0 +1,192 @@
+"""Optimizer module."""
+
+from gibica.tokens import Token, Nature
+from gibica.ast import NodeVisitor, UnaryOperation, Constant
+from gibica.types import Int, Float, Bool
+from gibica.interpreter import BINARY_OPERATORS, UNARY_OPERATORS, box
+from gibica.exceptions import TypeError, ObjectError
+
+
+#
+# AST Optimization
+#
+
+# Operators whose right operand is an identity for Int and Float left operands
+IDENTITIES: dict = {Nature.MINUS: 0, Nature.MUL: 1}
+
+POSITIVE = Token(Nature.PLUS, '+')
+
+
+class Optimizer(NodeVisitor):
+    """Optimization of an analysed AST, before its evaluation.
+
+    The literals are converted once into constants, and the operations on constants
+    are folded, unless they raise an error, which is then raised at runtime as
+    before. The operations with an identity operand are simplified into unary `+`,
+    which keeps the type of the other operand, and its errors.
+    """
+
+    def __init__(self, tree):
+        """Initialization of `Optimizer` class."""
+        self.tree = tree
+
+    def statements(self, children):
+        """Optimize a list of statements in place."""
+        children[:] = [self.visit(child) for child in children]
+
+    def visit_Program(self, node):
+        """Visitor for `Program` AST node."""
+        self.statements(node.children)
+        return node
+
+    def visit_FunctionDeclaration(self, node):
+        """Visitor for `FunctionDeclaration` AST node."""
+        self.visit(node.body)
+        return node
+
+    def visit_FunctionBody(self, node):
+        """Visitor for `FunctionBody` AST node."""
+        self.statements(node.children)
+        return node
+
+    def visit_FunctionCall(self, node):
+        """Visitor for `FunctionCall` AST node."""
+        for parameter in node.parameters:
+            parameter.variable = self.visit(parameter.variable)
+        return node
+
+    def visit_VariableDeclaration(self, node):
+        """Visitor for `VariableDeclaration` AST node."""
+        self.visit(node.assignment)
+        return node
+
+    def visit_Assignment(self, node):
+        """Visitor for `Assignment` AST node."""
+        node.right = self.visit(node.right)
+        return node
+
+    def visit_Variable(self, node):
+        """Visitor for `Variable` AST node."""
+        return node
+
+    def visit_IfStatement(self, node):
+        """Visitor for `IfStatement` AST node."""
+        if_condition, if_body = node.if_compound
+        node.if_compound = (self.visit(if_condition), self.visit(if_body))
+
+        node.else_if_compounds = [
+            (self.visit(condition), self.visit(body))
+            for condition, body in node.else_if_compounds
+        ]
+
+        if node.else_compound is not None:
+            _, else_body = node.else_compound
+            node.else_compound = (None, self.visit(else_body))
+        return node
+
+    def visit_WhileStatement(self, node):
+        """Visitor for `WhileStatement` AST node."""
+        node.condition = self.visit(node.condition)
+        node.compound = self.visit(node.compound)
+        return node
+
+    def visit_Compound(self, node):
+        """Visitor for `Compound` AST node."""
+        self.statements(node.children)
+        return node
+
+    def visit_ReturnStatement(self, node):
+        """Visitor for `ReturnStatement` AST node."""
+        node.expression = self.visit(node.expression)
+        return node
+
+    def visit_BinaryOperation(self, node):
+        """Visitor for `BinaryOperation` AST node."""
+        node.left = left = self.visit(node.left)
+        node.right = right = self.visit(node.right)
+        nature = node.op.nature
+
+        if isinstance(left, Constant) and nature in (Nature.OR, Nature.AND):
+            if left.cls is not Bool:
+                return node
+
+            # The right operand is only evaluated if the left one doesn't decide
+            if left.value is (nature is Nature.OR):
+                return left
+            return right
+
+        if isinstance(left, Constant) and isinstance(right, Constant):
+            return self.fold(
+                node,
+                lambda: BINARY_OPERATORS[nature](
+                    left.cls(left.value), right.cls(right.value)
+                ),
+            )
+
+        if (
+            isinstance(right, Constant)
+            and right.cls is Int
+            and IDENTITIES.get(nature) == right.value
+        ):
+            return self.locate(UnaryOperation(POSITIVE, left), node)
+
+        return node
+
+    def visit_UnaryOperation(self, node):
+        """Visitor for `UnaryOperation` AST node."""
+        node.right = right = self.visit(node.right)
+        if isinstance(right, Constant):
+            return self.fold(
+                node, lambda: UNARY_OPERATORS[node.op.nature](right.cls(right.value))
+            )
+        return node
+
+    def visit_Identifier(self, node):
+        """Visitor for `Identifier` AST node."""
+        return node
+
+    def visit_Integer(self, node):
+        """Visitor for `Integer` AST node."""
+        return self.locate(Constant(Int, int(node.value)), node)
+
+    def visit_FloatingPoint(self, node):
+        """Visitor for `FloatingPoint` AST node."""
+        return self.locate(Constant(Float, float(node.value)), node)
+
+    def visit_Boolean(self, node):
+        """Visitor for `Boolean` AST node."""
+        return self.locate(Constant(Bool, node.value == 'true'), node)
+
+    def visit_ArrayLiteral(self, node):
+        """Visitor for `ArrayLiteral` AST node."""
+        node.elements = [self.visit(element) for element in node.elements]
+        if node.size is not None:
+            node.size = self.visit(node.size)
+        return node
+
+    def visit_Subscript(self, node):
+        """Visitor for `Subscript` AST node."""
+        node.value = self.visit(node.value)
+        node.index = self.visit(node.index)
+        return node
+
+    def visit_Constant(self, node):
+        """Visitor for `Constant` AST node."""
+        return node
+
+    def fold(self, node, evaluate):
+        """Return the constant of an operation, or the operation if it fails."""
+        try:
+            result = box(evaluate())
+        except (TypeError, ObjectError):
+            return node
+        return self.locate(Constant(type(result), result.value), node)
+
+    def locate(self, new, node):
+        """Give the offset of a node to the node replacing it."""
+        new.offset = node.offset
+        return new
+
+    def optimize(self):
+        """Generic entrypoint of `Optimizer` class."""
+        return self.visit(self.tree)
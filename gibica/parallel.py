@@ -0,0 +1,103 @@
+"""Parallel module."""
+
+import os
+import re
+
+from concurrent.futures import ProcessPoolExecutor
+
+from gibica.lexer import Lexer, LineIndex, BINARY_TYPES
+from gibica.parser import Parser
+from gibica.exceptions import LexicalError, SyntaxError
+from gibica.ast import Program, collection_paused
+
+
+#
+# Parallel Syntax Analysis
+#
+
+# Delimiters of the top-level statements, comments are matched to be skipped
+DELIMITER_PATTERN = re.compile(r'#[^\n]*|[{};\[\]]')
+BINARY_DELIMITER_PATTERN = re.compile(DELIMITER_PATTERN.pattern.encode())
+
+# An `else` following a closing brace continues the `if` statement
+ELSE_PATTERN = re.compile(r'(?:\s|#[^\n]*)*else(?!\w)')
+BINARY_ELSE_PATTERN = re.compile(rb'(?:\s|#[^\n]*)*else(?![\w\x80-\xff])')
+
+# Number of slices parsed by each process, to balance the statements of uneven sizes
+SLICES_PER_JOB = 4
+
+
+def split(raw):
+    """Return the offsets at which the top-level statements of the raw input end.
+
+    The raw input is pre-scanned by brace and bracket depth, without being tokenized:
+    a statement ends with a semicolon or a closing brace at depth zero, unless an
+    `else` follows. The semicolon of an array of copies, `[x; n]`, is in brackets.
+    An erroneous input may be split anywhere, its slices fail to parse as well.
+    """
+    binary = isinstance(raw, BINARY_TYPES)
+    delimiter_pattern = BINARY_DELIMITER_PATTERN if binary else DELIMITER_PATTERN
+    else_pattern = BINARY_ELSE_PATTERN if binary else ELSE_PATTERN
+    semi, lbrace, rbrace = (b';', b'{', b'}') if binary else (';', '{', '}')
+    lbracket, rbracket = (b'[', b']') if binary else ('[', ']')
+
+    ends = []
+    depth = 0
+    for match in delimiter_pattern.finditer(raw):
+        delimiter = match.group()
+        if delimiter == lbrace or delimiter == lbracket:
+            depth += 1
+        elif delimiter == rbracket:
+            depth -= 1
+        elif delimiter == rbrace:
+            depth -= 1
+            if depth == 0 and not else_pattern.match(raw, match.end()):
+                ends.append(match.end())
+        elif delimiter == semi and depth == 0:
+            ends.append(match.end())
+    return ends
+
+
+def parse_slice(raw, base):
+    """Parse a slice of the raw input starting at `base`, return its statements."""
+    with collection_paused():
+        return Parser(Lexer(raw, base=base)).parse().children
+
+
+def parse(raw, jobs=None):
+    """Return the AST of the raw input, its statements being parsed by `jobs` processes.
+
+    The raw input is either a string, UTF-8 encoded bytes or a text stream, which is
+    read at once. On any error, the raw input is parsed again as a whole: the error
+    raised is the first one of the input, as with a sequential parse, and a slice
+    wrongly cut by the pre-scan doesn't fail the parse of a valid input.
+    """
+    if not isinstance(raw, (str,) + BINARY_TYPES):
+        raw = raw.read()
+    jobs = jobs or os.cpu_count() or 1
+
+    # Group the statements in slices of about the same size
+    ends = split(raw)
+    size = len(raw) / (jobs * SLICES_PER_JOB)
+    cuts, limit = [0], size
+    for end in ends:
+        if end >= limit:
+            cuts.append(end)
+            limit = end + size
+    if cuts[-1] < len(raw):
+        cuts.append(len(raw))
+    starts, stops = cuts[:-1] or [0], cuts[1:] or [0]
+
+    try:
+        with ProcessPoolExecutor(max_workers=jobs) as executor, collection_paused():
+            slices = [raw[start:stop] for start, stop in zip(starts, stops)]
+            results = list(executor.map(parse_slice, slices, starts))
+    except (LexicalError, SyntaxError):
+        # Either the input is erroneous, or the pre-scan cut a statement
+        return Parser(Lexer(raw)).parse()
+
+    root = Program()
+    root.lines = LineIndex(raw)
+    root.children = [statement for statements in results for statement in statements]
+    root.offset = Parser(Lexer(raw)).offset
+    return root
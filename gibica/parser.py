@@ -21,6 +21,8 @@ from gibica.ast import (
     Integer,
     FloatingPoint,
     Boolean,
+    ArrayLiteral,
+    Subscript,
 )
 
 
@@ -28,6 +30,30 @@ from gibica.ast import (
 # Syntax Analysis
 #
 
+# Precedences of the operators, from the loosest to the tightest binding
+OR_PRECEDENCE = 1
+AND_PRECEDENCE = 2
+NOT_PRECEDENCE = 3
+COMPARISON_PRECEDENCE = 4
+ADDITIVE_PRECEDENCE = 5
+MULTIPLICATIVE_PRECEDENCE = 6
+
+PRECEDENCES: dict = {
+    Nature.OR: OR_PRECEDENCE,
+    Nature.AND: AND_PRECEDENCE,
+    Nature.EQ: COMPARISON_PRECEDENCE,
+    Nature.NE: COMPARISON_PRECEDENCE,
+    Nature.LE: COMPARISON_PRECEDENCE,
+    Nature.GE: COMPARISON_PRECEDENCE,
+    Nature.LT: COMPARISON_PRECEDENCE,
+    Nature.GT: COMPARISON_PRECEDENCE,
+    Nature.PLUS: ADDITIVE_PRECEDENCE,
+    Nature.MINUS: ADDITIVE_PRECEDENCE,
+    Nature.MUL: MULTIPLICATIVE_PRECEDENCE,
+    Nature.DIV: MULTIPLICATIVE_PRECEDENCE,
+    Nature.INT_DIV: MULTIPLICATIVE_PRECEDENCE,
+}
+
 
 class Parser(object):
     """Parser returning an AST of the input."""
@@ -36,23 +62,34 @@ class Parser(object):
         """Initialization of `Parser` class."""
         self.lexer = lexer
         self.token = self.lexer.next_token()
+        self.offset = self.lexer.offset
 
     def _process(self, name):
         """Process the current token."""
         if self.token.nature == name:
             self.token = self.lexer.next_token()
+            self.offset = self.lexer.offset
         else:
             self._error()
 
     def _error(self):
         """Raise a Syntax Error."""
-        raise SyntaxError(f"Unable to process `{self.token}`.")
+        raise SyntaxError(
+            f"Unable to process `{self.token}` "
+            f"at {self.lexer.lines.describe(self.offset)}."
+        )
+
+    def _locate(self, node, offset):
+        """Set the offset of a node in the raw input."""
+        node.offset = offset
+        return node
 
     def program(self):
         """
         program: (statement)*
         """
-        root = Program()
+        root = self._locate(Program(), self.offset)
+        root.lines = self.lexer.lines
 
         while self.token.nature != Nature.EOF:
             root.children.append(self.statement())
@@ -89,26 +126,31 @@ class Parser(object):
         """
         function_declaration: 'def' ID parameters compound
         """
+        offset = self.offset
         self._process(Nature.DEF)
 
-        identifier = Identifier(self.token.value)
+        identifier = self._locate(Identifier(self.token.value), self.offset)
         self._process(Nature.ID)
 
         parameters = self.parameters()
-        return FunctionDeclaration(
+        node = FunctionDeclaration(
             identifier=identifier, parameters=parameters, body=self.function_body()
         )
+        return self._locate(node, offset)
 
     def parameters(self):
         """
-        parameters: '(' logical_or_expr (',' logical_or_expr)* ')'
+        parameters: '(' expression (',' expression)* ')'
         """
         nodes = []
         self._process(Nature.LPAREN)
 
         while self.token.nature != Nature.RPAREN:
 
-            nodes.append(Parameters(variable=self.logical_or_expr()))
+            offset = self.offset
+            nodes.append(
+                self._locate(Parameters(variable=self.expression()), offset)
+            )
 
             if self.token.nature == Nature.COMMA:
                 self._process(Nature.COMMA)
@@ -120,7 +162,7 @@ class Parser(object):
         """
         function_body: '{' (statement)* '}'
         """
-        root = FunctionBody()
+        root = self._locate(FunctionBody(), self.offset)
         self._process(Nature.LBRACKET)
 
         while self.token.nature != Nature.RBRACKET:
@@ -133,10 +175,11 @@ class Parser(object):
         """
         variable_declaration: 'let' assignment ';'
         """
+        offset = self.offset
         self._process(Nature.LET)
         node = VariableDeclaration(assignment=self.assignment())
         self._process(Nature.SEMI)
-        return node
+        return self._locate(node, offset)
 
     def expression_statement(self):
         """
@@ -148,25 +191,27 @@ class Parser(object):
 
     def assignment(self):
         """
-        assignment: logical_or_expr ['=' logical_or_expr]
+        assignment: expression ['=' expression]
         """
-        node = self.logical_or_expr()
+        offset = self.offset
+        node = self.expression()
         if self.token.nature == Nature.ASSIGN:
             token = self.token
             self._process(Nature.ASSIGN)
-            right = self.logical_or_expr()
-            return Assignment(left=node, op=token, right=right)
+            right = self.expression()
+            return self._locate(Assignment(left=node, op=token, right=right), offset)
         else:
             return node
 
     def if_statement(self):
         """
-        if_statement: 'if' logical_or_expr compound
-                    ('else' 'if' local_or_expr compound)*
+        if_statement: 'if' expression compound
+                    ('else' 'if' expression compound)*
                     ['else' compound]
         """
+        offset = self.offset
         self._process(Nature.IF)
-        if_condition = self.logical_or_expr()
+        if_condition = self.expression()
         if_body = self.compound()
 
         else_compound = None
@@ -176,30 +221,34 @@ class Parser(object):
 
             if self.token.nature == Nature.IF:
                 self._process(Nature.IF)
-                else_if_compounds.append((self.logical_or_expr(), self.compound()))
+                else_if_compounds.append((self.expression(), self.compound()))
             else:
                 else_compound = (None, self.compound())
 
-        return IfStatement(
+        node = IfStatement(
             if_compound=(if_condition, if_body),
             else_if_compounds=else_if_compounds,
             else_compound=else_compound,
         )
+        return self._locate(node, offset)
 
     def while_statement(self):
         """
-        while_statement: 'while' local_or_expr compound
+        while_statement: 'while' expression compound
         """
+        offset = self.offset
         self._process(Nature.WHILE)
-        condition = self.logical_or_expr()
+        condition = self.expression()
         compound = self.compound()
-        return WhileStatement(condition=condition, compound=compound)
+        return self._locate(
+            WhileStatement(condition=condition, compound=compound), offset
+        )
 
     def compound(self):
         """
         compound: '{' (statement)* '}'
         """
-        root = Compound()
+        root = self._locate(Compound(), self.offset)
         self._process(Nature.LBRACKET)
 
         while self.token.nature != Nature.RBRACKET:
@@ -212,177 +261,134 @@ class Parser(object):
         """
         jump_statement: 'return' expression_statement
         """
+        offset = self.offset
         self._process(Nature.RETURN)
-        return ReturnStatement(expression=self.expression_statement())
-
-    def logical_or_expr(self):
-        """
-        logical_or_expr: logical_and_expr ('or' logical_and_expr)*
-        """
-        node = self.logical_and_expr()
-
-        while self.token.nature == Nature.OR:
-            token = self.token
-            self._process(Nature.OR)
-
-            node = BinaryOperation(left=node, op=token, right=self.logical_and_expr())
-
-        return node
+        return self._locate(
+            ReturnStatement(expression=self.expression_statement()), offset
+        )
 
-    def logical_and_expr(self):
+    def expression(self, precedence=OR_PRECEDENCE):
         """
-        logical_and_expr: logical_not_expr ('and' logical_not_expr)*
-        """
-        node = self.logical_not_expr()
-
-        while self.token.nature == Nature.AND:
-            token = self.token
-            self._process(Nature.AND)
-
-            node = BinaryOperation(left=node, op=token, right=self.logical_not_expr())
+        expression: 'not' expression
+                  | atom (binary_operator expression)*
+        binary_operator: 'or' | 'and'
+                       | '==' | '!=' | '<=' | '>=' | '<' | '>'
+                       | '+' | '-' | '*' | '/' | '//'
 
-        return node
-
-    def logical_not_expr(self):
+        Precedence climbing parser, the operators binding less tightly than
+        `precedence` are left to the caller.
         """
-        logical_not_expr: 'not' logical_not_expr
-                        | comparison
-        """
-        if self.token.nature == Nature.NOT:
-            token = self.token
+        token, offset = self.token, self.offset
+        if token.nature == Nature.NOT and precedence <= NOT_PRECEDENCE:
             self._process(Nature.NOT)
-            return UnaryOperation(op=token, right=self.logical_not_expr())
+            node = UnaryOperation(op=token, right=self.expression(NOT_PRECEDENCE))
+            node = self._locate(node, offset)
         else:
-            return self.comparison()
+            node = self.atom()
 
-    def comparison(self):
-        """
-        comparison: expr (('==' | '!=' | '<=' | '>=' | '<' | '>') expr)*
-        """
-        node = self.expr()
-
-        while self.token.nature in (
-            Nature.EQ,
-            Nature.NE,
-            Nature.LE,
-            Nature.GE,
-            Nature.LT,
-            Nature.GT,
-        ):
+        # Binary operators are all left-associative
+        while True:
             token = self.token
-            if token.nature == Nature.EQ:
-                self._process(Nature.EQ)
-            elif token.nature == Nature.NE:
-                self._process(Nature.NE)
-            elif token.nature == Nature.LE:
-                self._process(Nature.LE)
-            elif token.nature == Nature.GE:
-                self._process(Nature.GE)
-            elif token.nature == Nature.LT:
-                self._process(Nature.LT)
-            elif token.nature == Nature.GT:
-                self._process(Nature.GT)
-            else:
-                self.error()
+            token_precedence = PRECEDENCES.get(token.nature, 0)
+            if token_precedence < precedence:
+                return node
+            self._process(token.nature)
 
-            node = BinaryOperation(left=node, op=token, right=self.expr())
-
-        return node
-
-    def expr(self):
-        """
-        expr: term (('+' | '-') term)*
-        """
-        node = self.term()
-
-        while self.token.nature in (Nature.PLUS, Nature.MINUS):
-            token = self.token
-            if token.nature == Nature.PLUS:
-                self._process(Nature.PLUS)
-            elif token.nature == Nature.MINUS:
-                self._process(Nature.MINUS)
-            else:
-                self._error()
-
-            node = BinaryOperation(left=node, op=token, right=self.term())
-
-        return node
-
-    def term(self):
-        """
-        term: atom (('*' | '/' | '//') atom)*
-        """
-        node = self.atom()
-
-        while self.token.nature in (Nature.MUL, Nature.DIV, Nature.INT_DIV):
-            token = self.token
-            if token.nature == Nature.MUL:
-                self._process(Nature.MUL)
-            elif token.nature == Nature.DIV:
-                self._process(Nature.DIV)
-            elif token.nature == Nature.INT_DIV:
-                self._process(Nature.INT_DIV)
-            else:
-                self._error()
-
-            node = BinaryOperation(left=node, op=token, right=self.atom())
-
-        return node
+            right = self.expression(token_precedence + 1)
+            node = BinaryOperation(left=node, op=token, right=right)
+            self._locate(node, offset)
 
     def call(self):
         """
         call: ['mut'] ID [parameters]
         """
+        offset = self.offset
         is_mutable = False
         if self.token.nature == Nature.MUT:
             is_mutable = True
             self._process(Nature.MUT)
 
-        identifier = Identifier(name=self.token.value)
+        identifier = self._locate(Identifier(name=self.token.value), self.offset)
         self._process(Nature.ID)
 
         if self.token.nature == Nature.LPAREN:
-            return FunctionCall(identifier=identifier, parameters=self.parameters())
+            node = FunctionCall(identifier=identifier, parameters=self.parameters())
         else:
-            return Variable(identifier=identifier, is_mutable=is_mutable)
+            node = Variable(identifier=identifier, is_mutable=is_mutable)
+        return self._locate(node, offset)
+
+    def array(self):
+        """
+        array: '[' [expression (',' expression)*] ']'
+             | '[' expression ';' expression ']'
+        """
+        offset = self.offset
+        elements, size = [], None
+        self._process(Nature.LSQUARE)
+
+        if self.token.nature != Nature.RSQUARE:
+            elements.append(self.expression())
+
+            if self.token.nature == Nature.SEMI:
+                self._process(Nature.SEMI)
+                size = self.expression()
+            else:
+                while self.token.nature == Nature.COMMA:
+                    self._process(Nature.COMMA)
+                    elements.append(self.expression())
+
+        self._process(Nature.RSQUARE)
+        return self._locate(ArrayLiteral(elements=elements, size=size), offset)
+
+    def subscript(self, node, offset):
+        """
+        subscript: (call | array | '(' expression ')') ('[' expression ']')*
+        """
+        while self.token.nature == Nature.LSQUARE:
+            self._process(Nature.LSQUARE)
+            node = Subscript(value=node, index=self.expression())
+            self._process(Nature.RSQUARE)
+            self._locate(node, offset)
+        return node
 
     def atom(self):
         """
         atom: '+' atom
             | '-' atom
-            | call
+            | subscript
             | INT_NUMBER
             | FLOAT_NUMBER
-            | '(' logical_or_expr ')'
             | TRUE
             | FALSE
         """
-        token = self.token
+        token, offset = self.token, self.offset
         if token.nature == Nature.PLUS:
             self._process(Nature.PLUS)
-            return UnaryOperation(op=token, right=self.atom())
+            return self._locate(UnaryOperation(op=token, right=self.atom()), offset)
         elif token.nature == Nature.MINUS:
             self._process(Nature.MINUS)
-            return UnaryOperation(op=token, right=self.atom())
+            return self._locate(UnaryOperation(op=token, right=self.atom()), offset)
         elif token.nature in (Nature.MUT, Nature.ID):
-            return self.call()
+            return self.subscript(self.call(), offset)
+        elif token.nature == Nature.LSQUARE:
+            return self.subscript(self.array(), offset)
         elif token.nature == Nature.INT_NUMBER:
             self._process(Nature.INT_NUMBER)
-            return Integer(token)
+            return self._locate(Integer(token), offset)
         elif token.nature == Nature.FLOAT_NUMBER:
             self._process(Nature.FLOAT_NUMBER)
-            return FloatingPoint(token)
+            return self._locate(FloatingPoint(token), offset)
         elif token.nature == Nature.LPAREN:
             self._process(Nature.LPAREN)
-            node = self.logical_or_expr()
+            node = self.expression()
             self._process(Nature.RPAREN)
-            return node
+            return self.subscript(node, offset)
         elif token.nature == Nature.TRUE:
             self._process(Nature.TRUE)
-            return Boolean(token)
+            return self._locate(Boolean(token), offset)
         elif token.nature == Nature.FALSE:
             self._process(Nature.FALSE)
-            return Boolean(token)
+            return self._locate(Boolean(token), offset)
         else:
             self._error()
 
@@ -0,0 +1,118 @@
+"""Resolver module."""
+
+from gibica.ast import FunctionDeclaration
+from gibica.sementic import SymbolTableBuilder
+
+
+#
+# Slot Resolution
+#
+
+
+class Layout(object):
+    """Slots of the variables of a frame, in their order of appearance."""
+
+    def __init__(self, parameters=()):
+        """Initialization of `Layout` class."""
+        self.slots = {name: index for index, name in enumerate(parameters)}
+
+    def __getitem__(self, name):
+        """Return the slot of a variable, allocated on its first appearance."""
+        return self.slots.setdefault(name, len(self.slots))
+
+    def __len__(self):
+        """Return the number of slots of the frame."""
+        return len(self.slots)
+
+
+class Resolver(SymbolTableBuilder):
+    """Resolution of the variables to the slots of the frames.
+
+    The program and each function get a frame, a flat list of the values of their
+    variables, parameters first. A function only sees its own variables, so every
+    variable is in the frame being run: its identifier is given the index of its
+    slot, and each block the slots of the variables it declares. The identifiers of
+    the functions keep no slot, they are looked up by name.
+    """
+
+    def __init__(self, tree):
+        """Initialization of `Resolver` class."""
+        super().__init__(tree)
+        self.layout = None
+        self.declared = None
+
+    def resolve_frame(self, node, children, parameters=()):
+        """Resolve the variables of the frame of a program or a function."""
+        self.layout = Layout(parameters)
+        for child in children:
+            self.visit(child)
+        node.names = tuple(self.layout.slots)
+
+    def visit_Program(self, node):
+        """Visitor for `Program` AST node."""
+        self.resolve_frame(
+            node,
+            [
+                child
+                for child in node.children
+                if not isinstance(child, FunctionDeclaration)
+            ],
+        )
+
+        for child in node.children:
+            if isinstance(child, FunctionDeclaration):
+                self.visit(child)
+
+    def visit_FunctionDeclaration(self, node):
+        """Visitor for `FunctionDeclaration` AST node."""
+        parameters = [
+            parameter.variable.identifier.name for parameter in node.parameters
+        ]
+        self.resolve_frame(node, [node.body], parameters)
+
+    def visit_FunctionCall(self, node):
+        """Visitor for `FunctionCall` AST node."""
+        self.visit(node.identifier)
+        for parameter in node.parameters:
+            self.visit(parameter.variable)
+
+    def visit_VariableDeclaration(self, node):
+        """Visitor for `VariableDeclaration` AST node."""
+        if self.declared is not None:
+            self.declared.append(self.layout[node.assignment.left.identifier.name])
+        self.visit(node.assignment)
+
+    def visit_Assignment(self, node):
+        """Visitor for `Assignment` AST node."""
+        # The slot of the assigned variable is allocated even if it shadows a function
+        self.layout[node.left.identifier.name]
+        self.visit(node.left)
+        self.visit(node.right)
+
+    def visit_Variable(self, node):
+        """Visitor for `Variable` AST node."""
+        self.visit(node.identifier)
+
+    def visit_Compound(self, node):
+        """Visitor for `Compound` AST node."""
+        self.declared, declared = [], self.declared
+        try:
+            for child in node.children:
+                self.visit(child)
+            node.declared = tuple(self.declared)
+        finally:
+            self.declared = declared
+
+    def visit_Identifier(self, node):
+        """Visitor for `Identifier` AST node."""
+        if node.name in self.layout.slots or self.table[node.name] is None:
+            node.slot = self.layout[node.name]
+        else:
+            node.slot = None
+
+    def resolve(self):
+        """Generic entrypoint of `Resolver` class."""
+        self.load_builtins()
+        self.load_functions(self.tree)
+        self.visit(self.tree)
+        return self.tree
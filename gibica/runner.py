@@ -0,0 +1,168 @@
+"""Runner of the scripts.
+
+Only the interpreter is imported up front: the front end and the optional features
+are imported when a run needs them, to keep the startup of short scripts fast.
+"""
+
+import os
+import stat
+
+from contextlib import contextmanager
+from importlib import import_module
+
+from gibica.interpreter import Interpreter
+
+
+#
+# Source
+#
+
+
+@contextmanager
+def source(filepath, in_mmap_mode):
+    """Open the script as a text stream, or as a read-only memory map."""
+    if not in_mmap_mode:
+        with open(filepath) as file:
+            yield file
+        return
+
+    from mmap import mmap, ACCESS_READ
+
+    with open(filepath, 'rb') as file:
+        # An empty file can't be mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b''
+            return
+
+        with mmap(file.fileno(), 0, access=ACCESS_READ) as mapping:
+            yield mapping
+
+
+#
+# Engines
+#
+
+# Modules and classes of the engines evaluating the programs, by name
+ENGINES: dict = {
+    'interpreter': ('gibica.interpreter', 'Interpreter'),
+    'closure': ('gibica.closure', 'ClosureInterpreter'),
+    'vm': ('gibica.vm', 'VirtualMachine'),
+    'python': ('gibica.transpiler', 'PythonInterpreter'),
+}
+
+
+def engine(name):
+    """Return the class of an engine, importing its module if needed."""
+    if name == 'interpreter':
+        return Interpreter
+
+    module, cls = ENGINES[name]
+    return getattr(import_module(module), cls)
+
+
+#
+# Run
+#
+
+
+def run(
+    filepath,
+    in_debug_mode=False,
+    in_mmap_mode=False,
+    jobs=1,
+    in_cache_mode=True,
+    cache_dir=None,
+    in_refresh_mode=False,
+    engine_name='interpreter',
+    memo_size=None,
+):
+    """Run a script."""
+
+    with source(filepath, in_mmap_mode) as raw:
+
+        try:
+
+            # AST analysed by a previous run, if the script didn't change since
+            cache, tree = None, None
+
+            # A pipe can't be read again to hash its content
+            if in_cache_mode and stat.S_ISREG(os.stat(filepath).st_mode):
+                from gibica.cache import Cache
+
+                cache = Cache(filepath, cache_dir)
+                if not in_refresh_mode:
+                    tree = cache.load()
+            is_cached = tree is not None
+
+            if not is_cached and jobs == 1:
+                from gibica.lexer import Lexer
+                from gibica.parser import Parser
+
+                # Lexical analysis
+                lexer = Lexer(raw)
+
+                # Syntax analysis
+                parser = Parser(lexer)
+                tree = parser.parse()
+
+            elif not is_cached:
+                from gibica import parallel
+
+                # Lexical and syntax analysis of the statements in parallel
+                tree = parallel.parse(raw, jobs)
+
+            # Sementic analysis, already done for a cached AST
+            if not is_cached or in_debug_mode:
+                from gibica.sementic import SymbolTableBuilder
+
+                symtab_builder = SymbolTableBuilder(tree)
+                symtab_builder.build()
+
+            # Optimization of the analysed AST, already done for a cached AST
+            if not is_cached:
+                from gibica.optimizer import Optimizer
+
+                tree = Optimizer(tree).optimize()
+
+            # Resolution of the variables to slots, cached with the AST
+            if not is_cached:
+                from gibica.resolver import Resolver
+
+                Resolver(tree).resolve()
+
+            if cache is not None and not is_cached:
+                cache.store(tree)
+
+            # Program evaluation
+            options = {'memo_size': memo_size} if memo_size else {}
+            interpreter = engine(engine_name)(tree, **options)
+            interpreter.interpret()
+
+            # Display internal variables if debug option is enabled
+            if in_debug_mode:
+                print(f"SYMBOL TABLE: {symtab_builder.table}")
+                print(f"GLOBAL MEMORY: {interpreter.memory}")
+
+                # Statistics of the memoized functions
+                if getattr(interpreter, 'memos', None):
+                    memos = {
+                        function.identifier.name: memo
+                        for function, memo in interpreter.memos.items()
+                    }
+                    print(f"MEMOS: {memos}")
+
+                # Generated code of the engines compiling the program
+                if hasattr(interpreter, 'disassemble'):
+                    print(f"BYTECODE:\n{interpreter.disassemble()}")
+                if hasattr(interpreter, 'source'):
+                    print(f"PYTHON SOURCE:\n{interpreter.source}", end='')
+
+        except Exception as gibica_exception:
+
+            # Display the full trace if debug option is enabled
+            if in_debug_mode:
+                raise
+
+            # In classic mode, just display the interpreter trace
+            else:
+                print(f"{gibica_exception.__class__.__name__}: {gibica_exception}")
@@ -3,7 +3,7 @@
 from collections import OrderedDict
 
 from gibica import builtins
-from gibica.ast import NodeVisitor, AST, FunctionDeclaration
+from gibica.ast import NodeVisitor, AST, FunctionDeclaration, Variable
 from gibica.exceptions import SementicError
 from gibica.types import Function
 
@@ -135,28 +135,35 @@ class SymbolTableBuilder(NodeVisitor):
         self.tree = tree
         self.table = SymbolTable()
 
-    def load_builtins(self):
-        """Load the built-in functions into the scope."""
-        for raw_name in dir(builtins):
-            if not raw_name.startswith('__'):
+    def _error(self, message, node):
+        """Raise a Sementic Error located at the node, if its position is known."""
+        if self.tree.lines is not None and node.offset is not None:
+            message = f"{message} at {self.tree.lines.describe(node.offset)}"
+        raise SementicError(f"{message}.")
 
-                if raw_name.startswith('_'):
-                    function_name = raw_name[1:]
-                else:
-                    function_name = raw_name
+    def declaration(self, name):
+        """Return the symbol declared by the program under a name, if any.
 
-                builtin_function = FunctionSymbol(
-                    Function(function_name, getattr(builtins, raw_name))
-                )
-                self.table[function_name] = builtin_function
+        The built-in functions aren't declared by the program, which can shadow them.
+        """
+        symbol = self.table[name]
+        if isinstance(symbol, FunctionSymbol) and not isinstance(symbol._node, AST):
+            return None
+        return symbol
+
+    def load_builtins(self):
+        """Load the built-in functions into the scope."""
+        for function_name, function in builtins.FUNCTIONS.items():
+            builtin_function = FunctionSymbol(Function(function_name, function))
+            self.table[function_name] = builtin_function
 
     def load_functions(self, tree):
         """Load the functions into the scope."""
         for child in tree.children:
             if isinstance(child, FunctionDeclaration):
-                if self.table[child.identifier.name] is not None:
-                    raise SementicError(
-                        f"Function `{child.identifier.name}` already declared."
+                if self.declaration(child.identifier.name) is not None:
+                    self._error(
+                        f"Function `{child.identifier.name}` already declared", child
                     )
                 self.table[child.identifier.name] = FunctionSymbol(child)
 
@@ -173,12 +180,12 @@ class SymbolTableBuilder(NodeVisitor):
                 var_name = parameter.variable.identifier.name
                 var_is_mutable = parameter.variable.is_mutable
             except AttributeError:
-                raise SementicError('Invalid parameter.')
+                self._error('Invalid parameter', parameter)
 
             var_symbol = VariableSymbol(var_name, var_is_mutable)
 
-            if self.table[var_name] is not None:
-                raise SementicError(f"Duplicated `{var_name}` function parameter.")
+            if self.declaration(var_name) is not None:
+                self._error(f"Duplicated `{var_name}` function parameter", parameter)
 
             self.table[var_name] = var_symbol
 
@@ -198,14 +205,14 @@ class SymbolTableBuilder(NodeVisitor):
         function_name = node.identifier.name
         call = self.table[function_name]
         if call is None:
-            raise SementicError(f"Function `{function_name}` not declared.")
+            self._error(f"Function `{function_name}` not declared", node)
         else:
             call = call._node
 
         if isinstance(call, AST):
             if len(call.parameters) != len(node.parameters):
-                raise SementicError(
-                    "Mismatch between call and function parameters number."
+                self._error(
+                    "Mismatch between call and function parameters number", node
                 )
 
             current_table = self.table.stack.current
@@ -215,8 +222,8 @@ class SymbolTableBuilder(NodeVisitor):
                 if isinstance(current_table[key], FunctionSymbol)
             }
 
-            if self.table.name == function_name:
-                # End the visit in case of recursion
+            if any(table.name == function_name for table in self.table.stack):
+                # End the visit in case of recursion, direct or mutual
                 return
 
             self.table.append_table(function_name, **functions_in_table)
@@ -225,12 +232,15 @@ class SymbolTableBuilder(NodeVisitor):
 
     def visit_VariableDeclaration(self, node):
         """Visitor for `VariableDeclaration` AST node."""
+        if not isinstance(node.assignment.left, Variable):
+            self._error('Invalid assignment target', node)
+
         var_name = node.assignment.left.identifier.name
         var_is_mutable = node.assignment.left.is_mutable
         var_symbol = VariableSymbol(var_name, var_is_mutable)
 
-        if self.table[var_name] is not None:
-            raise SementicError(f"Variable `{var_name}` is already declared.")
+        if self.declaration(var_name) is not None:
+            self._error(f"Variable `{var_name}` is already declared", node)
 
         self.table[var_symbol.name] = var_symbol
 
@@ -239,11 +249,15 @@ class SymbolTableBuilder(NodeVisitor):
 
     def visit_Assignment(self, node):
         """Visitor for `Assignment` AST node."""
+        # Arrays are immutable, their elements can't be assigned
+        if not isinstance(node.left, Variable):
+            self._error('Invalid assignment target', node)
+
         var_name = node.left.identifier.name
         var_symbol = self.table[var_name]
 
         if var_symbol is not None and not var_symbol.is_mutable:
-            raise SementicError(f"Re-assignment of immutable variable `{var_name}`.")
+            self._error(f"Re-assignment of immutable variable `{var_name}`", node)
 
         self.visit(node.left)
         self.visit(node.right)
@@ -254,7 +268,7 @@ class SymbolTableBuilder(NodeVisitor):
         var_symbol = self.table[var_name]
 
         if var_symbol is None:
-            raise SementicError(f"Variable `{var_name}` is not declared.")
+            self._error(f"Variable `{var_name}` is not declared", node)
 
     def visit_IfStatement(self, node):
         """Visitor for `IfStatement` AST node."""
@@ -310,6 +324,22 @@ class SymbolTableBuilder(NodeVisitor):
         """Visitor for `Boolean` AST node."""
         pass
 
+    def visit_ArrayLiteral(self, node):
+        """Visitor for `ArrayLiteral` AST node."""
+        for element in node.elements:
+            self.visit(element)
+        if node.size is not None:
+            self.visit(node.size)
+
+    def visit_Subscript(self, node):
+        """Visitor for `Subscript` AST node."""
+        self.visit(node.value)
+        self.visit(node.index)
+
+    def visit_Constant(self, node):
+        """Visitor for `Constant` AST node."""
+        pass
+
     def build(self):
         """Generic entrypoint of `SymbolTableBuilder` class."""
         self.load_builtins()
@@ -6,6 +6,9 @@ from enum import Enum
 class Nature(Enum):
     """Enumeration of token natures."""
 
+    # Members are singletons, hashed by identity to speed up the lookup tables
+    __hash__ = object.__hash__
+
     ID = 'ID'
 
     INT_NUMBER = 'INT_NUMBER'
@@ -39,6 +42,9 @@ class Nature(Enum):
     LBRACKET = 'LBRACKET'
     RBRACKET = 'RBRACKET'
 
+    LSQUARE = 'LSQUARE'
+    RSQUARE = 'RSQUARE'
+
     ASSIGN = 'ASSIGN'
 
     IF = 'IF'
@@ -58,6 +64,8 @@ class Nature(Enum):
 class Token(object):
     """Token container"""
 
+    __slots__ = ('nature', 'value')
+
     def __init__(self, nature, value):
         """Initialization of `Token` class."""
         self.nature = nature
@@ -72,6 +80,33 @@ class Token(object):
         return self.__str__()  # pragma: no cover
 
 
+# End of input token
+EOF: Token = Token(Nature.EOF, None)
+
+# List of operators and punctuation
+OPERATORS: dict = {
+    ';': Token(Nature.SEMI, ';'),
+    ',': Token(Nature.COMMA, ';'),
+    '==': Token(Nature.EQ, '=='),
+    '!=': Token(Nature.NE, '!='),
+    '<=': Token(Nature.LE, '<='),
+    '>=': Token(Nature.GE, '>='),
+    '<': Token(Nature.LT, '<'),
+    '>': Token(Nature.GT, '>'),
+    '=': Token(Nature.ASSIGN, '='),
+    '+': Token(Nature.PLUS, '+'),
+    '-': Token(Nature.MINUS, '-'),
+    '*': Token(Nature.MUL, '*'),
+    '//': Token(Nature.INT_DIV, '//'),
+    '/': Token(Nature.DIV, '/'),
+    '(': Token(Nature.LPAREN, '('),
+    ')': Token(Nature.RPAREN, ')'),
+    '{': Token(Nature.LBRACKET, '{'),
+    '}': Token(Nature.RBRACKET, '}'),
+    '[': Token(Nature.LSQUARE, '['),
+    ']': Token(Nature.RSQUARE, ']'),
+}
+
 # List of reserved keywords
 RESERVED_KEYWORDS: dict = {
     'let': Token(Nature.LET, 'let'),
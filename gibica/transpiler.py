@@ -0,0 +1,615 @@
+"""Transpiler module."""
+
+import math
+
+from gibica import builtins
+from gibica.tokens import Nature
+from gibica.ast import (
+    walk,
+    NodeVisitor,
+    AST,
+    FunctionDeclaration,
+    VariableDeclaration,
+    Assignment,
+    Identifier,
+    Variable,
+    BinaryOperation,
+    Integer,
+    FloatingPoint,
+    Boolean,
+    Constant,
+    IfStatement,
+    WhileStatement,
+    Compound,
+    ReturnStatement,
+)
+from gibica.types import bind_type, NoneType, Int, Float, Bool, Array, Function
+from gibica.memory import Memory
+from gibica.interpreter import Interpreter
+from gibica.exceptions import InterpreterError, TypeError
+
+
+#
+# Runtime
+#
+
+# Values are unboxed: Gibica numbers and booleans are Python ones, `none` is None
+NUMBERS = (int, float)
+
+# Value of the variables which aren't declared yet, or whose block has ended
+UNDEFINED = object()
+
+
+class Leave(Exception):
+    """Raised by a `return` out of a function, to leave its top-level statement."""
+
+    pass
+
+
+def box(value):
+    """Return the Gibica object of an unboxed value."""
+    if value is UNDEFINED:
+        return None
+    if isinstance(value, (int, float, type(None))):
+        return bind_type(value)
+    return value
+
+
+def unbox(obj):
+    """Return the unboxed value of a Gibica object."""
+    if isinstance(obj, (Int, Float, Bool)):
+        return obj.value
+    if isinstance(obj, NoneType):
+        return None
+    return obj
+
+
+def fallback(operator):
+    """Return the helper of an operator, applied to the Gibica objects.
+
+    Only the operands which aren't both numbers (or both booleans for the equality
+    operators) are handled here, so the result and the errors are the ones of the
+    Gibica types.
+    """
+
+    def helper(left, right):
+        if type(left) in NUMBERS and type(right) in NUMBERS:
+            return operator(left, right)
+        return unbox(operator(box(left), box(right)))
+
+    return helper
+
+
+def equality(operator):
+    """Return the helper of an equality operator."""
+
+    def helper(left, right):
+        if type(left) is type(right) and type(left) in EQUALITY_TYPES:
+            return operator(left, right)
+        if type(left) in NUMBERS and type(right) in NUMBERS:
+            return operator(left, right)
+        return unbox(operator(box(left), box(right)))
+
+    return helper
+
+
+# Types whose values are compared in Python as in Gibica
+EQUALITY_TYPES = (int, float, bool)
+
+
+def positive(value):
+    """Handle the unary `+` operator."""
+    if type(value) in NUMBERS:
+        return +value
+    return unbox(+box(value))
+
+
+def negative(value):
+    """Handle the unary `-` operator."""
+    if type(value) in NUMBERS:
+        return -value
+    return unbox(-box(value))
+
+
+def truth(value):
+    """Return a boolean, raising the Gibica error of the other values."""
+    if type(value) is bool:
+        return value
+    return bool(box(value))
+
+
+def chain(value, *operations):
+    """Apply a chain of operations, given as pairs of a helper and a right operand."""
+    for index in range(0, len(operations), 2):
+        value = operations[index](value, operations[index + 1])
+    return value
+
+
+def subscript(value, index):
+    """Handle the indexing of an element of an array."""
+    return unbox(box(value)[box(index)])
+
+
+def builtin(function):
+    """Return the wrapper of a built-in function, which takes Gibica objects."""
+
+    def wrapper(*args):
+        return unbox(bind_type(function(*[box(arg) for arg in args])))
+
+    return wrapper
+
+
+RUNTIME: dict = {
+    'NUMBERS': NUMBERS,
+    'UNDEFINED': UNDEFINED,
+    'Leave': Leave,
+    'add': fallback(lambda left, right: left + right),
+    'sub': fallback(lambda left, right: left - right),
+    'mul': fallback(lambda left, right: left * right),
+    'truediv': fallback(lambda left, right: left / right),
+    'floordiv': fallback(lambda left, right: left // right),
+    'le': fallback(lambda left, right: left <= right),
+    'ge': fallback(lambda left, right: left >= right),
+    'lt': fallback(lambda left, right: left < right),
+    'gt': fallback(lambda left, right: left > right),
+    'eq': equality(lambda left, right: left == right),
+    'ne': equality(lambda left, right: left != right),
+    'pos': positive,
+    'neg': negative,
+    'truth': truth,
+    'chain': chain,
+    'subscript': subscript,
+    'Array': Array,
+}
+
+
+#
+# Transpilation
+#
+
+# Kinds of the values of the expressions, when known statically
+NUMBER, BOOLEAN = 'number', 'boolean'
+
+# Python operators and runtime helpers of the binary operators, and kind of result,
+# which for the arithmetic operators is only a number if both operands are numbers
+BINARY_OPERATORS: dict = {
+    Nature.PLUS: ('+', 'add', NUMBER),
+    Nature.MINUS: ('-', 'sub', NUMBER),
+    Nature.MUL: ('*', 'mul', NUMBER),
+    Nature.DIV: ('/', 'truediv', NUMBER),
+    Nature.INT_DIV: ('//', 'floordiv', NUMBER),
+    Nature.LE: ('<=', 'le', BOOLEAN),
+    Nature.GE: ('>=', 'ge', BOOLEAN),
+    Nature.LT: ('<', 'lt', BOOLEAN),
+    Nature.GT: ('>', 'gt', BOOLEAN),
+    Nature.EQ: ('==', 'eq', BOOLEAN),
+    Nature.NE: ('!=', 'ne', BOOLEAN),
+}
+
+# Nodes whose evaluation can be repeated, in the guards of the operations
+SIMPLE_NODES = (Variable, Identifier, Integer, FloatingPoint, Boolean, Constant)
+
+INDENT = '    '
+
+
+def literal(value):
+    """Return the source code of a number, the infinities and NaN having no literal."""
+    if type(value) is float and not math.isfinite(value):
+        return f"float('{value!r}')"
+    return repr(value)
+
+
+class Transpiler(NodeVisitor):
+    """Translation of an AST into the source code of an equivalent Python module.
+
+    Each Gibica function becomes a Python function, and the program a `program`
+    function returning the values of its variables, in the order of `names`.
+    Variables are renamed after their slot (`v0`, `v1`...), functions after their
+    index (`f0` for the function itself, `g0` for its Gibica object).
+
+    The operators are applied directly on the operands known to be numbers or
+    booleans, otherwise a guard checks their types at runtime and falls back to a
+    helper applying the operator of the Gibica types.
+    """
+
+    def __init__(self, tree):
+        """Initialization of `Transpiler` class."""
+        self.tree = tree
+        self.functions = {}
+        self.indices = {}
+        self.lines = []
+        self.depth = 0
+        self.slots = None
+        self.declared = None
+        self.is_program = False
+        self.names = []
+
+    def load_functions(self):
+        """Load the built-in and declared functions."""
+        for function_name, function in builtins.FUNCTIONS.items():
+            self.functions[function_name] = Function(function_name, function)
+
+        for child in self.tree.children:
+            if isinstance(child, FunctionDeclaration):
+                function_name = child.identifier.name
+                self.functions[function_name] = Function(function_name, child)
+
+        self.indices = {name: index for index, name in enumerate(self.functions)}
+
+    def emit(self, line):
+        """Append a line of source code at the current indentation."""
+        self.lines.append(INDENT * self.depth + line)
+
+    def slot(self, name):
+        """Return the Python name of a variable, allocated on its first appearance."""
+        index = self.slots.get(name)
+        if index is None:
+            index = self.slots[name] = len(self.slots)
+        return f'v{index}'
+
+    def statement(self, node):
+        """Translate a statement, or an expression whose value is dropped."""
+        if self.is_program and self.depth == 1 and returns(node):
+            # A `return` out of a function only leaves its top-level statement
+            self.emit('try:')
+            self.block([node])
+            self.emit('except Leave:')
+            self.block([])
+        elif isinstance(node, STATEMENT_NODES):
+            self.visit(node)
+        else:
+            self.emit(self.visit(node)[0])
+
+    def block(self, children):
+        """Translate the statements of an indented block."""
+        self.depth += 1
+        start = len(self.lines)
+        for child in children:
+            self.statement(child)
+        if len(self.lines) == start:
+            self.emit('pass')
+        self.depth -= 1
+
+    def function(self, name, parameters, children):
+        """Translate a function, its undeclared variables being initialized first."""
+        self.emit(f"def {name}({', '.join(parameters)}):")
+        start = len(self.lines)
+        self.block(children)
+
+        variables = [f'v{index}' for index in range(len(parameters), len(self.slots))]
+        if variables:
+            line = INDENT * (self.depth + 1) + ' = '.join(variables + ['UNDEFINED'])
+            self.lines.insert(start, line)
+
+    def transpile(self):
+        """Generic entrypoint of `Transpiler` class, return the Python source code."""
+        self.load_functions()
+        for name, function in self.functions.items():
+            if isinstance(function._node, FunctionDeclaration):
+                self.visit(function._node)
+                self.emit('')
+        self.visit(self.tree)
+        return '\n'.join(self.lines) + '\n'
+
+    def visit_Program(self, node):
+        """Visitor for `Program` AST node."""
+        self.slots, self.is_program = {}, True
+        children = [
+            child
+            for child in node.children
+            if not isinstance(child, FunctionDeclaration)
+        ]
+        self.function('program', [], children + [ProgramEnd()])
+        self.names = list(self.slots)
+        self.is_program = False
+
+    def visit_ProgramEnd(self, node):
+        """Return the values of the variables of the program."""
+        variables = ', '.join(f'v{index}' for index in range(len(self.slots)))
+        self.emit(f'return [{variables}]')
+
+    def visit_FunctionDeclaration(self, node):
+        """Visitor for `FunctionDeclaration` AST node."""
+        if self.slots is not None:
+            raise InterpreterError('Nested function declarations are not supported.')
+
+        self.slots = {}
+        parameters = [
+            self.slot(parameter.variable.identifier.name)
+            for parameter in node.parameters
+        ]
+        name = f'f{self.indices[node.identifier.name]}'
+        self.function(name, parameters, node.body.children)
+        self.slots = None
+
+    def visit_FunctionCall(self, node):
+        """Visitor for `FunctionCall` AST node."""
+        name = node.identifier.name
+        arguments = [self.visit(parameter.variable)[0] for parameter in node.parameters]
+
+        if name in self.slots or name not in self.functions:
+            # Function passed in a variable, resolved at each call
+            arguments.insert(0, self.slot(name))
+            return f"call({', '.join(arguments)})", None
+        return f"f{self.indices[name]}({', '.join(arguments)})", None
+
+    def visit_VariableDeclaration(self, node):
+        """Visitor for `VariableDeclaration` AST node."""
+        if self.declared is not None:
+            self.declared.append(self.slot(node.assignment.left.identifier.name))
+        self.visit(node.assignment)
+
+    def visit_Assignment(self, node):
+        """Visitor for `Assignment` AST node."""
+        name = self.slot(node.left.identifier.name)
+        self.emit(f'{name} = {self.visit(node.right)[0]}')
+
+    def visit_Variable(self, node):
+        """Visitor for `Variable` AST node."""
+        return self.visit(node.identifier)
+
+    def condition(self, node):
+        """Translate the condition of a statement."""
+        source, kind = self.visit(node)
+        return source if kind == BOOLEAN else f'truth({source})'
+
+    def visit_IfStatement(self, node):
+        """Visitor for `IfStatement` AST node."""
+        keyword = 'if'
+        for condition, body in [node.if_compound] + list(node.else_if_compounds):
+            self.emit(f'{keyword} {self.condition(condition)}:')
+            self.visit(body)
+            keyword = 'elif'
+
+        if node.else_compound is not None:
+            self.emit('else:')
+            self.visit(node.else_compound[1])
+
+    def visit_WhileStatement(self, node):
+        """Visitor for `WhileStatement` AST node."""
+        self.emit(f'while {self.condition(node.condition)}:')
+        self.visit(node.compound)
+
+    def visit_Compound(self, node):
+        """Visitor for `Compound` AST node."""
+        self.declared, declared = [], self.declared
+        try:
+            self.block(node.children)
+            local_names = self.declared
+        finally:
+            self.declared = declared
+
+        # The variables declared in the block are released at its end
+        if local_names:
+            self.depth += 1
+            self.emit(' = '.join(local_names + ['UNDEFINED']))
+            self.depth -= 1
+
+    def visit_ReturnStatement(self, node):
+        """Visitor for `ReturnStatement` AST node."""
+        source = self.visit(node.expression)[0]
+        if not self.is_program:
+            self.emit(f'return {source}')
+        else:
+            self.emit(source)
+            self.emit('raise Leave')
+
+    def visit_BinaryOperation(self, node):
+        """Visitor for `BinaryOperation` AST node.
+
+        A chain of operations on left operands, such as `a + b - c`, is translated
+        iteratively. The source of an operand is written once, unless it is a simple
+        node repeated in a guarded form, so the source code grows linearly. The
+        operations applied by their helpers to simple right operands are given to a
+        single `chain` call, so the helper calls aren't nested deeper than Python
+        can parse.
+        """
+        if node.op.nature in (Nature.OR, Nature.AND):
+            return self.logical_operation(node)
+
+        operations = [node]
+        while (
+            isinstance(operations[-1].left, BinaryOperation)
+            and operations[-1].left.op.nature in BINARY_OPERATORS
+        ):
+            operations.append(operations[-1].left)
+
+        left, left_kind = self.visit(operations[-1].left)
+        is_simple = isinstance(operations[-1].left, SIMPLE_NODES)
+        chain = None
+
+        for operation in reversed(operations):
+            right, right_kind = self.visit(operation.right)
+            operator, helper, kind = BINARY_OPERATORS[operation.op.nature]
+            is_direct = left_kind == right_kind == NUMBER or (
+                left_kind == right_kind == BOOLEAN and helper in ('eq', 'ne')
+            )
+            is_chained = not is_direct and isinstance(operation.right, SIMPLE_NODES)
+
+            if chain is not None and not is_chained:
+                left, chain = self.chain(chain), None
+
+            if is_direct:
+                left = f'({left} {operator} {right})'
+            elif is_simple and isinstance(operation.right, SIMPLE_NODES):
+                operands = ((left, left_kind), (right, right_kind))
+                guards = [
+                    f'type({operand}) in NUMBERS'
+                    for operand, operand_kind in operands
+                    if operand_kind != NUMBER
+                ]
+                left = (
+                    f"({left} {operator} {right} if {' and '.join(guards)} "
+                    f"else {helper}({left}, {right}))"
+                )
+            elif is_chained:
+                chain = chain or [left]
+                chain.extend((helper, right))
+            else:
+                left = f'{helper}({left}, {right})'
+            # The arithmetic operations only give a number on numbers, not on arrays
+            if kind == NUMBER and not left_kind == right_kind == NUMBER:
+                kind = None
+            left_kind, is_simple = kind, False
+
+        if chain is not None:
+            left = self.chain(chain)
+        return left, left_kind
+
+    def chain(self, chain):
+        """Translate the operations of a chain, given after its first operand."""
+        if len(chain) == 3:
+            left, helper, right = chain
+            return f'{helper}({left}, {right})'
+        return f"chain({', '.join(chain)})"
+
+    def logical_operation(self, node):
+        """Translate an `or` or an `and` operation."""
+        left, left_kind = self.visit(node.left)
+        right, right_kind = self.visit(node.right)
+
+        operator = 'or' if node.op.nature == Nature.OR else 'and'
+        if left_kind != BOOLEAN:
+            left = f'truth({left})'
+        kind = left_kind if left_kind == right_kind else None
+        return f'({left} {operator} {right})', kind
+
+    def visit_UnaryOperation(self, node):
+        """Visitor for `UnaryOperation` AST node."""
+        source, kind = self.visit(node.right)
+        if node.op.nature == Nature.NOT:
+            if kind != BOOLEAN:
+                source = f'truth({source})'
+            return f'(not {source})', BOOLEAN
+
+        operator, helper = {Nature.PLUS: ('+', 'pos'), Nature.MINUS: ('-', 'neg')}[
+            node.op.nature
+        ]
+        if kind == NUMBER:
+            return f'({operator}{source})', NUMBER
+        return f'{helper}({source})', None
+
+    def visit_Identifier(self, node):
+        """Visitor for `Identifier` AST node."""
+        if node.name in self.functions and node.name not in self.slots:
+            return f'g{self.indices[node.name]}', None
+        return self.slot(node.name), None
+
+    def visit_Integer(self, node):
+        """Visitor for `Integer` AST node."""
+        return repr(int(node.value)), NUMBER
+
+    def visit_FloatingPoint(self, node):
+        """Visitor for `FloatingPoint` AST node."""
+        return literal(float(node.value)), NUMBER
+
+    def visit_Boolean(self, node):
+        """Visitor for `Boolean` AST node."""
+        return repr(node.value == 'true'), BOOLEAN
+
+    def visit_Constant(self, node):
+        """Visitor for `Constant` AST node."""
+        return literal(node.value), BOOLEAN if node.cls is Bool else NUMBER
+
+    def visit_ArrayLiteral(self, node):
+        """Visitor for `ArrayLiteral` AST node."""
+        elements = [self.visit(element)[0] for element in node.elements]
+        if node.size is not None:
+            return f'Array.filled({elements[0]}, {self.visit(node.size)[0]})', None
+        return f"Array([{', '.join(elements)}])", None
+
+    def visit_Subscript(self, node):
+        """Visitor for `Subscript` AST node."""
+        value, index = self.visit(node.value)[0], self.visit(node.index)[0]
+        return f'subscript({value}, {index})', None
+
+
+def returns(node):
+    """Return whether a statement contains a `return` statement."""
+    return isinstance(node, AST) and any(
+        isinstance(child, ReturnStatement) for child in walk(node)
+    )
+
+
+class ProgramEnd(object):
+    """Pseudo node of the end of the program."""
+
+    pass
+
+
+# Nodes translated into statements, the other ones into expressions
+STATEMENT_NODES = (
+    FunctionDeclaration,
+    VariableDeclaration,
+    Assignment,
+    IfStatement,
+    WhileStatement,
+    Compound,
+    ReturnStatement,
+    ProgramEnd,
+)
+
+
+#
+# Program Evaluation
+#
+
+
+class PythonInterpreter(object):
+    """Evaluation of the parsed input, translated into Python beforehand.
+
+    The source code given by `Transpiler` is compiled by Python and executed in a
+    namespace holding the runtime helpers and the functions. A program nested deeper
+    than Python can compile is evaluated by the interpreter instead.
+    """
+
+    def __init__(self, tree):
+        """Initialization of `PythonInterpreter` class."""
+        self.tree = tree
+        self.memory = Memory()
+        self.source = None
+
+    def interpret(self):
+        """Generic entrypoint of `PythonInterpreter` class."""
+        transpiler = Transpiler(self.tree)
+        self.source = transpiler.transpile()
+
+        namespace = dict(RUNTIME)
+        callables = {}
+        for name, function in transpiler.functions.items():
+            index = transpiler.indices[name]
+            namespace[f'g{index}'] = function
+            if not isinstance(function._node, AST):
+                namespace[f'f{index}'] = builtin(function._node)
+
+        def call(function, *args):
+            """Call a function passed in a variable."""
+            box(function)._node  # Raises the error of the values which aren't one
+            return callables[function.name](*args)
+
+        namespace['call'] = call
+        try:
+            code = compile(self.source, '<gibica>', 'exec')
+        except (SyntaxError, RecursionError):
+            # Nested deeper than Python can compile, e.g. in more than 20 loops
+            return self.fallback()
+        exec(code, namespace)
+        for name, function in transpiler.functions.items():
+            callables[name] = namespace[f'f{transpiler.indices[name]}']
+
+        try:
+            values = namespace['program']()
+        except ZeroDivisionError:
+            raise TypeError('Zero division error.')
+
+        for name, function in transpiler.functions.items():
+            self.memory[name] = function
+        for name, value in zip(transpiler.names, values):
+            if value is not UNDEFINED:
+                self.memory[name] = box(value)
+
+    def fallback(self):
+        """Evaluate the program with the interpreter, for a source Python rejects."""
+        interpreter = Interpreter(self.tree)
+        interpreter.interpret()
+        self.memory = interpreter.memory
@@ -1,12 +1,17 @@
 """Types module."""
 
+import math
+import operator
+
 from abc import ABC, abstractmethod
+from array import array
+from itertools import repeat
 from gibica.exceptions import ObjectError, TypeError
 
 
 def bind_type(python_value):
     """Return a Gibica type derived from a Python type."""
-    binding_table = {'bool': Bool, 'int': Int, 'float': Float}
+    binding_table = {'bool': Bool, 'int': Int, 'float': Float, 'array': Array}
 
     if python_value is None:
         return NoneType()
@@ -20,8 +25,36 @@ def bind_type(python_value):
     return gibica_type(python_value)
 
 
+def value_key(obj):
+    """Return a hashable key of an object by its type and value.
+
+    A float is also keyed by its sign, since `-0.0` equals `0.0` but is printed, and
+    gives results, with its own sign.
+    """
+    if type(obj) is Float:
+        return Float, obj.value, math.copysign(1.0, obj.value)
+    return type(obj), obj.value
+
+
+def new(cls, value):
+    """Return a new object of a class, holding a value."""
+    obj = object.__new__(cls)
+    object.__setattr__(obj, 'value', value)
+    return obj
+
+
 class AbstractObject(ABC):
-    """Abstract class for generic object."""
+    """Abstract class for generic object.
+
+    Objects have no instance dictionary: each class declares the slots of its
+    attributes. Objects are immutable, so the ones of the same value can be shared.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, key, value):
+        """Forbid the change of an attribute."""
+        raise ObjectError("Immutable object.")
 
     # Raises a custom `ObjectError` if the attribute or method doesn't exist
     def _object_error(self):
@@ -29,16 +62,19 @@ class AbstractObject(ABC):
         raise ObjectError("Unsupported method.")
 
     def __getattr__(self, name):
-        """Handle methods and attributes fetching."""
-        try:
-            return self.__getattribute__(name)
-        except AttributeError:
-            self._object_error()
+        """Handle the fetching of the missing methods and attributes."""
+        # Only called once the attribute isn't found; Python protocols probe the
+        # special methods, which must stay missing
+        if name.startswith('__'):
+            raise AttributeError(name)
+        self._object_error()
 
 
 class AbstractType(AbstractObject, ABC):
     """Abstract class for generic type."""
 
+    __slots__ = ()
+
     # Raises a custom `TypeError` if the operator is not overrided
     def _type_error(self):
         """Raise a `TypeError`."""
@@ -59,6 +95,8 @@ class AbstractType(AbstractObject, ABC):
         '__ge__',
         '__lt__',
         '__gt__',
+        '__getitem__',
+        '__len__',
     ):
         locals()[operator] = lambda self, *args, **kwargs: self._type_error()
 
@@ -70,6 +108,12 @@ class AbstractType(AbstractObject, ABC):
 class AbstractNumber(AbstractType, ABC):
     """Abstract class for generic number."""
 
+    __slots__ = ('value',)
+
+    def __reduce__(self):
+        """Pickle the object by value."""
+        return type(self), (self.value,)
+
     @abstractmethod
     def _handle_type(self, other):
         """Helper to handle the return type."""
@@ -77,19 +121,29 @@ class AbstractNumber(AbstractType, ABC):
 
     def __add__(self, other):
         """Handle the `+` operator."""
+        if isinstance(other, Array):
+            return other._apply(operator.add, self, reflected=True)
         return self._handle_type(other)(self.value + other.value)
 
     def __sub__(self, other):
         """Handle the `-` operator."""
+        if isinstance(other, Array):
+            return other._apply(operator.sub, self, reflected=True)
         return self._handle_type(other)(self.value - other.value)
 
     def __mul__(self, other):
         """Handle the `*` operator."""
+        if isinstance(other, Array):
+            return other._apply(operator.mul, self, reflected=True)
         return self._handle_type(other)(self.value * other.value)
 
     def __truediv__(self, other):
         """Handle the `/` operator."""
         try:
+            if isinstance(other, Array):
+                return other._apply(
+                    operator.truediv, self, FLOAT_TYPECODE, reflected=True
+                )
             return Float(self.value / other.value)
         except ZeroDivisionError:
             raise TypeError('Zero division error.')
@@ -143,9 +197,15 @@ class AbstractNumber(AbstractType, ABC):
 
 
 class NoneType(AbstractType):
-    def __init__(self):
-        """Initialization of `NoneType` class."""
-        pass
+    __slots__ = ()
+
+    def __new__(cls):
+        """Return the only `NoneType` object."""
+        return NONE
+
+    def __reduce__(self):
+        """Pickle the object by value."""
+        return NoneType, ()
 
     def __setattr__(self, key, value):
         raise TypeError("Impossible to set a set a NoneType.")
@@ -174,9 +234,15 @@ class NoneType(AbstractType):
 class Bool(AbstractType):
     """Representation of a `Boolean`."""
 
-    def __init__(self, value):
-        """Initialization of `Bool` class."""
-        self.value = bool(value)
+    __slots__ = ('value',)
+
+    def __new__(cls, value):
+        """Return the `true` or the `false` object."""
+        return TRUE if value else FALSE
+
+    def __reduce__(self):
+        """Pickle the object by value."""
+        return Bool, (self.value,)
 
     def __eq__(self, other):
         """Handle the `==` operator."""
@@ -208,6 +274,8 @@ class Bool(AbstractType):
 class Int(AbstractNumber):
     """Representation of an `Integer` number."""
 
+    __slots__ = ()
+
     def _handle_type(self, other):
         """Helper to handle the return type."""
         if isinstance(other, Int):
@@ -219,14 +287,20 @@ class Int(AbstractNumber):
                 f"Unsuported operation between `{type(self)}` and `{type(other)}`."
             )
 
-    def __init__(self, value):
-        """Initialization of `Int` class."""
-        self.value = int(value)
+    def __new__(cls, value):
+        """Return the object of an integer, shared if the integer is small."""
+        value = int(value)
+        obj = SMALL_INTS.get(value)
+        if obj is None or cls is not Int:
+            return new(cls, value)
+        return obj
 
 
 class Float(AbstractNumber):
     """Representation of a `Float` number."""
 
+    __slots__ = ()
+
     def _handle_type(self, other):
         """Helper to handle the return type."""
         if isinstance(other, Int):
@@ -238,18 +312,175 @@ class Float(AbstractNumber):
                 f"Unsuported operation between `{type(self)}` and `{type(other)}`."
             )
 
-    def __init__(self, value):
-        """Initialization of `Float` class."""
-        self.value = float(value)
+    def __new__(cls, value):
+        """Return the object of a floating point number."""
+        return new(cls, float(value))
+
+
+#
+# Arrays
+#
+
+# Typecodes of the storage of the arrays of integers and of floating point numbers
+INT_TYPECODE = 'q'
+FLOAT_TYPECODE = 'd'
+
+
+def storage(typecode, values):
+    """Return the contiguous storage of numbers, of a typecode."""
+    try:
+        return array(typecode, values)
+    except OverflowError:
+        raise TypeError('Integer overflow.')
+
+
+def pack(values):
+    """Return the contiguous storage of numbers, given as Python values or objects."""
+    typecode, numbers = INT_TYPECODE, []
+    for value in values:
+        if type(value) in (Int, Float):
+            value = value.value
+        if type(value) is float:
+            typecode = FLOAT_TYPECODE
+        elif type(value) is not int:
+            raise TypeError('Arrays only hold numbers.')
+        numbers.append(value)
+    return storage(typecode, numbers)
+
+
+class Array(AbstractType):
+    """Representation of an `Array` of numbers.
+
+    The numbers are stored contiguously in an `array.array`, as 64-bit integers or
+    floating point numbers, an integer out of bounds raising a `TypeError`. The
+    operations apply to all the elements in native loops and return a new array;
+    their other operand is an array of the same length, or a number, on either side,
+    applied to each element.
+    """
+
+    __slots__ = ('value',)
+
+    def __new__(cls, value):
+        """Return the array of a storage, or of numbers."""
+        if not isinstance(value, array):
+            value = pack(value)
+        return new(cls, value)
+
+    @classmethod
+    def filled(cls, element, size):
+        """Return the array of `size` copies of a number."""
+        if type(size) is Int:
+            size = size.value
+        if type(size) is not int or size < 0:
+            raise TypeError('Invalid array size.')
+        return cls(pack([element]) * size)
+
+    def __reduce__(self):
+        """Pickle the object by value."""
+        return Array, (self.value,)
+
+    def _apply(self, operator, other, typecode=None, reflected=False):
+        """Helper to apply an operator to the elements and the other operand.
+
+        With `reflected`, the other operand is the left operand of the operator.
+        """
+        if isinstance(other, Array):
+            if len(other.value) != len(self.value):
+                raise TypeError('Mismatch between array lengths.')
+            operands = other.value
+            other_typecode = other.value.typecode
+        elif type(other) in (Int, Float):
+            operands = repeat(other.value, len(self.value))
+            other_typecode = FLOAT_TYPECODE if type(other) is Float else INT_TYPECODE
+        else:
+            raise TypeError(
+                f"Unsuported operation between `{type(self)}` and `{type(other)}`."
+            )
+
+        if typecode is None:
+            typecodes = (self.value.typecode, other_typecode)
+            typecode = FLOAT_TYPECODE if FLOAT_TYPECODE in typecodes else INT_TYPECODE
+        if reflected:
+            return Array(storage(typecode, map(operator, operands, self.value)))
+        return Array(storage(typecode, map(operator, self.value, operands)))
+
+    def __add__(self, other):
+        """Handle the `+` operator."""
+        return self._apply(operator.add, other)
+
+    def __sub__(self, other):
+        """Handle the `-` operator."""
+        return self._apply(operator.sub, other)
+
+    def __mul__(self, other):
+        """Handle the `*` operator."""
+        return self._apply(operator.mul, other)
+
+    def __truediv__(self, other):
+        """Handle the `/` operator."""
+        try:
+            return self._apply(operator.truediv, other, FLOAT_TYPECODE)
+        except ZeroDivisionError:
+            raise TypeError('Zero division error.')
+
+    def __pos__(self):
+        """Handle the unary `+` operator."""
+        return self
+
+    def __neg__(self):
+        """Handle the unary `-` operator."""
+        return Array(storage(self.value.typecode, map(operator.neg, self.value)))
+
+    def __eq__(self, other):
+        """Handle the `==` operator."""
+        if isinstance(other, Array):
+            return Bool(self.value == other.value)
+        else:
+            raise self._type_error()
+
+    def __ne__(self, other):
+        """Handle the `!=` operator."""
+        if isinstance(other, Array):
+            return Bool(self.value != other.value)
+        else:
+            raise self._type_error()
+
+    def __getitem__(self, index):
+        """Handle the indexing of an element."""
+        if type(index) is not Int:
+            raise TypeError('Array indices must be integers.')
+        if not 0 <= index.value < len(self.value):
+            raise TypeError('Array index out of range.')
+
+        element = self.value[index.value]
+        return Int(element) if self.value.typecode == INT_TYPECODE else Float(element)
+
+    def __len__(self):
+        """Return the number of elements."""
+        return len(self.value)
+
+    def __str__(self):
+        """String representation of an array."""
+        return '[{}]'.format(', '.join(str(element) for element in self.value))
+
+    def __repr__(self):
+        """String representation of the class."""
+        return self.__str__()  # pragma: no cover
 
 
 class Function(AbstractType):
     """Representation of a function."""
 
+    __slots__ = ('name', '_node')
+
     def __init__(self, name, node=None):
         """Initialization of `Function` class."""
-        self.name = name
-        self._node = node
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, '_node', node)
+
+    def __reduce__(self):
+        """Pickle the object by value."""
+        return Function, (self.name, self._node)
 
     def __eq__(self, other):
         """Handle the `==` operator."""
@@ -266,3 +497,24 @@ class Function(AbstractType):
     def __repr__(self):
         """String representation of the class."""
         return self.__str__()  # pragma: no cover
+
+
+#
+# Shared Objects
+#
+
+NONE = object.__new__(NoneType)
+TRUE = new(Bool, True)
+FALSE = new(Bool, False)
+
+# Objects of the small integers, by value
+SMALL_INTS: dict = {}
+
+
+def cache_small_ints(low=-5, high=256):
+    """Share the objects of the integers from `low` to `high`, included."""
+    SMALL_INTS.clear()
+    SMALL_INTS.update((value, new(Int, value)) for value in range(low, high + 1))
+
+
+cache_small_ints()
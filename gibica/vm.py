@@ -0,0 +1,241 @@
+"""Virtual machine module."""
+
+from gibica.ast import AST
+from gibica.types import bind_type, NoneType, Bool, Array
+from gibica.memory import Memory
+from gibica.exceptions import InterpreterError
+from gibica.compiler import (
+    Compiler,
+    disassemble,
+    POP_TOP,
+    LOAD_CONST,
+    LOAD_FUNCTION,
+    LOAD_NONE,
+    LOAD_FAST,
+    STORE_FAST,
+    CLEAR_FAST,
+    BINARY_ADD,
+    BINARY_SUBTRACT,
+    BINARY_MULTIPLY,
+    BINARY_TRUE_DIVIDE,
+    BINARY_FLOOR_DIVIDE,
+    COMPARE_EQ,
+    COMPARE_NE,
+    COMPARE_LE,
+    COMPARE_GE,
+    COMPARE_LT,
+    COMPARE_GT,
+    UNARY_POSITIVE,
+    UNARY_NEGATIVE,
+    UNARY_NOT,
+    BUILD_ARRAY,
+    FILL_ARRAY,
+    BINARY_SUBSCRIPT,
+    JUMP,
+    POP_JUMP_IF_FALSE,
+    JUMP_IF_TRUE_OR_POP,
+    JUMP_IF_FALSE_OR_POP,
+    CALL_FUNCTION,
+    TAIL_CALL,
+    RETURN_VALUE,
+)
+
+
+#
+# Bytecode Evaluation
+#
+
+
+class VirtualMachine(object):
+    """Evaluation of the parsed input, compiled into bytecode beforehand.
+
+    The bytecode is run by a single loop on a stack of values: a call saves the
+    frame of the caller on a stack of frames instead of recursing, so the depth of
+    the recursion of the programs is only limited by the memory. A call in tail
+    position replaces the frame of the caller, so tail recursion runs in constant
+    space.
+    """
+
+    def __init__(self, tree):
+        """Initialization of `VirtualMachine` class."""
+        self.tree = tree
+        self.memory = Memory()
+        self.program = None
+        self.codes = {}
+        self.functions = {}
+
+    def compile(self):
+        """Compile the program and its functions into bytecode."""
+        compiler = Compiler(self.tree)
+        self.program = compiler.compile()
+        self.codes = compiler.codes
+        self.functions = compiler.functions
+
+    def disassemble(self):
+        """Return the disassembly of the functions and of the program."""
+        codes = list(self.codes.values()) + [self.program]
+        return '\n\n'.join(disassemble(code) for code in codes)
+
+    def execute(self, code):
+        """Run the code of the program, return the values of its variables."""
+        codes = self.codes
+        bytecode, constants = code.bytecode, code.constants
+        slots = [None] * len(code.names)
+        stack, frames = [], []
+        push, pop = stack.append, stack.pop
+        pc = 0
+
+        while True:
+            opcode, argument = bytecode[pc], bytecode[pc + 1]
+            pc += 2
+
+            if opcode == LOAD_FAST:
+                push(slots[argument])
+
+            elif opcode == LOAD_CONST:
+                push(constants[argument])
+
+            elif opcode == STORE_FAST:
+                slots[argument] = pop()
+
+            elif opcode == POP_JUMP_IF_FALSE:
+                if not pop():
+                    pc = argument
+
+            elif opcode == BINARY_ADD:
+                right = pop()
+                stack[-1] = stack[-1] + right
+
+            elif opcode == BINARY_SUBTRACT:
+                right = pop()
+                stack[-1] = stack[-1] - right
+
+            elif opcode == COMPARE_LE:
+                right = pop()
+                stack[-1] = stack[-1] <= right
+
+            elif opcode == COMPARE_LT:
+                right = pop()
+                stack[-1] = stack[-1] < right
+
+            elif opcode == CALL_FUNCTION or opcode == TAIL_CALL:
+                start = len(stack) - argument
+                function = stack[start - 1]
+                if function is None:
+                    raise InterpreterError('Function not declared.')
+
+                node = function._node
+                if isinstance(node, AST):
+                    callee = codes[function.name]
+                    arguments = stack[start:]
+                    arguments.extend([None] * (len(callee.names) - argument))
+                    del stack[start - 1 :]
+
+                    # A call in tail position returns to the caller of the caller
+                    if opcode == CALL_FUNCTION:
+                        frames.append((bytecode, constants, pc, slots))
+                    bytecode, constants, pc = callee.bytecode, callee.constants, 0
+                    slots = arguments
+                else:
+                    arguments = stack[start:]
+                    del stack[start - 1 :]
+                    push(bind_type(node(*arguments)))
+
+            elif opcode == RETURN_VALUE:
+                if not frames:
+                    return slots
+                value = pop()
+                bytecode, constants, pc, slots = frames.pop()
+                push(value)
+
+            elif opcode == LOAD_FUNCTION:
+                push(constants[argument])
+
+            elif opcode == JUMP:
+                pc = argument
+
+            elif opcode == POP_TOP:
+                pop()
+
+            elif opcode == BINARY_MULTIPLY:
+                right = pop()
+                stack[-1] = stack[-1] * right
+
+            elif opcode == BINARY_TRUE_DIVIDE:
+                right = pop()
+                stack[-1] = stack[-1] / right
+
+            elif opcode == BINARY_FLOOR_DIVIDE:
+                right = pop()
+                stack[-1] = stack[-1] // right
+
+            elif opcode == COMPARE_EQ:
+                right = pop()
+                stack[-1] = stack[-1] == right
+
+            elif opcode == COMPARE_NE:
+                right = pop()
+                stack[-1] = stack[-1] != right
+
+            elif opcode == COMPARE_GE:
+                right = pop()
+                stack[-1] = stack[-1] >= right
+
+            elif opcode == COMPARE_GT:
+                right = pop()
+                stack[-1] = stack[-1] > right
+
+            elif opcode == JUMP_IF_TRUE_OR_POP:
+                if stack[-1]:
+                    pc = argument
+                else:
+                    pop()
+
+            elif opcode == JUMP_IF_FALSE_OR_POP:
+                if not stack[-1]:
+                    pc = argument
+                else:
+                    pop()
+
+            elif opcode == UNARY_POSITIVE:
+                stack[-1] = +stack[-1]
+
+            elif opcode == UNARY_NEGATIVE:
+                stack[-1] = -stack[-1]
+
+            elif opcode == UNARY_NOT:
+                stack[-1] = Bool(not stack[-1])
+
+            elif opcode == BINARY_SUBSCRIPT:
+                index = pop()
+                stack[-1] = stack[-1][index]
+
+            elif opcode == BUILD_ARRAY:
+                start = len(stack) - argument
+                elements = stack[start:]
+                del stack[start:]
+                push(Array(elements))
+
+            elif opcode == FILL_ARRAY:
+                size = pop()
+                stack[-1] = Array.filled(stack[-1], size)
+
+            elif opcode == CLEAR_FAST:
+                slots[argument] = None
+
+            elif opcode == LOAD_NONE:
+                push(NoneType())
+
+            else:
+                raise InterpreterError(f'Invalid opcode `{opcode}`.')
+
+    def interpret(self):
+        """Generic entrypoint of `VirtualMachine` class."""
+        self.compile()
+        slots = self.execute(self.program)
+
+        for name, function in self.functions.items():
+            self.memory[name] = function
+        for name, value in zip(self.program.names, slots):
+            if value is not None:
+                self.memory[name] = value
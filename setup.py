@@ -30,6 +30,6 @@ setup(
     install_requires=["click"],
     entry_points="""
         [console_scripts]
-        gibica=gibica.entrypoint:main
+        gibica=gibica.launcher:launch
     """,
 )
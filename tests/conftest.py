@@ -6,32 +6,53 @@ from gibica.lexer import Lexer
 from gibica.parser import Parser
 from gibica.ast import AST
 from gibica.sementic import SymbolTableBuilder
+from gibica.optimizer import Optimizer
 from gibica.memory import Memory
 from gibica.interpreter import Interpreter
+from gibica.closure import ClosureInterpreter
+from gibica.vm import VirtualMachine
+from gibica.transpiler import PythonInterpreter
 from gibica.exceptions import ObjectError
 
 
-@pytest.fixture
-def evaluate():
-    """Interpret a raw input."""
+def interpret(raw, engine):
+    """Interpret a raw input with an engine, return the engine."""
 
-    def nested(raw, skip_builtins=False):
-        """Actual processing."""
+    # Lexical analysis
+    lexer = Lexer(raw)
 
-        # Lexical analysis
-        lexer = Lexer(raw)
+    # Syntax analysis
+    parser = Parser(lexer)
+    tree = parser.parse()
 
-        # Syntax analysis
-        parser = Parser(lexer)
-        tree = parser.parse()
+    # Sementic analysis
+    symtab_builder = SymbolTableBuilder(tree)
+    symtab_builder.build()
 
-        # Sementic analysis
-        symtab_builder = SymbolTableBuilder(tree)
-        symtab_builder.build()
+    # Optimization
+    tree = Optimizer(tree).optimize()
 
-        # Program evaluation
-        interpreter = Interpreter(tree)
-        interpreter.interpret()
+    # Program evaluation
+    interpreter = engine(tree)
+    interpreter.interpret()
+    return interpreter
+
+
+@pytest.fixture
+def run():
+    """Interpret a raw input with a given engine."""
+    return interpret
+
+
+@pytest.fixture(
+    params=[Interpreter, ClosureInterpreter, VirtualMachine, PythonInterpreter]
+)
+def evaluate(request):
+    """Interpret a raw input with each engine."""
+
+    def nested(raw, skip_builtins=False):
+        """Actual processing."""
+        interpreter = interpret(raw, request.param)
 
         # Skip built-in functions in the memory
         memory_without_builtins = dict()
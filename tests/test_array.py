@@ -0,0 +1,207 @@
+"""Test: array."""
+
+import pickle
+
+import pytest
+
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica.ast import ArrayLiteral, Subscript
+from gibica.types import Int, Float, Bool, Array
+from gibica.exceptions import SementicError, SyntaxError, TypeError
+
+
+@pytest.mark.parametrize(
+    'input, expected',
+    [
+        ('let a = [1, 2, 3];', {'a': Array([1, 2, 3])}),
+        ('let a = [1, 2.5];', {'a': Array([1.0, 2.5])}),
+        ('let a = [];', {'a': Array([])}),
+        ('let a = [0.5; 3];', {'a': Array([0.5, 0.5, 0.5])}),
+        ('let n = 2; let a = [n * 2; n + 1];', {'n': Int(2), 'a': Array([4, 4, 4])}),
+        ('let a = [1, 2] + [3, 4];', {'a': Array([4, 6])}),
+        ('let a = [1, 2] - [3.5, 4];', {'a': Array([-2.5, -2.0])}),
+        ('let a = [1, 2] * [3, 4];', {'a': Array([3, 8])}),
+        ('let a = [1, 2] / [4, 4];', {'a': Array([0.25, 0.5])}),
+        ('let a = [1, 2] * 3;', {'a': Array([3, 6])}),
+        ('let a = [1, 2] + 0.5;', {'a': Array([1.5, 2.5])}),
+        ('let a = [1, 2] - 0;', {'a': Array([1, 2])}),
+        ('let a = -[1, 2];', {'a': Array([-1, -2])}),
+        ('let a = 2 * [1, 2];', {'a': Array([2, 4])}),
+        ('let a = 1 - [1, 2.5];', {'a': Array([0.0, -1.5])}),
+        ('let a = 0.5 + [1, 2];', {'a': Array([1.5, 2.5])}),
+        ('let a = 1 / [2, 4];', {'a': Array([0.5, 0.25])}),
+        ('let a = [1, 2]; let b = 10 - 2 * a + 1;', {'b': Array([9, 7])}),
+        ('let a = [1, 2] == [1.0, 2.0];', {'a': Bool(True)}),
+        ('let a = [1, 2] != [1, 2, 3];', {'a': Bool(True)}),
+        ('let a = [1, 2, 3]; let b = a[1];', {'a': Array([1, 2, 3]), 'b': Int(2)}),
+        ('let a = [1.5, 2][0] + 1;', {'a': Float(2.5)}),
+        ('let a = ([1, 2] * 2)[1];', {'a': Int(4)}),
+        ('let a = len([0; 1000]);', {'a': Int(1000)}),
+        ('let a = [1, 2]; let b = (a + 1) * 2;', {'b': Array([4, 6])}),
+        ('let a = [1, 2]; let b = a * 2 + 1;', {'b': Array([3, 5])}),
+        ('let a = [1, 2]; let b = sum(a * 2 - 1);', {'b': Int(4)}),
+        ('let a = [1, 2]; let b = -(a - 1) * 3;', {'b': Array([0, -3])}),
+        ('let a = [1, 2]; let b = +a / 2 + [1, 1] * 0.5;', {'b': Array([1.0, 1.5])}),
+        (
+            'def f(v) { return v[0] + v[len(v) - 1]; } let a = f([1, 2, 3]);',
+            {'a': Int(4)},
+        ),
+        (
+            """
+            let a = [1, 2, 3];
+            let mut total = 0;
+            let mut i = 0;
+            while i < len(a) {
+                total = total + a[i];
+                i = i + 1;
+            }
+            """,
+            {'a': Array([1, 2, 3]), 'total': Int(6), 'i': Int(3)},
+        ),
+    ],
+)
+def test_array(evaluate, input, expected):
+    """Test the arrays, their operations and their elements."""
+    instance = evaluate(input, skip_builtins=True)
+
+    for name, value in expected.items():
+        assert type(instance.memory[name]) is type(value)
+        assert instance.memory[name] == value
+
+
+@pytest.mark.parametrize(
+    'input, message',
+    [
+        ('let a = [1, true];', 'Arrays only hold numbers.'),
+        ('let a = [[1]];', 'Arrays only hold numbers.'),
+        ('let a = [1; 2.0];', 'Invalid array size.'),
+        ('let a = [1; -1];', 'Invalid array size.'),
+        ('let a = [1, 2] + [1];', 'Mismatch between array lengths.'),
+        ('let a = [1, 2] / 0;', 'Zero division error.'),
+        ('let a = [1, 2]; let b = (a + 1) / 0;', 'Zero division error.'),
+        ('let a = [1, 2][2];', 'Array index out of range.'),
+        ('let a = [1, 2][-1];', 'Array index out of range.'),
+        ('let a = [1, 2][0.0];', 'Array indices must be integers.'),
+        ('let a = [9223372036854775807] + 1;', 'Integer overflow.'),
+        ('let a = [9223372036854775808];', 'Integer overflow.'),
+        ('let a = [-9223372036854775809, 1];', 'Integer overflow.'),
+        ('let a = [9223372036854775808; 2];', 'Integer overflow.'),
+        ('let a = [9223372036854775807] * 2;', 'Integer overflow.'),
+        ('let a = 2 * [9223372036854775807];', 'Integer overflow.'),
+        ('let a = -[-9223372036854775808];', 'Integer overflow.'),
+        ('let a = [1] - 9223372036854775810;', 'Integer overflow.'),
+        ('let a = [4611686018427387904] + [4611686018427387904];', 'Integer overflow.'),
+        ('let a = 1; let b = a[0];', 'Unsupported operation.'),
+        ('let a = len(1);', 'Unsupported operation.'),
+        ('let a = [1] == 1;', 'Unsupported operation.'),
+        ('if [1] { }', 'Unsupported operation.'),
+        ('let a = 2 / [1, 0];', 'Zero division error.'),
+        ('let a = true + [1];', 'Unsupported operation.'),
+        (
+            'let a = [1] + true;',
+            "Unsuported operation between `<class 'gibica.types.Array'>` and "
+            "`<class 'gibica.types.Bool'>`.",
+        ),
+    ],
+)
+def test_array_errors(evaluate, input, message):
+    """Test the type errors of the arrays."""
+    with pytest.raises(TypeError) as error:
+        evaluate(input)
+    assert str(error.value) == message
+
+
+@pytest.mark.parametrize(
+    'input, expected',
+    [
+        ('let a = sum([1, 2, 3]);', Int(6)),
+        ('let a = sum([0.5, 1]);', Float(1.5)),
+        ('let a = sum([]);', Int(0)),
+        ('let a = sum([9223372036854775807, 1]);', Int(9223372036854775808)),
+        ('let a = min([3, 1, 2]);', Int(1)),
+        ('let a = max([3, 1.5, 2]);', Float(3.0)),
+        ('let a = mean([1, 2]);', Float(1.5)),
+        ('let a = dot([1, 2], [3, 4]);', Int(11)),
+        ('let a = dot([0.5; 4], [1, 2, 3, 4]);', Float(5.0)),
+        ('let v = [3, 4]; let a = dot(v, v) - sum(v * v);', Int(0)),
+    ],
+)
+def test_reductions(evaluate, input, expected):
+    """Test the reductions of the arrays by the built-in functions."""
+    value = evaluate(input).memory['a']
+    assert type(value) is type(expected)
+    assert value == expected
+
+
+@pytest.mark.parametrize(
+    'input, message',
+    [
+        ('let a = min([]);', 'Empty array.'),
+        ('let a = max([]);', 'Empty array.'),
+        ('let a = mean([]);', 'Empty array.'),
+        ('let a = dot([1], [1, 2]);', 'Mismatch between array lengths.'),
+        ('let a = sum(1);', 'Unsupported operation.'),
+        ('let a = dot([1], 1.5);', 'Unsupported operation.'),
+    ],
+)
+def test_reduction_errors(evaluate, input, message):
+    """Test the type errors of the reductions."""
+    with pytest.raises(TypeError) as error:
+        evaluate(input)
+    assert str(error.value) == message
+
+
+@pytest.mark.parametrize(
+    'input, output',
+    [
+        ('let len = 3; print(len);', '3\n'),
+        ('let n = len([1, 2]); let mut len = n; len = len + 1; print(len);', '3\n'),
+        ('def dot(a, b) { return a + b; } print(dot(1, 2));', '3\n'),
+        (
+            'def f(dot) { return dot * 2; } print(f([1, 2]), dot([1], [2]));',
+            '[2, 4] 2\n',
+        ),
+    ],
+)
+def test_shadowed_builtins(evaluate, capsys, input, output):
+    """Test the variables and functions declared with the name of `len` or `dot`."""
+    evaluate(input)
+
+    assert capsys.readouterr().out == output
+
+
+def test_array_syntax():
+    """Test the parsing of the array literals and of the subscripts."""
+    tree = Parser(Lexer('let a = [1, 2][0][1]; let b = [0; 4];')).parse()
+
+    subscript = tree.children[0].assignment.right
+    assert isinstance(subscript, Subscript) and isinstance(subscript.value, Subscript)
+    assert isinstance(subscript.value.value, ArrayLiteral)
+    assert len(subscript.value.value.elements) == 2
+
+    literal = tree.children[1].assignment.right
+    assert len(literal.elements) == 1 and literal.size.value == '4'
+
+    for input in ('let a = [1 2];', 'let a = [1; 2; 3];', 'let a = [1, 2;'):
+        with pytest.raises(SyntaxError):
+            Parser(Lexer(input)).parse()
+
+
+def test_array_assignment(evaluate):
+    """Test that the elements of an array can't be assigned."""
+    with pytest.raises(SementicError):
+        evaluate('let mut a = [1, 2]; a[0] = 3;')
+
+
+def test_array_storage():
+    """Test the contiguous storage of the arrays."""
+    assert Array([1, 2]).value.typecode == 'q'
+    assert Array([1, Float(2.0)]).value.typecode == 'd'
+    assert (Array([1, 2]) / Int(1)).value.typecode == 'd'
+    assert Array.filled(Int(7), 3).value.tolist() == [7, 7, 7]
+
+    array = Array([1.5, 2.5])
+    assert array[Int(1)] == Float(2.5)
+    assert pickle.loads(pickle.dumps(array)) == array
+    assert str(Array([1, 2])) == '[1, 2]'
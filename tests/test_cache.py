@@ -0,0 +1,182 @@
+"""Test: cache."""
+
+import os
+import pickle
+import threading
+
+import pytest
+
+from click.testing import CliRunner
+from gibica import cache, entrypoint, parser
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica.ast import Integer, dump, walk
+from gibica.cache import Cache, dumps, loads
+
+
+SOURCE = """\
+def f(mut n) {
+    if n <= 1 { return n; } else if n == 2 { return 1; } else { n = n - 1; }
+    return f(n) + f(n - 1) * 2.5 // -1;
+}
+let mut a = not true or false;
+while a { a = false; }
+print(f(10));
+"""
+
+
+def test_serialization():
+    """Test that a serialized AST is deserialized as the same AST."""
+    tree = Parser(Lexer(SOURCE)).parse()
+    cached = loads(dumps(tree))
+
+    assert dump(cached) == dump(tree)
+    assert cached.lines is None
+
+    # The tokens of a lexeme are still shared
+    tokens = [node.token for node in walk(cached) if isinstance(node, Integer)]
+    assert len(tokens) == 7
+    assert len({id(token) for token in tokens if token.value == '1'}) == 1
+
+
+def test_cache(tmpdir, monkeypatch):
+    """Test the validity of the cache files."""
+    script = tmpdir.join('script.gbc')
+    script.write(SOURCE)
+    tree = Parser(Lexer(SOURCE)).parse()
+
+    cache_file = Cache(str(script))
+    assert cache_file.path == str(tmpdir.join('__gbccache__', 'script.gbcc'))
+    assert cache_file.load() is None
+
+    cache_file.store(tree)
+    assert dump(Cache(str(script)).load()) == dump(tree)
+
+    # Stored in a given directory
+    directory = tmpdir.join('cache')
+    Cache(str(script), str(directory)).store(tree)
+    assert directory.join('script.gbcc').check()
+
+    # Invalidated by an interpreter update
+    monkeypatch.setattr(cache, '__version__', '0.0.0')
+    assert Cache(str(script)).load() is None
+    monkeypatch.undo()
+
+    # Invalidated by a change of the script
+    script.write(SOURCE + '\n')
+    assert Cache(str(script)).load() is None
+
+    # Ignored when corrupted
+    script.write(SOURCE)
+    cache_file = Cache(str(script))
+    with open(cache_file.path, 'r+b') as file:
+        file.truncate(os.path.getsize(cache_file.path) - 8)
+    assert cache_file.load() is None
+
+
+class Payload(object):
+    """Object calling a function when unpickled."""
+
+    def __reduce__(self):
+        """Pickle the object as a call."""
+        return os.system, ('echo forged',)
+
+
+@pytest.mark.parametrize(
+    'obj', [Payload(), 1, Parser(Lexer('let a = 1;')).parse().children]
+)
+def test_forged_cache(tmpdir, capfd, obj):
+    """Test that a cache file holding anything but an AST is ignored."""
+    script = tmpdir.join('script.gbc')
+    script.write(SOURCE)
+
+    cache_file = Cache(str(script))
+    os.makedirs(os.path.dirname(cache_file.path))
+    with open(cache_file.path, 'wb') as file:
+        file.write(cache_file.header + pickle.dumps(obj))
+
+    assert cache_file.load() is None
+    assert 'forged' not in capfd.readouterr().out
+
+    with pytest.raises(pickle.UnpicklingError):
+        loads(pickle.dumps(obj))
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    """Record the scripts parsed by the CLI."""
+    scripts = []
+
+    class RecordingParser(Parser):
+        """Parser recording its parses."""
+
+        def parse(self):
+            """Record the parse."""
+            scripts.append(self)
+            return super().parse()
+
+    monkeypatch.setattr(parser, 'Parser', RecordingParser)
+    return scripts
+
+
+@pytest.mark.parametrize('options', [[], ['--cache-dir', 'cache']])
+def test_cli_cache(options, tmpdir, monkeypatch, parsed):
+    """Test of the CLI behavior with a cached script."""
+    monkeypatch.chdir(tmpdir)
+    tmpdir.join('script.gbc').write('let a = 2; print(a + 1);')
+    directory = tmpdir.join(*(options[1:] or ['__gbccache__']))
+
+    runner = CliRunner()
+    result = runner.invoke(entrypoint.main, ['script.gbc'] + options)
+    assert result.output == '3\n'
+    assert directory.join('script.gbcc').check()
+    assert len(parsed) == 1
+
+    # The variables of the cached AST are already resolved
+    assert Cache('script.gbc', *options[1:]).load().names == ('a',)
+
+    # The script is no longer parsed
+    result = runner.invoke(entrypoint.main, ['script.gbc'] + options)
+    assert result.output == '3\n'
+    assert len(parsed) == 1
+
+    # Unless the cache is refreshed
+    result = runner.invoke(entrypoint.main, ['script.gbc', '--refresh-cache'] + options)
+    assert result.output == '3\n'
+    assert len(parsed) == 2
+
+    # Or the script changes
+    tmpdir.join('script.gbc').write('let a = 2; print(a + 2);')
+    result = runner.invoke(entrypoint.main, ['script.gbc'] + options)
+    assert result.output == '4\n'
+    assert len(parsed) == 3
+
+
+def test_cli_no_cache(tmpdir, monkeypatch, parsed):
+    """Test of the CLI behavior with the cache disabled."""
+    monkeypatch.chdir(tmpdir)
+    tmpdir.join('script.gbc').write('let a = 2; print(a + 1);')
+
+    for _ in range(2):
+        result = CliRunner().invoke(entrypoint.main, ['script.gbc', '--no-cache'])
+        assert result.output == '3\n'
+    assert len(parsed) == 2
+    assert not tmpdir.join('__gbccache__').check()
+
+
+def test_cli_pipe(tmpdir, monkeypatch):
+    """Test that a script read from a pipe isn't cached, so it's only read once."""
+    monkeypatch.chdir(tmpdir)
+    os.mkfifo('script.gbc')
+
+    def write():
+        with open('script.gbc', 'w') as fifo:
+            fifo.write('print(42);')
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    result = CliRunner().invoke(entrypoint.main, ['script.gbc'])
+    writer.join()
+
+    assert result.output == '42\n'
+    assert not tmpdir.join('__gbccache__').check()
@@ -1,5 +1,8 @@
 """Test: CLI."""
 
+import sys
+import subprocess
+
 import pytest
 
 from click.testing import CliRunner
@@ -46,6 +49,151 @@ def test_cli_debug(runner):
         result = runner.invoke(main, ['script.gbc', '--debug'])
         assert result.exit_code == 0
         assert result.output == (
-            "SYMBOL TABLE: [[<func:print>, <a>, <b:mut>]]\n"
-            "GLOBAL MEMORY: [[{'print': print, 'a': 2, 'b': 3}]]\n"
+            "SYMBOL TABLE: [[<func:dot>, <func:len>, <func:max>, <func:mean>, "
+            "<func:min>, <func:print>, <func:sum>, <a>, <b:mut>]]\n"
+            "GLOBAL MEMORY: [[{'dot': dot, 'len': len, 'max': max, 'mean': mean, "
+            "'min': min, 'print': print, 'sum': sum, 'a': 2, 'b': 3}]]\n"
+        )
+
+
+@pytest.mark.parametrize(
+    'script, output',
+    [
+        ('let a = 2; print(a + 1);', '3\n'),
+        ('let été = 2; print(été); # ünïcödé', '2\n'),
+        ('', ''),
+        (
+            'let a = 2 $ 1;',
+            'LexicalError: Invalid character `$` at line 1, column 11.\n',
+        ),
+        (
+            'let ééé = 1 + ;',
+            'SyntaxError: Unable to process `Token(Nature.SEMI, ";")` '
+            'at line 1, column 15.\n',
+        ),
+        (
+            'let é = 1;\nlet ü = é $ 1;',
+            'LexicalError: Invalid character `$` at line 2, column 11.\n',
+        ),
+    ],
+)
+def test_cli_mmap(runner, script, output):
+    """Test of the CLI behavior with a memory-mapped script."""
+
+    with runner.isolated_filesystem():
+        with open('script.gbc', 'w', encoding='utf-8') as f:
+            f.write(script)
+
+        result = runner.invoke(main, ['script.gbc', '--mmap'])
+        assert result.exit_code == 0
+        assert result.output == output
+
+
+@pytest.mark.parametrize('options', [['--jobs', '2'], ['--jobs', '2', '--mmap']])
+def test_cli_jobs(runner, options):
+    """Test of the CLI behavior with a script parsed in parallel."""
+
+    with runner.isolated_filesystem():
+        with open('script.gbc', 'w') as f:
+            f.write('def f(n) { return n * 2; }\nlet a = f(2);\nprint(a);')
+
+        result = runner.invoke(main, ['script.gbc'] + options)
+        assert result.exit_code == 0
+        assert result.output == '4\n'
+
+        with open('script.gbc', 'a') as f:
+            f.write('\nlet c = b;')
+
+        result = runner.invoke(main, ['script.gbc'] + options)
+        assert result.exit_code == 0
+        assert result.output == (
+            'SementicError: Variable `b` is not declared at line 4, column 9.\n'
+        )
+
+
+@pytest.mark.parametrize('options', [['--jobs', '2'], ['--jobs', '2', '--mmap']])
+def test_cli_jobs_arrays(runner, options):
+    """Test of the CLI behavior with arrays of copies parsed in parallel."""
+
+    with runner.isolated_filesystem():
+        with open('script.gbc', 'w') as f:
+            f.write('let a = [0; 3];\nprint(a);\nlet b = [1.5; 2] * 2;\nprint(b);')
+
+        result = runner.invoke(main, ['script.gbc'] + options)
+        assert result.exit_code == 0
+        assert result.output == '[0, 0, 0]\n[3.0, 3.0]\n'
+
+
+
+@pytest.mark.parametrize('engine', ['interpreter', 'closure', 'vm', 'python'])
+def test_cli_engine(runner, engine):
+    """Test of the CLI behavior with each engine."""
+
+    with runner.isolated_filesystem():
+        with open('script.gbc', 'w') as f:
+            f.write('def f(n) { return n * 2; }\nlet a = f(2);\nprint(a);')
+
+        result = runner.invoke(main, ['script.gbc', '--engine', engine, '--debug'])
+        assert result.exit_code == 0
+        assert result.output.splitlines()[0] == '4'
+        assert result.output.splitlines()[2] == (
+            "GLOBAL MEMORY: [[{'dot': dot, 'len': len, 'max': max, 'mean': mean, "
+            "'min': min, 'print': print, 'sum': sum, 'f': f, 'a': 4}]]"
+        )
+
+
+LAUNCH = """
+import sys
+sys.argv = ['gibica'] + sys.argv[1:]
+from gibica.launcher import launch
+try:
+    launch()
+except SystemExit:
+    pass
+print(' '.join(sorted(sys.modules)))
+"""
+
+
+def test_launcher_imports(tmpdir):
+    """Test that a script run without options only imports what it needs."""
+    script = tmpdir.join('script.gbc')
+    script.write('print(1);')
+
+    def launch(*arguments):
+        result = subprocess.run(
+            [sys.executable, '-c', LAUNCH, str(script)] + list(arguments),
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
         )
+        output, modules = result.stdout.rsplit('\n', 2)[:2]
+        assert output == '1'
+        return set(modules.split())
+
+    front_end = {
+        'gibica.lexer',
+        'gibica.parser',
+        'gibica.sementic',
+        'gibica.optimizer',
+        'gibica.resolver',
+    }
+    optional = {
+        'click',
+        'gibica.entrypoint',
+        'gibica.parallel',
+        'gibica.closure',
+        'gibica.vm',
+        'gibica.transpiler',
+    }
+
+    modules = launch()
+    assert front_end <= modules
+    assert not optional & modules
+
+    # The cached script isn't analysed again
+    modules = launch()
+    assert not (front_end | optional) & modules
+
+    # The command line interface handles the options
+    modules = launch('--no-cache')
+    assert front_end | {'click', 'gibica.entrypoint'} <= modules
@@ -0,0 +1,113 @@
+"""Test: engines."""
+
+import os
+
+import pytest
+
+from gibica.interpreter import Interpreter
+from gibica.exceptions import TypeError, ObjectError
+
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), os.pardir, 'examples')
+
+
+@pytest.mark.parametrize(
+    'input',
+    [
+        # A variable declared from another one keeps its value
+        'let mut a = 1; let b = a; a = 2; print(a, b);',
+        # Arguments are passed by value
+        'def f(mut n) { n = n + 1; } let a = 1; f(a); print(a);',
+        # Variables declared in a block are released at its end
+        """
+        let mut i = 0;
+        let mut s = 0;
+        while i < 3 {
+            let x = i * 2;
+            s = s + x;
+            i = i + 1;
+        }
+        print(i, s);
+        """,
+        # Functions are values
+        'def f() { return 1; } let g = f; print(g, f());',
+        'def f(n) { return n * 2; } def h(g, x) { return g(x); } print(h(f, 3));',
+        'def apply(g, x) { return g(x); } print(apply(print, 3));',
+        # A `return` out of a function only leaves its top-level statement
+        'let mut a = 1; while true { if a == 3 { return a; } a = a + 1; } print(a);',
+        """
+        def f(n) {
+            let mut i = 0;
+            while i < n {
+                if i == 3 {
+                    return i;
+                }
+                i = i + 1;
+            }
+        }
+        print(f(2), f(5));
+        """,
+        'let a = 7 / 2; let b = 7 // 2; let c = 7.0 // 2; let d = 1 + 2.5;',
+        'let a = 1 == 1.0; let b = 1 == true; let c = true != false; let d = -(-2);',
+        'def f() { } let a = f(); let b = a == f(); print(a, b);',
+        'let a = 1 < 2 and 2 < 1 or not false; print(a, 1.5, 3 * 1.5, -(1 + 2.5));',
+        """
+        def collatz(mut n) {
+            let mut steps = 0;
+            while n != 1 {
+                if n // 2 * 2 == n {
+                    n = n // 2;
+                } else {
+                    n = 3 * n + 1;
+                }
+                steps = steps + 1;
+            }
+            return steps;
+        }
+        let steps = collatz(27);
+        print(steps);
+        """,
+    ],
+)
+def test_same_behavior(evaluate, run, capsys, input):
+    """Test that the engines behave as the tree-walking interpreter."""
+    memory = run(input, Interpreter).memory
+    expected = {name: memory[name] for name in memory}
+    expected_output = capsys.readouterr().out
+
+    memory = evaluate(input).memory
+    assert {name: memory[name] for name in memory} == expected
+    assert capsys.readouterr().out == expected_output
+
+
+@pytest.mark.parametrize(
+    'input, exception, message',
+    [
+        ('let a = 1 / 0;', TypeError, 'Zero division error.'),
+        ('def f(n) { return n // 0; } let a = f(1.5);', TypeError, ''),
+        ('def f(n) { return n + 1; } let a = f(true);', TypeError, ''),
+        ('def f(n) { return 1 + n; } let a = f(true);', TypeError, ''),
+        ('def f(n) { return true == n; } let a = f(1);', TypeError, ''),
+        ('def f(n) { return -n; } let a = f(false);', TypeError, ''),
+        ('def f(n) { return not n; } let a = f(1);', TypeError, ''),
+        ('def f(n) { if n { } } f(1);', TypeError, ''),
+        ('def f(n) { while n or false { } } f(0);', TypeError, ''),
+        ('def f() { } let a = 1 < f();', ObjectError, ''),
+    ],
+)
+def test_same_errors(evaluate, run, input, exception, message):
+    """Test that the engines raise the errors of the tree-walking interpreter."""
+    with pytest.raises(exception) as expected:
+        run(input, Interpreter)
+
+    with pytest.raises(exception) as error:
+        evaluate(input)
+    assert str(error.value) == str(expected.value)
+    assert message in str(error.value)
+
+
+def test_example(evaluate, capsys):
+    """Test the engines on the examples."""
+    with open(os.path.join(EXAMPLES, 'fibonacci.gbc')) as file:
+        evaluate(file.read())
+    assert capsys.readouterr().out == '10946\n'
@@ -68,6 +68,34 @@ def test_invalid_operation_or_comparison(evaluate, input):
         evaluate(input)
 
 
+@pytest.mark.parametrize(
+    'input, message',
+    [
+        ('let b = true; let a = b + 1;', 'Unsupported operation.'),
+        ('let b = true; let a = -b;', 'Unsupported operation.'),
+        ('let b = 1; let a = not b;', 'Unsupported operation.'),
+        ('let b = 1; if b { }', 'Unsupported operation.'),
+        ('let b = 2; let a = b / (b - b);', 'Zero division error.'),
+        ('let b = 2.5; let a = b // (b - b);', 'Zero division error.'),
+        (
+            'let b = 1; let a = b * true;',
+            "Unsuported operation between `<class 'gibica.types.Int'>` and "
+            "`<class 'gibica.types.Bool'>`.",
+        ),
+        (
+            'let b = 1.5; let a = b - print(b);',
+            "Unsuported operation between `<class 'gibica.types.Float'>` and "
+            "`<class 'gibica.types.NoneType'>`.",
+        ),
+    ],
+)
+def test_type_error_messages(evaluate, capsys, input, message):
+    """Test the messages of the type errors of the operations on variables."""
+    with pytest.raises(TypeError) as error:
+        evaluate(input)
+    assert str(error.value) == message
+
+
 @pytest.mark.parametrize(
     'input, expected',
     [
@@ -83,6 +111,21 @@ def test_with_comments(evaluate, memory, input, expected):
     assert instance.memory == memory(expected)
 
 
+@pytest.mark.parametrize(
+    'input, output',
+    [
+        ('let a = true or print(1);', ''),
+        ('let a = false and print(1);', ''),
+        ('let a = false or print(1);', '1\n'),
+        ('let a = true and print(1);', '1\n'),
+    ],
+)
+def test_short_circuit(evaluate, capsys, input, output):
+    """Test that `or` and `and` only evaluate their right operand if needed."""
+    evaluate(input)
+    assert capsys.readouterr().out == output
+
+
 @pytest.mark.parametrize('input', ['let a = 1/0;', 'let a = 1//0;'])
 def test_zero_division_error(evaluate, input):
     """Test a division by zero."""
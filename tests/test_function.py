@@ -311,7 +311,18 @@ def test_recursive_function(evaluate, memory, input, expected):
     assert instance.memory == memory(expected)
 
 
-@pytest.mark.parametrize('input, expected', [("", {'print': Function('print')})])
+@pytest.mark.parametrize(
+    'input, expected',
+    [
+        (
+            "",
+            {
+                name: Function(name)
+                for name in ('dot', 'len', 'max', 'mean', 'min', 'print', 'sum')
+            },
+        )
+    ],
+)
 def test_only_builtins(evaluate, memory, input, expected):
     """Test a program with only builtins functions."""
     instance = evaluate(input, skip_builtins=False)
@@ -337,6 +348,40 @@ def test_nonetype_function(evaluate, memory, input, expected):
     assert instance.memory == memory(expected)
 
 
+@pytest.mark.parametrize(
+    'input, output',
+    [
+        ('let mut sum = 0; sum = sum + 1; print(sum);', '1\n'),
+        ('print(sum([1, 2])); let sum = 5; print(sum);', '3\n5\n'),
+        ('def max(a, b) { if a > b { return a; } return b; } print(max(1, 2));', '2\n'),
+        ('print(max(1, 2)); def max(a, b) { return a - b; }', '-1\n'),
+        ('def f(mean) { return mean + 1; } print(f(1));', '2\n'),
+        ('def f(x) { let min = x; return min; } print(f(4), min([1, 2]));', '4 1\n'),
+        ('def f(v) { return sum(v); } let sum = 1; print(f([2, 3]), sum);', '5 1\n'),
+    ],
+)
+def test_shadowed_builtins(evaluate, capsys, input, output):
+    """Test the variables and functions declared with the name of a builtin."""
+    evaluate(input)
+
+    assert capsys.readouterr().out == output
+
+
+@pytest.mark.parametrize(
+    'input',
+    [
+        'def f() { return x; } let x = 1; print(f());',
+        'def f() { return y; } print(f());',
+        'def f() { return y; } def g() { return f(); } print(g());',
+    ],
+)
+def test_return_unset_variable(evaluate, capsys, input):
+    """Test a function returning a variable without value, the same on all engines."""
+    evaluate(input)
+
+    assert capsys.readouterr().out == 'None\n'
+
+
 @pytest.mark.parametrize('input', ['let result = zero();'])
 def test_function_not_declared(evaluate, input):
     """Test the call of an undeclared function."""
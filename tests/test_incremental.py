@@ -0,0 +1,117 @@
+"""Test: incremental."""
+
+import pytest
+
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica.incremental import IncrementalParser
+from gibica.ast import dump
+from gibica.exceptions import LexicalError, SyntaxError
+
+
+SOURCE = """\
+# Declarations
+let a = 1;
+let mut b = 2.5;
+
+def f(mut n) {
+    if n <= 1 { return n; }
+    return f(n - 1) + f(n - 2);
+}
+
+while a < 10 {
+    a = a + 1;
+}
+if a == 10 { b = f(a); }
+print(a, b);
+"""
+
+
+def parse(raw):
+    """Return the AST of a raw input."""
+    return Parser(Lexer(raw)).parse()
+
+
+def edit(raw, target, inserted, occurrence=0):
+    """Return the edit replacing the nth occurrence of `target` by `inserted`."""
+    offset = -1
+    for _ in range(occurrence + 1):
+        offset = raw.index(target, offset + 1)
+    return offset, len(target), inserted
+
+
+@pytest.mark.parametrize(
+    'target, inserted, occurrence',
+    [
+        ('1', '42', 0),
+        ('1', '10', 2),
+        ('a', 'abc', 1),
+        ('let a', 'let   a', 0),
+        ('# Declarations', '', 0),
+        ('# Declarations', '#', 0),
+        ('# Declarations\n', 'let c = 3;', 0),
+        ('let', '# let', 1),
+        ('n - 1', 'n - 1 * 2', 0),
+        (' { return n; }', ' { return n; } else { return 0; }', 0),
+        (' { b = f(a); }', ' { b = f(a); } else { b = 0.5; }', 0),
+        ('a = a + 1;\n}', 'a = a + 1;\n}\nlet d = a;', 0),
+        ('print(a, b);', '', 0),
+        ('print(a, b);\n', 'print(a, b); print(b);', 0),
+        ('while a < 10 {\n    a = a + 1;\n}\n', '', 0),
+        ('1', '1.', 1),
+        ('f', 'fi', 1),
+        ('mut b', 'mutb', 0),
+        ('\n', ' ', 5),
+    ],
+)
+def test_edit(target, inserted, occurrence):
+    """Test that an edit gives the same AST as a full parse."""
+    parser = IncrementalParser(SOURCE)
+    assert dump(parser.tree) == dump(parse(SOURCE))
+
+    tree = parser.edit(*edit(SOURCE, target, inserted, occurrence))
+    raw = parser.raw
+    assert raw == SOURCE.replace(target, '\0', occurrence + 1).replace(
+        '\0', target, occurrence
+    ).replace('\0', inserted)
+    assert dump(tree) == dump(parse(raw))
+
+
+def test_successive_edits():
+    """Test a sequence of edits, each one applied to the previous AST."""
+    parser = IncrementalParser('')
+    raw = ''
+    for inserted in ['let a = 1;', '\nlet b = a;', '\nprint(a + b);', '\n']:
+        parser.edit(len(raw), 0, inserted)
+        raw += inserted
+        assert dump(parser.tree) == dump(parse(raw))
+
+    parser.edit(raw.index('a + b'), len('a'), '2 * a')
+    raw = raw.replace('a + b', '2 * a + b')
+    assert dump(parser.tree) == dump(parse(raw))
+
+
+@pytest.mark.parametrize(
+    'target, inserted, exception, message',
+    [
+        ('1;', '1 $;', LexicalError, 'Invalid character `$` at line 2, column 11.'),
+        (
+            'a = 1;',
+            'a = ;',
+            SyntaxError,
+            'Unable to process `Token(Nature.SEMI, ";")` at line 2, column 9.',
+        ),
+    ],
+)
+def test_errors(target, inserted, exception, message):
+    """Test that an erroneous edit raises the error of a full parse."""
+    parser = IncrementalParser(SOURCE)
+    with pytest.raises(exception) as excinfo:
+        parser.edit(*edit(SOURCE, target, inserted))
+    assert excinfo.value.args[0] == message
+
+    # The next edit fixes the raw input
+    offset = SOURCE.index(target)
+    parser.edit(offset, len(inserted), target)
+    assert parser.raw == SOURCE
+    assert dump(parser.tree) == dump(parse(SOURCE))
@@ -0,0 +1,356 @@
+"""Test: lexer."""
+
+import io
+import re
+import pytest
+
+from gibica.lexer import Lexer
+from gibica.tokens import Token, Nature, RESERVED_KEYWORDS
+from gibica.exceptions import LexicalError
+
+
+class CharacterLexer(object):
+    """Character-at-a-time lexical analyser, used as the reference implementation."""
+
+    def __init__(self, raw):
+        """Initialization of `CharacterLexer` class."""
+        self.raw = raw if raw != '' else '\n'
+        self.cursor = 0
+        self.char = self.raw[self.cursor]
+
+    def advance(self):
+        """Increment the cursor position."""
+        self.cursor += 1
+        if self.cursor >= len(self.raw):
+            self.char = None
+        else:
+            self.char = self.raw[self.cursor]
+
+    def peek(self):
+        """Get the next character without moving the cursor."""
+        peek_cursor = self.cursor + 1
+        if peek_cursor >= len(self.raw):
+            return None
+        else:
+            return self.raw[peek_cursor]
+
+    def whitespace(self):
+        """Handle whitespaces."""
+        while self.char is not None and self.char.isspace():
+            self.advance()
+
+    def comment(self):
+        """Handle comments."""
+        while self.char is not None and self.char != '\n':
+            self.advance()
+
+    def number(self):
+        """Return a multidigit int or float number."""
+        number = ''
+        while self.char is not None and self.char.isdigit():
+            number += self.char
+            self.advance()
+
+        if self.char == '.':
+            number += self.char
+            self.advance()
+
+            while self.char is not None and self.char.isdigit():
+                number += self.char
+                self.advance()
+
+            token = Token(Nature.FLOAT_NUMBER, number)
+
+        else:
+            token = Token(Nature.INT_NUMBER, number)
+
+        return token
+
+    def _id(self):
+        """Handle identifiers and reserverd keywords."""
+        result = ''
+        while self.char is not None and (self.char.isalnum() or self.char == '_'):
+            result += self.char
+            self.advance()
+
+        token = RESERVED_KEYWORDS.get(result, Token(Nature.ID, result))
+        return token
+
+    def next_token(self):
+        """Lexical analyser of the raw input."""
+        while self.char is not None:
+
+            if self.char.isspace():
+                # The current character is a whitespace
+                self.whitespace()
+                continue
+
+            elif self.char == '#':
+                # The current character is `#`
+                self.advance()
+                self.comment()
+                continue
+
+            elif self.char.isalpha() or self.char == '_':
+                # The current character is a letter or `_`
+                return self._id()
+
+            elif self.char == ';':
+                # The current character is `;`
+                self.advance()
+                return Token(Nature.SEMI, ';')
+
+            elif self.char == ',':
+                # The current character is `,`
+                self.advance()
+                return Token(Nature.COMMA, ';')
+
+            elif self.char.isdigit():
+                # The current character is a number
+                return self.number()
+
+            elif self.char == '=' and self.peek() == '=':
+                # The current character is `==`
+                self.advance()
+                self.advance()
+                return Token(Nature.EQ, '==')
+
+            elif self.char == '!' and self.peek() == '=':
+                # The current character is `!=`
+                self.advance()
+                self.advance()
+                return Token(Nature.NE, '!=')
+
+            elif self.char == '<' and self.peek() == '=':
+                # The current character is `<=`
+                self.advance()
+                self.advance()
+                return Token(Nature.LE, '<=')
+
+            elif self.char == '>' and self.peek() == '=':
+                # The current character is `>=`
+                self.advance()
+                self.advance()
+                return Token(Nature.GE, '>=')
+
+            elif self.char == '<':
+                # The current character is `<`
+                self.advance()
+                return Token(Nature.LT, '<')
+
+            elif self.char == '>':
+                # The current character is `>`
+                self.advance()
+                return Token(Nature.GT, '>')
+
+            elif self.char == '=':
+                # The current character is `=`
+                self.advance()
+                return Token(Nature.ASSIGN, '=')
+
+            elif self.char == '+':
+                # The current character is `+`
+                self.advance()
+                return Token(Nature.PLUS, '+')
+
+            elif self.char == '-':
+                # The current character is `-`
+                self.advance()
+                return Token(Nature.MINUS, '-')
+
+            elif self.char == '*':
+                # The current character is `*`
+                self.advance()
+                return Token(Nature.MUL, '*')
+
+            elif self.char == '/' and self.peek() == '/':
+                # The current character is `//`
+                self.advance()
+                self.advance()
+                return Token(Nature.INT_DIV, '//')
+
+            elif self.char == '/':
+                # The current character is `/`
+                self.advance()
+                return Token(Nature.DIV, '/')
+
+            elif self.char == '(':
+                # The current character is `(`
+                self.advance()
+                return Token(Nature.LPAREN, '(')
+
+            elif self.char == ')':
+                # The current character is `)`
+                self.advance()
+                return Token(Nature.RPAREN, ')')
+
+            elif self.char == '{':
+                # The current character is `{`
+                self.advance()
+                return Token(Nature.LBRACKET, '{')
+
+            elif self.char == '}':
+                # The current character is `}`
+                self.advance()
+                return Token(Nature.RBRACKET, '}')
+
+            else:
+                # The current character is unknown
+                raise LexicalError(f"Invalid character `{self.char}`.")
+
+        # End of raw input
+        return Token(Nature.EOF, None)
+
+
+def tokenize(lexer):
+    """Return the `(nature, value)` stream of a lexer, or the error it raises."""
+    stream = []
+    try:
+        while True:
+            token = lexer.next_token()
+            stream.append((token.nature, token.value))
+            if token.nature == Nature.EOF:
+                return stream
+    except LexicalError as error:
+        return stream + [re.sub(r' at line \d+, column \d+', '', str(error))]
+
+
+SOURCES = [
+    '',
+    '   \n\t ',
+    '# Only a comment',
+    'let a = 1; # This is a comment\n',
+    'let mut a = 2.; a = a // 3.25 / 1.0 * -4 + +5 - 6;',
+    'def f(a, mut b) { return a <= b and a >= b or not a != b; }',
+    'if a==b{c=1;}else if a<b {c=2;} else {c=3;}',
+    'while i>0{i=i-1;}',
+    'let true_ = true; let falsey = false; let _1 = __a2_;',
+    'let a = 1.2.3;',
+    'let a=2!2;',
+    'let a=2$2;',
+    'let a = 1 ! = 2;',
+    'let été = 4; let ü_1ü = été;',
+    'let _é = 4; let __é_1 = _é; let _\xa0= 1;',
+    'let a = ١٢٣ + 1²;',
+    'let a = 1.²;',
+    'let a = ½;',
+    'let a =　1;',
+    'let a = 1;\n#\n#}\nlet b = 2;#',
+    'a' * 100 + ' = ' + '9' * 100 + ';',
+]
+
+
+@pytest.mark.parametrize('raw', SOURCES)
+def test_same_stream_as_character_lexer(raw):
+    """Test that the lexer matches the character-at-a-time reference."""
+    assert tokenize(Lexer(raw)) == tokenize(CharacterLexer(raw))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64])
+@pytest.mark.parametrize('raw', SOURCES)
+def test_same_stream_by_chunks(raw, chunk_size):
+    """Test that a stream read by chunks gives the same tokens as the whole input."""
+    stream = io.StringIO(raw)
+    assert tokenize(Lexer(stream, chunk_size=chunk_size)) == tokenize(Lexer(raw))
+
+
+@pytest.mark.parametrize('raw', SOURCES)
+def test_same_stream_from_bytes(raw):
+    """Test that UTF-8 encoded bytes give the same tokens as the decoded input."""
+    assert tokenize(Lexer(raw.encode())) == tokenize(Lexer(raw))
+
+
+@pytest.mark.parametrize(
+    'raw, expected',
+    [
+        (
+            'let mut a = 1.5;',
+            [
+                (Nature.LET, 'let'),
+                (Nature.MUT, 'mut'),
+                (Nature.ID, 'a'),
+                (Nature.ASSIGN, '='),
+                (Nature.FLOAT_NUMBER, '1.5'),
+                (Nature.SEMI, ';'),
+                (Nature.EOF, None),
+            ],
+        ),
+        (
+            'f(a,b)//2',
+            [
+                (Nature.ID, 'f'),
+                (Nature.LPAREN, '('),
+                (Nature.ID, 'a'),
+                (Nature.COMMA, ';'),
+                (Nature.ID, 'b'),
+                (Nature.RPAREN, ')'),
+                (Nature.INT_DIV, '//'),
+                (Nature.INT_NUMBER, '2'),
+                (Nature.EOF, None),
+            ],
+        ),
+    ],
+)
+def test_token_stream(raw, expected):
+    """Test the token stream of simple inputs."""
+    assert tokenize(Lexer(raw)) == expected
+
+
+@pytest.mark.parametrize('raw', ['_é_1 _\xa0', b'_\xc3\xa9_1 _\xc2\xa0'])
+def test_underscore_identifier(raw):
+    """Test the identifiers starting with an underscore and a non-ASCII letter."""
+    assert tokenize(Lexer(raw)) == [
+        (Nature.ID, '_é_1'),
+        (Nature.ID, '_'),
+        (Nature.EOF, None),
+    ]
+
+
+@pytest.mark.parametrize('raw', ['let a = 2 $ 2;', 'let a = ½;', 'a = 1 ! 2;'])
+def test_invalid_character(raw):
+    """Test an invalid character."""
+    lexer = Lexer(raw)
+    with pytest.raises(LexicalError):
+        while lexer.next_token().nature != Nature.EOF:
+            pass
+
+
+@pytest.mark.parametrize(
+    'raw', ['a + a; a + a;', '1.5 * 1.5; 1.5 * 1.5;', 'été - 1; été - 1;']
+)
+def test_shared_tokens(raw):
+    """Test that all the occurrences of a lexeme share the same token."""
+    lexer = Lexer(raw)
+    first = [lexer.next_token() for _ in range(4)]
+    second = [lexer.next_token() for _ in range(4)]
+    assert all(a is b for a, b in zip(first, second))
+    assert not hasattr(first[0], '__dict__')
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 64])
+@pytest.mark.parametrize(
+    'raw', ['let a = 1 ;\n\nlet b=a # c\n  def f ( ) { return 1 ; }\n', 'é\n é\n\n']
+)
+def test_positions(raw, chunk_size):
+    """Test the offset, line and column of the tokens."""
+    lexer = Lexer(io.StringIO(raw), chunk_size=chunk_size)
+    positions = []
+    while lexer.next_token().nature != Nature.EOF:
+        positions.append(lexer.offset)
+    words = re.finditer(r'#[^\n]*|(\w+|\S)', raw)
+    assert positions == [word.start() for word in words if word.group(1)]
+
+    for offset in reversed(positions):
+        line = raw.count('\n', 0, offset) + 1
+        column = offset - raw.rfind('\n', 0, offset)
+        assert lexer.lines.position(offset) == (line, column)
+
+
+@pytest.mark.parametrize('raw', ['let ééé = 1 + ;', 'é\n ü ½\nlet a€ = 😀;'])
+def test_binary_positions(raw):
+    """Test that the columns of a binary input are counted in characters."""
+    lexer, binary_lexer = Lexer(raw), Lexer(raw.encode())
+    for char_offset in range(len(raw)):
+        offset = len(raw[:char_offset].encode())
+        expected = lexer.lines.position(char_offset)
+        assert binary_lexer.lines.position(offset) == expected
@@ -0,0 +1,130 @@
+"""Test: memoization."""
+
+import pytest
+
+from click.testing import CliRunner
+
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica.sementic import SymbolTableBuilder
+from gibica.interpreter import Interpreter
+from gibica.memoization import Memo, pure_functions
+from gibica.entrypoint import main
+from gibica.types import Int, Float, Bool, NoneType
+from gibica.exceptions import ObjectError
+
+
+def parse(raw):
+    """Return the analysed AST of a raw input."""
+    tree = Parser(Lexer(raw)).parse()
+    SymbolTableBuilder(tree).build()
+    return tree
+
+
+@pytest.mark.parametrize(
+    'input, expected',
+    [
+        ('def f(n) { return n * 2; }', {'f'}),
+        ('def f(n) { let mut a = n + 1; a = a * 2; return a + 0; }', {'f'}),
+        ('def f(n) { return g(n) + 1; } def g(n) { return -n; }', {'f', 'g'}),
+        ('def f(n) { if n < 1 { return 1; } return f(n - 1) * n; }', {'f'}),
+        # Built-in functions have side effects
+        ('def f(n) { print(n); return 1; }', set()),
+        ('def f(n) { return g(n) + 1; } def g(n) { print(n); return 1; }', set()),
+        # Values are immutable, the caller can't see the assignments
+        ('def f(mut n) { n = n + 1; return n; }', {'f'}),
+        ('def f(n) { let mut a = n; a = 1; return a or n; }', {'f'}),
+        # Functions passed as arguments are unknown
+        ('def f(g, n) { return g(n) + 1; }', set()),
+    ],
+)
+def test_purity(input, expected):
+    """Test the purity analysis."""
+    functions = pure_functions(parse(input))
+    assert {function.identifier.name for function in functions} == expected
+
+
+def test_memo():
+    """Test the eviction of the least recently used results."""
+    memo = Memo(2)
+    keys = [memo.key([Int(n)]) for n in range(3)]
+    memo.put(keys[0], Int(0))
+    memo.put(keys[1], Float(1.5))
+    assert memo.get(keys[0]).value == 0
+    memo.put(keys[2], Bool(True))
+
+    assert memo.get(keys[1]) is None
+    assert memo.get(keys[0]).value == 0
+    assert memo.get(keys[2]).value is True
+    assert (memo.hits, memo.misses) == (3, 1)
+
+    # Results are immutable, so they are shared
+    assert memo.get(keys[0]) is memo.get(keys[0])
+    with pytest.raises(ObjectError):
+        memo.get(keys[0]).value = 42
+
+    assert memo.key([Int(1), NoneType()]) is None
+    assert memo.key([Int(1)]) != memo.key([Float(1.0)])
+    assert memo.key([Float(0.0)]) != memo.key([Float(-0.0)])
+
+
+@pytest.mark.parametrize(
+    'calls, output',
+    [
+        ('print(f(-0.0), f(0.0));', '-0.0 0.0\n'),
+        ('print(f(0.0), f(-0.0));', '0.0 -0.0\n'),
+    ],
+)
+def test_memoized_signed_zeros(capsys, calls, output):
+    """Test that the results of the zeros of opposite signs are cached apart."""
+    interpreter = Interpreter(parse('def f(x) { return x * 1; } ' + calls), memo_size=8)
+    interpreter.interpret()
+    assert capsys.readouterr().out == output
+
+
+@pytest.mark.parametrize('memo_size', [1, 128])
+def test_memoized_interpreter(capsys, memo_size):
+    """Test that the memoized functions give the same results."""
+    raw = """
+    def fibonacci(n) {
+        if n <= 1 {
+            return 1;
+        }
+        return fibonacci(n - 2) + fibonacci(n - 1);
+    }
+    def show(n) {
+        print(n);
+    }
+    let mut a = fibonacci(15);
+    let b = fibonacci(15);
+    a = 0;
+    show(b);
+    show(b);
+    """
+    interpreter = Interpreter(parse(raw), memo_size=memo_size)
+    interpreter.interpret()
+    assert interpreter.memory['a'] == Int(0)
+    assert interpreter.memory['b'] == Int(987)
+    assert capsys.readouterr().out == '987\n987\n'
+
+    (function, memo), = interpreter.memos.items()
+    assert function.identifier.name == 'fibonacci'
+    assert memo.hits > 0 and len(memo.results) <= memo_size
+
+
+def test_cli_memoize():
+    """Test of the CLI behavior with the memoization."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        with open('script.gbc', 'w') as f:
+            f.write('def f(n) { return n * 2; }\nlet a = f(2) + f(2);\nprint(a);')
+
+        result = runner.invoke(main, ['script.gbc', '--memoize', '--debug'])
+        assert result.exit_code == 0
+        assert result.output.splitlines()[0] == '8'
+        assert result.output.splitlines()[-1] == (
+            "MEMOS: {'f': <hits=1 misses=1 size=1>}"
+        )
+
+        result = runner.invoke(main, ['script.gbc', '--memoize', '--engine', 'vm'])
+        assert result.exit_code == 2
@@ -0,0 +1,41 @@
+"""Test: memory."""
+
+from gibica.memory import Memory
+from gibica.types import Int
+
+
+def test_scopes():
+    """Test that the names declared in a block are released at its end."""
+    memory = Memory(a=Int(1))
+    memory.append_scope()
+    memory['b'] = Int(2)
+    memory['a'] = Int(3)
+
+    memory.append_scope()
+    memory['c'] = Int(4)
+    memory['b'] = Int(5)
+    assert set(memory) == {'a', 'b', 'c'}
+    memory.pop_scope()
+
+    assert memory['c'] is None
+    assert memory['b'] == Int(5)
+    memory.pop_scope()
+
+    # The names of the enclosing scopes keep the values set in the blocks
+    assert memory == Memory(a=Int(3))
+
+
+def test_frames():
+    """Test that the scopes of a frame don't see the other frames."""
+    memory = Memory(a=Int(1))
+    memory.append_scope()
+    memory.append_frame(b=Int(2))
+    memory.append_scope()
+    memory['c'] = Int(3)
+    assert set(memory) == {'b', 'c'}
+    memory.pop_scope()
+    memory.pop_frame()
+
+    memory['d'] = Int(4)
+    memory.pop_scope()
+    assert memory == Memory(a=Int(1))
@@ -0,0 +1,129 @@
+"""Test: optimizer."""
+
+import pytest
+
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica.sementic import SymbolTableBuilder
+from gibica.optimizer import Optimizer
+from gibica.interpreter import Interpreter
+from gibica.ast import BinaryOperation, UnaryOperation, Variable, Constant
+from gibica.types import Int, Float, Bool
+from gibica.tokens import Nature
+from gibica.exceptions import TypeError
+
+
+def optimize(raw):
+    """Return the optimized expression of the declaration of `raw`."""
+    tree = Parser(Lexer(raw)).parse()
+    SymbolTableBuilder(tree).build()
+    return Optimizer(tree).optimize().children[-1].assignment.right
+
+
+@pytest.mark.parametrize(
+    'input, cls, value',
+    [
+        ('let a = 2 * 3 + 1;', Int, 7),
+        ('let a = 2 * 1.5;', Float, 3.0),
+        ('let a = 7 / 7;', Float, 1.0),
+        ('let a = 7 // 2;', Int, 3),
+        ('let a = -(1 - 2);', Int, 1),
+        ('let a = 1 < 2 and not (2.5 == 2);', Bool, True),
+        ('let a = true or 1 + true;', Bool, True),
+        ('let a = -0.0 + 0;', Float, 0.0),
+    ],
+)
+def test_folding(input, cls, value):
+    """Test the folding of the constant expressions."""
+    node = optimize(input)
+    assert isinstance(node, Constant)
+    assert node.cls is cls
+    assert node.value == value and type(node.value) is type(value)
+
+
+@pytest.mark.parametrize(
+    'input',
+    ['let a = 1 / 0;', 'let a = 1 // (2 - 2);', 'let a = 1 + true;', 'let a = not 1;'],
+)
+def test_no_folding_of_errors(input):
+    """Test that the errors are left to be raised at runtime."""
+    node = optimize(input)
+    assert isinstance(node, (BinaryOperation, UnaryOperation))
+
+    tree = Parser(Lexer(input)).parse()
+    with pytest.raises(TypeError):
+        Interpreter(Optimizer(tree).optimize()).interpret()
+
+
+@pytest.mark.parametrize(
+    'input, simplified',
+    [
+        ('let b = 1; let a = b * 1;', True),
+        ('let b = 1; let a = b - 0;', True),
+        ('let b = 1; let a = b * (2 - 1);', True),
+        # `-0.0 + 0` is `0.0`, and the other ones change the type or the error
+        ('let b = 1; let a = b + 0;', False),
+        ('let b = 1; let a = b * 1.0;', False),
+        ('let b = 1; let a = 1 * b;', False),
+        ('let b = 1; let a = b / 1;', False),
+    ],
+)
+def test_identities(input, simplified):
+    """Test the simplification of the identities."""
+    node = optimize(input)
+    if simplified:
+        assert isinstance(node, UnaryOperation) and node.op.nature == Nature.PLUS
+        assert isinstance(node.right, Variable)
+    else:
+        assert isinstance(node, BinaryOperation)
+
+
+@pytest.mark.parametrize(
+    'input',
+    [
+        'let b = 2.5; let a = b * 1;',
+        'let b = -0.0; let a = b - 0; print(a);',
+        'let b = true; let a = false or b;',
+        """
+        let mut i = 0;
+        let mut total = 0;
+        while i < 2 * 5 + 1 {
+            total = total + i * (3 - 2) - 0 + 1.5 * 2;
+            i = i + 1;
+        }
+        print(total, -(-1.5), 10 // 4 * 1.0);
+        """,
+    ],
+)
+def test_same_behavior(capsys, input):
+    """Test that the optimized AST evaluates as the AST."""
+    tree = Parser(Lexer(input)).parse()
+    interpreter = Interpreter(tree)
+    interpreter.interpret()
+    output = capsys.readouterr().out
+
+    tree = Parser(Lexer(input)).parse()
+    optimized = Interpreter(Optimizer(tree).optimize())
+    optimized.interpret()
+    assert optimized.memory == interpreter.memory
+    assert capsys.readouterr().out == output
+
+
+@pytest.mark.parametrize(
+    'input',
+    [
+        'let a = true * 1;',
+        'let a = true; let b = a * 1;',
+        'let a = true; let b = a - 0;',
+    ],
+)
+def test_same_errors(input):
+    """Test that the simplified operations raise the same errors."""
+    tree = Parser(Lexer(input)).parse()
+    with pytest.raises(TypeError) as expected:
+        Interpreter(tree).interpret()
+
+    tree = Parser(Lexer(input)).parse()
+    with pytest.raises(TypeError) as error:
+        Interpreter(Optimizer(tree).optimize()).interpret()
+    assert str(error.value) == str(expected.value)
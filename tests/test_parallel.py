@@ -0,0 +1,101 @@
+"""Test: parallel."""
+
+import pytest
+
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica import parallel
+from gibica.parallel import split, parse
+from gibica.ast import dump
+from gibica.exceptions import LexicalError, SyntaxError
+
+
+SOURCE = """\
+# Statements { with braces; in comments }
+let a = 1; let mut b = 2.5;
+def f(mut n) {
+    if n <= 1 { return n; }
+    return f(n - 1) + f(n - 2);
+}
+if a == 1 {
+    b = f(a);
+}
+# The statement continues
+else if a == 2 { b = 0; } elsewhere = 1;
+while a < 10 { a = a + 1; }
+print(a, b);
+"""
+
+
+def test_split():
+    """Test the pre-scan of the top-level statement ends."""
+    ends = split(SOURCE)
+    statements = [
+        SOURCE[start:end].strip() for start, end in zip([0] + ends, ends)
+    ]
+    assert statements[1:] == [
+        'let mut b = 2.5;',
+        'def f(mut n) {\n    if n <= 1 { return n; }\n'
+        '    return f(n - 1) + f(n - 2);\n}',
+        'if a == 1 {\n    b = f(a);\n}\n# The statement continues\n'
+        'else if a == 2 { b = 0; }',
+        'elsewhere = 1;',
+        'while a < 10 { a = a + 1; }',
+        'print(a, b);',
+    ]
+    assert split(SOURCE.encode()) == [
+        len(SOURCE[:end].encode()) for end in ends
+    ]
+
+
+@pytest.mark.parametrize('raw', [SOURCE, SOURCE.encode(), '', '  # Nothing\n'])
+def test_parse(raw):
+    """Test that a parallel parse gives the same AST as a sequential one."""
+    assert dump(parse(raw, jobs=2)) == dump(Parser(Lexer(raw)).parse())
+
+
+@pytest.mark.parametrize(
+    'raw, ends',
+    [
+        ('let a = [0; 3];\nprint(a);', [15, 25]),
+        ('let a = [[1; 2]; 3]; if a { let b = [1][0]; }', [20, 45]),
+    ],
+)
+def test_split_arrays(raw, ends):
+    """Test that the semicolons of the arrays of copies don't end the statements."""
+    assert split(raw) == ends
+    assert split(raw.encode()) == ends
+
+
+def test_wrong_split(monkeypatch):
+    """Test that a valid input cut inside a statement is parsed sequentially."""
+    monkeypatch.setattr(parallel, 'split', lambda raw: [raw.index('1')])
+    raw = 'let a = 1;\nlet b = 2;\nprint(a);'
+    assert dump(parse(raw, jobs=2)) == dump(Parser(Lexer(raw)).parse())
+
+
+@pytest.mark.parametrize(
+    'raw, exception, message',
+    [
+        (
+            'let a = 1;\nlet b = $;\nlet c = ;',
+            LexicalError,
+            'Invalid character `$` at line 2, column 9.',
+        ),
+        (
+            'let a = 1;\nlet b = ;\nlet c = $;',
+            SyntaxError,
+            'Unable to process `Token(Nature.SEMI, ";")` at line 2, column 9.',
+        ),
+        (
+            'let a = 1; }\nlet b = 2;',
+            SyntaxError,
+            'Unable to process `Token(Nature.RBRACKET, "}")` at line 1, column 12.',
+        ),
+    ],
+)
+def test_errors(raw, exception, message):
+    """Test that a parallel parse raises the first error of the raw input."""
+    with pytest.raises(exception) as excinfo:
+        parse(raw, jobs=2)
+    assert excinfo.value.args[0] == message
@@ -0,0 +1,242 @@
+"""Test: parser."""
+
+import random
+
+import pytest
+
+from gibica.tokens import Nature
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica.ast import BinaryOperation, UnaryOperation, dump
+from gibica.exceptions import SyntaxError, SementicError
+
+
+class RecursiveDescentParser(Parser):
+    """Reference parser descending through one rule per precedence level."""
+
+    def expression(self, precedence=None):
+        """
+        expression: logical_or_expr
+        """
+        return self.logical_or_expr()
+
+    def logical_or_expr(self):
+        """
+        logical_or_expr: logical_and_expr ('or' logical_and_expr)*
+        """
+        offset = self.offset
+        node = self.logical_and_expr()
+
+        while self.token.nature == Nature.OR:
+            token = self.token
+            self._process(Nature.OR)
+
+            node = BinaryOperation(left=node, op=token, right=self.logical_and_expr())
+            self._locate(node, offset)
+
+        return node
+
+    def logical_and_expr(self):
+        """
+        logical_and_expr: logical_not_expr ('and' logical_not_expr)*
+        """
+        offset = self.offset
+        node = self.logical_not_expr()
+
+        while self.token.nature == Nature.AND:
+            token = self.token
+            self._process(Nature.AND)
+
+            node = BinaryOperation(left=node, op=token, right=self.logical_not_expr())
+            self._locate(node, offset)
+
+        return node
+
+    def logical_not_expr(self):
+        """
+        logical_not_expr: 'not' logical_not_expr
+                        | comparison
+        """
+        if self.token.nature == Nature.NOT:
+            token, offset = self.token, self.offset
+            self._process(Nature.NOT)
+            return self._locate(
+                UnaryOperation(op=token, right=self.logical_not_expr()), offset
+            )
+        else:
+            return self.comparison()
+
+    def comparison(self):
+        """
+        comparison: expr (('==' | '!=' | '<=' | '>=' | '<' | '>') expr)*
+        """
+        offset = self.offset
+        node = self.expr()
+
+        while self.token.nature in (
+            Nature.EQ,
+            Nature.NE,
+            Nature.LE,
+            Nature.GE,
+            Nature.LT,
+            Nature.GT,
+        ):
+            token = self.token
+            if token.nature == Nature.EQ:
+                self._process(Nature.EQ)
+            elif token.nature == Nature.NE:
+                self._process(Nature.NE)
+            elif token.nature == Nature.LE:
+                self._process(Nature.LE)
+            elif token.nature == Nature.GE:
+                self._process(Nature.GE)
+            elif token.nature == Nature.LT:
+                self._process(Nature.LT)
+            elif token.nature == Nature.GT:
+                self._process(Nature.GT)
+            else:
+                self.error()
+
+            node = BinaryOperation(left=node, op=token, right=self.expr())
+            self._locate(node, offset)
+
+        return node
+
+    def expr(self):
+        """
+        expr: term (('+' | '-') term)*
+        """
+        offset = self.offset
+        node = self.term()
+
+        while self.token.nature in (Nature.PLUS, Nature.MINUS):
+            token = self.token
+            if token.nature == Nature.PLUS:
+                self._process(Nature.PLUS)
+            elif token.nature == Nature.MINUS:
+                self._process(Nature.MINUS)
+            else:
+                self._error()
+
+            node = BinaryOperation(left=node, op=token, right=self.term())
+            self._locate(node, offset)
+
+        return node
+
+    def term(self):
+        """
+        term: atom (('*' | '/' | '//') atom)*
+        """
+        offset = self.offset
+        node = self.atom()
+
+        while self.token.nature in (Nature.MUL, Nature.DIV, Nature.INT_DIV):
+            token = self.token
+            if token.nature == Nature.MUL:
+                self._process(Nature.MUL)
+            elif token.nature == Nature.DIV:
+                self._process(Nature.DIV)
+            elif token.nature == Nature.INT_DIV:
+                self._process(Nature.INT_DIV)
+            else:
+                self._error()
+
+            node = BinaryOperation(left=node, op=token, right=self.atom())
+            self._locate(node, offset)
+
+        return node
+
+
+def parse(raw, parser_class=Parser):
+    """Return the AST of a raw input."""
+    return parser_class(Lexer(raw)).parse()
+
+
+def test_node_offsets():
+    """Test the offsets set on the nodes."""
+    raw = 'let a = 1;\ndef f(mut n) {\n  while not n { return -(n + 2.0) * f(n); }\n}'
+    declaration, function = parse(raw).children
+
+    assert declaration.offset == raw.index('let')
+    assert declaration.assignment.offset == raw.index('a =')
+    assert declaration.assignment.right.offset == raw.index('1;')
+
+    assert function.offset == raw.index('def')
+    assert function.identifier.offset == raw.index('f(')
+    assert function.parameters[0].offset == raw.index('mut')
+    assert function.body.offset == raw.index('{')
+
+    loop = function.body.children[0]
+    assert loop.offset == raw.index('while')
+    assert loop.condition.offset == raw.index('not')
+    assert loop.compound.offset == raw.index('{ return')
+
+    statement = loop.compound.children[0]
+    assert statement.offset == raw.index('return')
+    assert statement.expression.offset == raw.index('-(')
+    assert statement.expression.left.right.offset == raw.index('n + 2.0')
+    assert statement.expression.left.right.right.offset == raw.index('2.0')
+    assert statement.expression.right.offset == raw.index('f(n)')
+
+
+@pytest.mark.parametrize(
+    'input, error, message',
+    [
+        (
+            'let a = 1;\nlet b = a +;',
+            SyntaxError,
+            'Unable to process `Token(Nature.SEMI, ";")` at line 2, column 12.',
+        ),
+        ('let a = 1;\n  a = 2;', SementicError, 'at line 2, column 3.'),
+        ('def f(n) {}\n\ndef f(n) {}', SementicError, 'at line 3, column 1.'),
+        ('let a = b;', SementicError, 'at line 1, column 9.'),
+        ('let a = f(1);', SementicError, 'at line 1, column 9.'),
+    ],
+)
+def test_error_positions(evaluate, input, error, message):
+    """Test that the errors give the position of the faulty token or node."""
+    with pytest.raises(error) as info:
+        evaluate(input)
+    assert str(info.value).endswith(message)
+
+
+OPERANDS = ['a', 'mut b', '1', '2.5', 'true', 'false', 'f(a, 1)', 'g()']
+OPERATORS = ['or', 'and', '==', '!=', '<=', '>=', '<', '>', '+', '-', '*', '/', '//']
+
+
+def expression(generator, depth=0):
+    """Return a random, possibly invalid, expression."""
+    choice = generator.random()
+    if depth > 4 or choice < 0.3:
+        return generator.choice(OPERANDS)
+    elif choice < 0.4:
+        prefix = generator.choice(['not ', '-', '+', 'not not ', '- not '])
+        return prefix + expression(generator, depth + 1)
+    elif choice < 0.5:
+        return f"({expression(generator, depth + 1)})"
+    elif choice < 0.52:
+        return generator.choice(['', '(', ')', 'not', '=='])
+    left, right = expression(generator, depth + 1), expression(generator, depth + 1)
+    return f"{left} {generator.choice(OPERATORS)} {right}"
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_precedence_climbing(seed):
+    """Test that expressions give the same AST or error as the reference parser."""
+    generator = random.Random(seed)
+    for _ in range(200):
+        raw = f"let x = {expression(generator)};\nif {expression(generator)} {{}}"
+
+        results = []
+        for parser_class in (Parser, RecursiveDescentParser):
+            try:
+                results.append(dump(parse(raw, parser_class)))
+            except SyntaxError as error:
+                results.append(str(error))
+        assert results[0] == results[1], raw
+
+
+def test_deep_expression():
+    """Test that long operator chains don't hit the recursion limit."""
+    raw = 'let x = 1' + ' + 1' * 5000 + ' and not 1' * 5000 + ';'
+    assert parse(raw).children[0].assignment.right.op.value == 'and'
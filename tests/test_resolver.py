@@ -0,0 +1,68 @@
+"""Test: resolver."""
+
+import pytest
+
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica.sementic import SymbolTableBuilder
+from gibica.resolver import Resolver
+from gibica.ast import walk, Identifier, Compound, FunctionDeclaration
+
+
+def resolve(raw):
+    """Return the resolved AST of a raw input."""
+    tree = Parser(Lexer(raw)).parse()
+    SymbolTableBuilder(tree).build()
+    return Resolver(tree).resolve()
+
+
+@pytest.mark.parametrize(
+    'input, names',
+    [
+        ('let a = 1; let mut b = a; b = a + b;', ('a', 'b')),
+        ('let a = 1; if a == 1 { let b = a; } let c = 2;', ('a', 'b', 'c')),
+        ('def f(n) { return n; } let a = f(1);', ('a',)),
+    ],
+)
+def test_program_frame(input, names):
+    """Test the slots of the frame of the program."""
+    tree = resolve(input)
+    assert tree.names == names
+
+    for node in walk(tree):
+        if isinstance(node, Identifier) and node.name in names:
+            assert node.slot == names.index(node.name)
+
+
+def test_function_frame():
+    """Test the slots of the frame of a function and of its blocks."""
+    tree = resolve(
+        """
+        def f(n, g) {
+            let mut i = 0;
+            while i < n {
+                let j = i + 1;
+                i = i + j;
+            }
+            return print(i, g);
+        }
+        def double(n) {
+            return n * 2;
+        }
+        let a = f(3, double);
+        """
+    )
+    function = tree.children[0]
+    assert isinstance(function, FunctionDeclaration)
+    assert function.names == ('n', 'g', 'i', 'j')
+
+    slots = {
+        node.name: node.slot
+        for node in walk(function.body)
+        if isinstance(node, Identifier)
+    }
+    # Functions are looked up by name, except the ones passed as arguments
+    assert slots == {'n': 0, 'g': 1, 'i': 2, 'j': 3, 'print': None}
+
+    compounds = [node for node in walk(function.body) if isinstance(node, Compound)]
+    assert [compound.declared for compound in compounds] == [(3,)]
@@ -0,0 +1,72 @@
+"""Test: transpiler."""
+
+import pytest
+
+from gibica.lexer import Lexer
+from gibica.parser import Parser
+from gibica.transpiler import Transpiler, PythonInterpreter
+
+
+def test_transpile():
+    """Test the source code of a function."""
+    input = """
+    def double(n) {
+        let two = 2;
+        return n * two;
+    }
+    let a = double(1.5) + 1;
+    """
+    tree = Parser(Lexer(input)).parse()
+    assert Transpiler(tree).transpile() == (
+        'def f7(v0):\n'
+        '    v1 = UNDEFINED\n'
+        '    v1 = 2\n'
+        '    return (v0 * v1 if type(v0) in NUMBERS and type(v1) in NUMBERS '
+        'else mul(v0, v1))\n'
+        '\n'
+        'def program():\n'
+        '    v0 = UNDEFINED\n'
+        '    v0 = add(f7(1.5), 1)\n'
+        '    return [v0]\n'
+    )
+
+
+def test_long_chain(run, capsys):
+    """Test that the source code grows linearly with a chain of operations."""
+    input = f"let a = 1; print({' + '.join(['a'] * 250)});"
+    source = Transpiler(Parser(Lexer(input)).parse()).transpile()
+    assert len(source) < 10 * len(input)
+
+    run(input, PythonInterpreter)
+    assert capsys.readouterr().out == '250\n'
+
+
+HUGE = '1' + '0' * 400 + '.0'
+
+
+@pytest.mark.parametrize(
+    'input, output',
+    [
+        (f'let a = {HUGE}; print(a, -a);', 'inf -inf\n'),
+        (f'let a = {HUGE}; print(a - a);', 'nan\n'),
+        (f'print({HUGE} - {HUGE}, -{HUGE});', 'nan -inf\n'),
+    ],
+)
+def test_infinite_floats(evaluate, capsys, input, output):
+    """Test the infinite and NaN floats, which have no Python literal."""
+    evaluate(input)
+    assert capsys.readouterr().out == output
+
+
+def test_nested_loops(evaluate, capsys):
+    """Test loops nested deeper than Python can compile."""
+    loops = [f'let mut i{depth} = 0; while i{depth} < 1 {{' for depth in range(21)]
+    input = (
+        'let mut total = 0;'
+        + ''.join(loops)
+        + 'total = total + 1;'
+        + ''.join(f'i{depth} = i{depth} + 1; }}' for depth in reversed(range(21)))
+        + 'print(total);'
+    )
+    evaluate(input)
+    assert capsys.readouterr().out == '1\n'
@@ -0,0 +1,63 @@
+"""Test: types."""
+
+import pickle
+
+import pytest
+
+from gibica.types import Int, Float, Bool, NoneType, Function, cache_small_ints
+from gibica.exceptions import ObjectError, TypeError
+
+
+@pytest.mark.parametrize(
+    'left, right, shared',
+    [
+        (Int(1), Int(1), True),
+        (Int(-5), Int(-5.7), True),
+        (Int(256), Int(256), True),
+        (Int(257), Int(257), False),
+        (Bool(True), Bool(1), True),
+        (Bool(False), Bool(0), True),
+        (NoneType(), NoneType(), True),
+        (Float(1.0), Float(1.0), False),
+    ],
+)
+def test_shared_objects(left, right, shared):
+    """Test the objects shared by the values."""
+    assert (left is right) is shared
+
+
+def test_small_ints_range():
+    """Test the change of the range of the shared integers."""
+    cache_small_ints(0, 1000)
+    try:
+        assert Int(1000) is Int(1000)
+        assert Int(-1) is not Int(-1)
+    finally:
+        cache_small_ints()
+    assert Int(1000) is not Int(1000)
+
+
+@pytest.mark.parametrize(
+    'obj, exception',
+    [
+        (Int(1), ObjectError),
+        (Float(1.5), ObjectError),
+        (Bool(True), ObjectError),
+        (NoneType(), TypeError),
+    ],
+)
+def test_immutable(obj, exception):
+    """Test that the values can't be changed."""
+    with pytest.raises(exception):
+        obj.value = 2
+
+
+@pytest.mark.parametrize(
+    'obj', [Int(1), Int(1000), Float(1.5), Bool(False), NoneType(), Function('f')]
+)
+def test_pickle(obj):
+    """Test that the objects are pickled by value."""
+    copy = pickle.loads(pickle.dumps(obj))
+    assert type(copy) is type(obj) and str(copy) == str(obj)
+    with pytest.raises(ObjectError):
+        obj.missing
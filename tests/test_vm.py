@@ -0,0 +1,121 @@
+"""Test: virtual machine."""
+
+import pytest
+
+from gibica.interpreter import Interpreter
+from gibica.vm import VirtualMachine
+from gibica.types import Int, Bool, Float, Function
+
+
+def test_deep_recursion(run):
+    """Test that the calls don't recurse in Python."""
+    input = """
+    def depth(n) {
+        if n == 0 {
+            return 0;
+        }
+        return depth(n - 1) + 1;
+    }
+    let result = depth(10000);
+    """
+    assert run(input, VirtualMachine).memory['result'] == Int(10000)
+
+
+@pytest.mark.parametrize('engine', [Interpreter, VirtualMachine])
+def test_tail_calls(run, engine):
+    """Test that the calls in tail position don't grow the stacks."""
+    input = """
+    def count(n, total) {
+        if n == 0 {
+            return total;
+        }
+        return step(n, total + 1);
+    }
+    def step(n, total) {
+        return count(n - 1, total);
+    }
+    let result = count(20000, 0);
+    """
+    assert run(input, engine).memory['result'] == Int(20000)
+
+
+def test_constants_pool(run):
+    """Test that the constants pool holds each constant once, by type and value."""
+    input = 'def f(n) { return n + 1 + 1.0; } let mut a = true;'
+    input += 'a = f(1) + 1.0 + 2; a = false;' * 500
+    instance = run(input, VirtualMachine)
+
+    assert [str(constant) for constant in instance.codes['f'].constants] == ['1', '1.0']
+    assert [type(constant) for constant in instance.program.constants] == [
+        Bool,
+        Function,
+        Int,
+        Float,
+        Int,
+        Bool,
+    ]
+
+
+@pytest.mark.parametrize(
+    'input, output',
+    [
+        ('let a = -0.0; let b = 0.0; print(a, b);', '-0.0 0.0\n'),
+        ('let b = 0.0; let a = -0.0; print(a, b);', '-0.0 0.0\n'),
+        ('let x = -0.0; print(x + 0.0, x + -0.0, -0.0);', '0.0 -0.0 -0.0\n'),
+    ],
+)
+def test_signed_zeros(run, capsys, input, output):
+    """Test that the constants pool tells the zeros of opposite signs apart."""
+    run(input, VirtualMachine)
+    assert capsys.readouterr().out == output
+
+
+def test_disassemble_tail_call(run):
+    """Test the compilation of a call in tail position."""
+    input = 'def f(n) { return g(n); } def g(n) { return f(n) + 1; }'
+    disassembly = run(input, VirtualMachine).disassemble()
+    assert disassembly.startswith(
+        '<code f>:\n'
+        '     0 LOAD_FUNCTION        0 (g)\n'
+        '     2 LOAD_FAST            0 (n)\n'
+        '     4 TAIL_CALL            1\n'
+        '     6 RETURN_VALUE\n'
+    )
+    assert 'CALL_FUNCTION        1\n     6 LOAD_CONST' in disassembly
+
+
+def test_disassemble(run):
+    """Test the disassembly of the bytecode."""
+    input = """
+    def double(n) {
+        return n * 2;
+    }
+    let mut a = 1;
+    while a < 10 {
+        a = double(a);
+    }
+    """
+    assert run(input, VirtualMachine).disassemble() == (
+        '<code double>:\n'
+        '     0 LOAD_FAST            0 (n)\n'
+        '     2 LOAD_CONST           0 (2)\n'
+        '     4 BINARY_MULTIPLY\n'
+        '     6 RETURN_VALUE\n'
+        '     8 LOAD_NONE\n'
+        '    10 RETURN_VALUE\n'
+        '\n'
+        '<code <program>>:\n'
+        '     0 LOAD_CONST           0 (1)\n'
+        '     2 STORE_FAST           0 (a)\n'
+        '     4 LOAD_FAST            0 (a)\n'
+        '     6 LOAD_CONST           1 (10)\n'
+        '     8 COMPARE_LT\n'
+        '    10 POP_JUMP_IF_FALSE    22\n'
+        '    12 LOAD_FUNCTION        2 (double)\n'
+        '    14 LOAD_FAST            0 (a)\n'
+        '    16 CALL_FUNCTION        1\n'
+        '    18 STORE_FAST           0 (a)\n'
+        '    20 JUMP                 4\n'
+        '    22 LOAD_NONE\n'
+        '    24 RETURN_VALUE'
+    )